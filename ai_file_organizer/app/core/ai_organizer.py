@@ -9,6 +9,7 @@ Core Principle: The LLM must never directly modify files.
 - App executes
 """
 
+import hashlib
 import json
 import logging
 import os
@@ -17,6 +18,8 @@ from typing import Dict, List, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+OPENAI_PLAN_MODEL = "gpt-4o-mini"
+
 # ─────────────────────────────────────────────────────────────
 # PROMPTS
 # ─────────────────────────────────────────────────────────────
@@ -151,6 +154,21 @@ def build_file_summary(files: List[Dict[str, Any]], max_files: int = 300) -> str
     return summary
 
 
+def _files_prefix(files: List[Dict[str, Any]]) -> str:
+    """
+    Opening block shared by plan and refinement prompts.
+    
+    Providers with automatic prompt caching (OpenAI) reuse work for an
+    identical message prefix, so the large file list comes first and is
+    byte-identical across a plan and all of its refinements; the
+    instruction/feedback that changes between calls follows it.
+    """
+    return f"""Files available ({len(files)} total):
+{build_file_summary(files)}
+
+"""
+
+
 # ─────────────────────────────────────────────────────────────
 # LLM REQUEST
 # ─────────────────────────────────────────────────────────────
@@ -158,30 +176,29 @@ def build_file_summary(files: List[Dict[str, Any]], max_files: int = 300) -> str
 def request_organization_plan(
     user_instruction: str,
     files: List[Dict[str, Any]],
+    cached_only: bool = False,
+    use_cache: bool = True,
 ) -> Optional[Dict[str, Any]]:
     """
     Send user instruction + file metadata to LLM.
     Returns the proposed plan as a dict, or None on failure.
+    With cached_only, only the plan cache is consulted (None on a miss);
+    use_cache=False skips the lookup and asks for a fresh plan.
     
     The LLM acts only as a planner - it never executes anything.
     """
-    from .settings import settings
-    
     if not files:
         logger.warning("No files provided for organization")
         return None
     
-    file_summary = build_file_summary(files)
-    
     # Detect auto-organize mode vs specific instruction mode
     is_auto_organize = user_instruction.startswith("[AUTO-ORGANIZE]")
     
+    # PROMPT-CACHE PREFIX — DO NOT REORDER: the file list leads every message
+    # (see _files_prefix); the instruction goes after it
     if is_auto_organize:
         # Auto-organize: MUST include ALL files
-        user_message = f"""User instruction: "{user_instruction}"
-
-Files to organize ({len(files)} total):
-{file_summary}
+        user_message = _files_prefix(files) + f"""User instruction: "{user_instruction}"
 
 CRITICAL OVERRIDE FOR AUTO-ORGANIZE:
 - You MUST include EVERY file_id in your response
@@ -193,10 +210,7 @@ CRITICAL OVERRIDE FOR AUTO-ORGANIZE:
 Propose an organization plan. Return JSON only."""
     else:
         # Specific instruction: only organize matching files
-        user_message = f"""User instruction: "{user_instruction}"
-
-Files available ({len(files)} total):
-{file_summary}
+        user_message = _files_prefix(files) + f"""User instruction: "{user_instruction}"
 
 IMPORTANT - SPECIFIC INSTRUCTION MODE:
 - ONLY include files that EXACTLY match what the user asked for
@@ -207,15 +221,7 @@ IMPORTANT - SPECIFIC INSTRUCTION MODE:
 
 Propose an organization plan. Return JSON only."""
 
-    provider = settings.ai_provider
-    
-    if provider == 'openai':
-        return _request_openai(user_message)
-    elif provider == 'local':
-        return _request_ollama(user_message)
-    else:
-        logger.warning("No AI provider configured")
-        return None
+    return _request_plan(user_message, cached_only, use_cache)
 
 
 def request_plan_refinement(
@@ -223,45 +229,75 @@ def request_plan_refinement(
     current_plan: Dict[str, Any],
     feedback: str,
     files: List[Dict[str, Any]],
+    cached_only: bool = False,
 ) -> Optional[Dict[str, Any]]:
     """
     Refine an existing plan based on user feedback.
     Returns the updated plan as a dict, or None on failure.
+    With cached_only, only the plan cache is consulted (None on a miss).
     """
-    from .settings import settings
-    
     if not current_plan:
         logger.warning("No plan to refine")
         return None
     
-    file_summary = build_file_summary(files)
-    
     # Format current plan for context
     current_plan_json = json.dumps(current_plan, indent=2)
     
-    user_message = f"""Original instruction: "{original_instruction}"
+    # PROMPT-CACHE PREFIX — DO NOT REORDER: same file-list head as the original request
+    user_message = _files_prefix(files) + f"""Original instruction: "{original_instruction}"
 
 Current plan:
 {current_plan_json}
 
 User feedback: "{feedback}"
 
-Files available ({len(files)} total):
-{file_summary}
-
 Based on the user feedback, provide an UPDATED organization plan.
 Apply the user's requested changes to the current plan.
 Return the complete updated plan as JSON only."""
 
-    provider = settings.ai_provider
+    return _request_plan(user_message, cached_only)
+
+
+def _request_plan(user_message: str, cached_only: bool = False, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+    """
+    Send a plan prompt to the configured provider.
     
+    Replies are cached by a hash of the exact prompt and model, so asking the
+    same thing about the same files again skips the round-trip. Only parsed
+    plans are cached; failures always go back to the provider. cached_only
+    stops after the lookup, so the UI can check for a hit without a worker.
+    use_cache=False skips the lookup; the fresh plan replaces the cached one.
+    """
+    from .settings import settings
+    from .database import file_index
+    
+    provider = settings.ai_provider
     if provider == 'openai':
-        return _request_openai(user_message)
+        model, request = OPENAI_PLAN_MODEL, _request_openai
     elif provider == 'local':
-        return _request_ollama(user_message)
+        from .vision import get_local_model
+        model, request = get_local_model(), _request_ollama
     else:
         logger.warning("No AI provider configured")
         return None
+    
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (provider, model, SYSTEM_PROMPT, user_message):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    key = digest.hexdigest()
+    
+    cached = file_index.get_cached_plan(key) if use_cache else None
+    if cached is not None:
+        logger.info("Using cached organization plan for identical request")
+        return cached
+    if cached_only:
+        return None
+    
+    plan = request(user_message)
+    if isinstance(plan, dict):
+        file_index.store_cached_plan(key, plan)
+    return plan
 
 
 def _request_openai(user_message: str) -> Optional[Dict[str, Any]]:
@@ -275,7 +311,7 @@ def _request_openai(user_message: str) -> Optional[Dict[str, Any]]:
         
         client = OpenAI(api_key=api_key)
         resp = client.chat.completions.create(
-            model="gpt-4o-mini",
+            model=OPENAI_PLAN_MODEL,
             messages=[
                 {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": user_message},
@@ -389,7 +425,12 @@ def deduplicate_plan(plan: Dict[str, Any]) -> Dict[str, Any]:
     return {"folders": cleaned_folders}
 
 
-def ensure_all_files_included(plan: Dict[str, Any], all_file_ids: set, files_info: List[Dict[str, Any]] = None) -> Dict[str, Any]:
+def ensure_all_files_included(
+    plan: Dict[str, Any],
+    all_file_ids: set,
+    files_info: List[Dict[str, Any]] = None,
+    included_ids: Optional[set] = None
+) -> Dict[str, Any]:
     """
     Ensure all provided file IDs are included in the plan.
     
@@ -400,6 +441,8 @@ def ensure_all_files_included(plan: Dict[str, Any], all_file_ids: set, files_inf
         plan: The organization plan from AI
         all_file_ids: Set of all file IDs that should be in the plan
         files_info: Optional list of file info dicts for better folder selection
+        included_ids: Optional set of int IDs already in the plan, if the caller
+            collected them while cleaning it; skips rescanning the folders
         
     Returns:
         Updated plan with all files included
@@ -407,14 +450,15 @@ def ensure_all_files_included(plan: Dict[str, Any], all_file_ids: set, files_inf
     if not plan or "folders" not in plan:
         plan = {"folders": {}}
     
-    # Collect all file IDs currently in the plan
-    included_ids = set()
-    for folder_name, file_ids in plan.get("folders", {}).items():
-        for fid in file_ids:
-            try:
-                included_ids.add(int(fid))
-            except (TypeError, ValueError):
-                pass
+    if included_ids is None:
+        # Collect all file IDs currently in the plan
+        included_ids = set()
+        for folder_name, file_ids in plan.get("folders", {}).items():
+            for fid in file_ids:
+                try:
+                    included_ids.add(int(fid))
+                except (TypeError, ValueError):
+                    pass
     
     # Find missing file IDs
     missing_ids = all_file_ids - included_ids
@@ -572,14 +616,18 @@ def plan_to_moves(
     
     for folder_name, file_ids in plan.get("folders", {}).items():
         dest_folder = destination_root / folder_name
+        dest_folder_resolved = dest_folder.resolve()
         
         for fid in file_ids:
-            # Normalize fid to int
-            try:
-                fid_int = int(fid)
-            except (TypeError, ValueError):
-                logger.warning(f"Invalid file ID type: {fid}")
-                continue
+            # Normalize fid to int (plans from the UI are already coerced)
+            if type(fid) is int:
+                fid_int = fid
+            else:
+                try:
+                    fid_int = int(fid)
+                except (TypeError, ValueError):
+                    logger.warning(f"Invalid file ID type: {fid}")
+                    continue
             
             file_info = files_by_id.get(fid_int)
             if not file_info:
@@ -597,7 +645,7 @@ def plan_to_moves(
             
             # Skip files that are already in the destination folder
             # This prevents "moving" files to where they already are
-            if source_path.parent.resolve() == dest_folder.resolve():
+            if source_path.parent.resolve() == dest_folder_resolved:
                 skipped_already_in_dest += 1
                 logger.debug(f"Skipping {source_path.name} - already in destination folder {dest_folder}")
                 continue
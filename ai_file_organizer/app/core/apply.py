@@ -7,7 +7,7 @@ import logging
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Callable, Optional
 from .settings import settings
 
 
@@ -45,7 +45,10 @@ def _get_unique_path(dest_path: Path) -> Path:
             raise ValueError(f"Could not find unique name for {dest_path.name} after 1000 attempts")
 
 
-def apply_moves(move_plan: List[Dict[str, Any]]) -> Tuple[bool, List[str], str, int]:
+def apply_moves(
+    move_plan: List[Dict[str, Any]],
+    on_progress: Optional[Callable[[int], None]] = None
+) -> Tuple[bool, List[str], str, int]:
     """
     Apply the move plan to actually move files.
     
@@ -53,6 +56,7 @@ def apply_moves(move_plan: List[Dict[str, Any]]) -> Tuple[bool, List[str], str,
     
     Args:
         move_plan: List of move plan dictionaries
+        on_progress: Optional callback receiving the number of entries processed
         
     Returns:
         Tuple of (success, list_of_errors, log_file_path, renamed_count)
@@ -71,6 +75,8 @@ def apply_moves(move_plan: List[Dict[str, Any]]) -> Tuple[bool, List[str], str,
     
     try:
         for i, move in enumerate(move_plan):
+            if on_progress is not None:
+                on_progress(i)
             try:
                 source_path = Path(move['source_path'])
                 dest_path = Path(move['destination_path'])
@@ -118,6 +124,9 @@ def apply_moves(move_plan: List[Dict[str, Any]]) -> Tuple[bool, List[str], str,
                 logger.error(error_msg)
                 continue
         
+        if on_progress is not None:
+            on_progress(len(move_plan))
+        
         # Save move log
         log_file_path = _save_move_log(move_log)
         
@@ -150,8 +159,9 @@ def _save_move_log(move_log: Dict[str, Any]) -> str:
         log_filename = f"moves-{timestamp}.json"
         log_file_path = moves_dir / log_filename
         
+        # Serialize first, then write once - json.dump issues a write per token
         with open(log_file_path, 'w', encoding='utf-8') as f:
-            json.dump(move_log, f, indent=2, ensure_ascii=False)
+            f.write(json.dumps(move_log, indent=2, ensure_ascii=False))
         
         logger.info(f"Move log saved to: {log_file_path}")
         return str(log_file_path)
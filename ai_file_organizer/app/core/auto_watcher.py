@@ -464,6 +464,18 @@ class AutoOrganizeWatcher(QObject):
         self.folder_instructions[folder_path] = instruction
         logger.info(f"Set instruction for {folder_path}: {instruction[:50]}...")
     
+    def update_instructions(self, changed: Dict[str, str], removed: Set[str]) -> None:
+        """Apply an instruction diff in place, touching only folders that changed.
+        
+        Args:
+            changed: Normalized folder path -> new instruction (added or edited)
+            removed: Normalized folder paths whose instructions no longer apply
+        """
+        self.folder_instructions.update(changed)
+        for folder_path in removed:
+            self.folder_instructions.pop(folder_path, None)
+        logger.info(f"Updated instructions: {len(changed)} changed, {len(removed)} removed")
+    
     def start(self, organize_existing: bool = True, flatten_first: bool = False) -> None:
         """
         Start watching folders.
@@ -913,6 +925,10 @@ class AutoOrganizeWatcher(QObject):
                     if deleted > 0:
                         logger.info(f"Periodic cleanup: removed {deleted} empty folder(s)")
         
+        # Stable files are collected per folder and sent to the AI as one batch,
+        # so a burst of new files costs one plan request instead of one per file
+        ready_files: Dict[str, List[str]] = defaultdict(list)
+        
         for folder in self.watched_folders:
             folder = os.path.normpath(folder)
             if not os.path.isdir(folder):
@@ -940,13 +956,18 @@ class AutoOrganizeWatcher(QObject):
                         # Check if file has been stable long enough
                         first_seen = self._pending_files[item_path]
                         if current_time - first_seen >= self._debounce_seconds:
-                            # File is stable, process it
-                            instruction = self._get_instruction_for_folder(folder)
-                            self._process_files_with_ai([item_path], folder, instruction)
+                            # File is stable, queue it for this folder's batch
+                            ready_files[folder].append(item_path)
                             self._pending_files.pop(item_path, None)
                             
             except Exception as e:
                 logger.error(f"Error checking folder {folder}: {e}")
+        
+        for folder, file_paths in ready_files.items():
+            if len(file_paths) > 1:
+                logger.info(f"Batching {len(file_paths)} new files in {os.path.basename(folder)} into one AI request")
+            instruction = self._get_instruction_for_folder(folder)
+            self._process_files_with_ai(file_paths, folder, instruction)
     
     def _process_files_with_ai(self, file_paths: List[str], folder: str, instruction: str, 
                                 existing_folders: List[str] = None) -> None:
@@ -5,13 +5,20 @@ Database management for file indexing and search functionality.
 import sqlite3
 import json
 import logging
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import List, Dict, Any, Optional, Set, Tuple
+from datetime import datetime, timedelta
 from .settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Cached organization plans older than this are ignored and pruned
+PLAN_CACHE_MAX_AGE_DAYS = 7
+
+# Bytes of the index file memory-mapped per connection for reads
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+
 def _parse_tags_value(raw: Any) -> Optional[List[str]]:
     """Parse tags stored in DB.
 
@@ -50,11 +57,32 @@ class FileIndex:
         
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
         self._init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection to the index, opening it on first use.
+        
+        Reusing one connection per thread skips the open and schema parse on
+        every call. Connections close when their thread exits.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.path != self.db_path:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("PRAGMA synchronous=NORMAL")  # safe with WAL, fewer fsyncs
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+            self._local.conn = conn
+            self._local.path = self.db_path
+        conn.row_factory = None  # some queries switch to sqlite3.Row
+        return conn
+    
     def _init_database(self):
         """Initialize database tables."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
+            # WAL lets the UI read while an indexing thread writes; it is
+            # stored in the file, so this only does work the first time
+            conn.execute("PRAGMA journal_mode=WAL")
             cursor = conn.cursor()
             
             # Create files table
@@ -158,6 +186,15 @@ class FileIndex:
                 )
             """)
             
+            # Organization plans keyed by a hash of the exact LLM prompt
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS plan_cache (
+                    key TEXT PRIMARY KEY,
+                    plan TEXT NOT NULL,
+                    created_at TEXT NOT NULL
+                )
+            """)
+            
             conn.commit()
             logger.info(f"Database initialized at {self.db_path}")
 
@@ -176,7 +213,7 @@ class FileIndex:
         if field not in allowed:
             return False
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 val = value
                 if field in {"tags", "user_tags", "metadata"}:
@@ -210,7 +247,7 @@ class FileIndex:
             True if successful, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # IMPORTANT: Before updating, remove any stale entry that has the same path
@@ -276,6 +313,76 @@ class FileIndex:
             logger.error(f"Error updating file path for {file_id}: {e}")
             return False
     
+    def update_file_paths_bulk(self, pairs: List[Tuple[int, str]]) -> Optional[Set[int]]:
+        """
+        Update the file_path of many moved files in a single transaction.
+        Same semantics as update_file_path, but with one commit for the batch.
+        
+        Args:
+            pairs: (file_id, new_path) tuples, applied in order
+            
+        Returns:
+            Set of IDs whose path was updated, or None if the batch failed
+        """
+        if not pairs:
+            return set()
+        
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                updated_ids = set()
+                stale_deleted = 0
+                
+                # Applied pair by pair so stale-path cleanup sees earlier moves, like sequential calls
+                for file_id, new_path in pairs:
+                    cursor.execute(
+                        "DELETE FROM files WHERE file_path = ? AND id != ?",
+                        (new_path, file_id)
+                    )
+                    stale_deleted += cursor.rowcount
+                    cursor.execute(
+                        "UPDATE files SET file_path = ? WHERE id = ?",
+                        (new_path, file_id)
+                    )
+                    if cursor.rowcount > 0:
+                        updated_ids.add(file_id)
+                
+                if stale_deleted > 0:
+                    logger.info(f"Removed {stale_deleted} stale entry/entries while updating paths")
+                    cursor.execute(
+                        "DELETE FROM files_fts WHERE rowid NOT IN (SELECT id FROM files)"
+                    )
+                
+                # External content FTS5 rows must be deleted and re-inserted, not updated
+                try:
+                    fts_ids = [(file_id,) for file_id in updated_ids]
+                    cursor.executemany("DELETE FROM files_fts WHERE rowid = ?", fts_ids)
+                    cursor.executemany(
+                        """
+                        INSERT INTO files_fts(rowid, file_name, file_path, category, ocr_text, caption, tags)
+                        SELECT id, file_name, file_path, category, ocr_text, caption, tags 
+                        FROM files WHERE id = ?
+                        """,
+                        fts_ids
+                    )
+                except Exception as fts_err:
+                    error_str = str(fts_err).lower()
+                    # Auto-heal if FTS index is corrupted
+                    if "malformed" in error_str or "corrupt" in error_str:
+                        logger.warning("FTS index corrupted, triggering auto-rebuild...")
+                        conn.commit()  # Commit main table changes first
+                        self._auto_rebuild_fts()
+                    else:
+                        logger.warning(f"FTS index update failed for bulk path update: {fts_err}")
+                
+                conn.commit()
+                logger.info(f"Updated file paths for {len(updated_ids)}/{len(pairs)} files")
+                return updated_ids
+                
+        except Exception as e:
+            logger.error(f"Error bulk-updating {len(pairs)} file paths: {e}")
+            return None
+    
     def delete_file(self, file_id: int) -> bool:
         """
         Delete a file entry from the database.
@@ -287,7 +394,7 @@ class FileIndex:
             True if successful, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Delete from main table
@@ -322,7 +429,7 @@ class FileIndex:
             True if successful, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Get the file ID first
@@ -360,7 +467,7 @@ class FileIndex:
         stats = {'checked': 0, 'removed': 0, 'errors': 0}
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Get all file paths and IDs
@@ -415,7 +522,7 @@ class FileIndex:
         logger.warning(f"[DB_WRITE] add_file called: file='{file_name}', incoming_tags={repr(incoming_tags)[:100]}")
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
@@ -581,7 +688,7 @@ class FileIndex:
             List of matching file dictionaries
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
 
@@ -651,7 +758,7 @@ class FileIndex:
     ) -> List[Dict[str, Any]]:
         """Search with parsed terms/filters, with robust fallbacks."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
 
@@ -779,7 +886,7 @@ class FileIndex:
             File dictionary or None if not found
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 cursor.execute("SELECT * FROM files WHERE file_name = ?", (file_name,))
@@ -824,7 +931,7 @@ class FileIndex:
             File dictionary or None if not found
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 cursor.execute("SELECT * FROM files WHERE file_path = ?", (file_path,))
@@ -867,7 +974,7 @@ class FileIndex:
             Set of filenames (without path) that have non-empty tags
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 # Get filenames where tags is not null and not empty
                 cursor.execute("""
@@ -888,7 +995,7 @@ class FileIndex:
             Number of files in the database
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT COUNT(*) FROM files")
                 return cursor.fetchone()[0]
@@ -899,7 +1006,7 @@ class FileIndex:
     # ---------- Embeddings helpers ----------
     def upsert_embedding(self, file_id: int, model: str, vector: List[float]) -> None:
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -919,7 +1026,7 @@ class FileIndex:
 
     def get_all_embeddings(self) -> List[Dict[str, Any]]:
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 cursor.execute("SELECT * FROM embeddings")
@@ -937,12 +1044,51 @@ class FileIndex:
             logger.error(f"Error reading embeddings: {e}")
             return []
 
+    # ---------- Plan cache helpers ----------
+    def get_cached_plan(self, key: str, max_age_days: int = PLAN_CACHE_MAX_AGE_DAYS) -> Optional[Dict[str, Any]]:
+        """Return the cached plan for a prompt key, or None if missing or expired."""
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT plan FROM plan_cache WHERE key = ? AND created_at >= ?",
+                    (key, cutoff),
+                ).fetchone()
+            return json.loads(row[0]) if row else None
+        except Exception as e:
+            logger.error(f"Error reading plan cache: {e}")
+            return None
+
+    def store_cached_plan(self, key: str, plan: Dict[str, Any]) -> None:
+        """Cache a plan for a prompt key, dropping expired entries."""
+        now = datetime.now()
+        cutoff = (now - timedelta(days=PLAN_CACHE_MAX_AGE_DAYS)).isoformat()
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM plan_cache WHERE created_at < ?", (cutoff,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO plan_cache (key, plan, created_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(plan), now.isoformat()),
+                )
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Error writing plan cache: {e}")
+
+    def clear_plan_cache(self) -> None:
+        """Forget all cached plans (after files move, old plans no longer apply)."""
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM plan_cache")
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Error clearing plan cache: {e}")
+
     def get_files_by_ids(self, ids: List[int]) -> List[Dict[str, Any]]:
         if not ids:
             return []
         try:
             placeholders = ",".join(["?"] * len(ids))
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 cursor.execute(f"SELECT * FROM files WHERE id IN ({placeholders})", ids)
@@ -982,7 +1128,7 @@ class FileIndex:
             Dictionary with statistics
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
@@ -1017,7 +1163,7 @@ class FileIndex:
     def _log_search(self, query: str, results_count: int):
         """Log search query."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     INSERT INTO search_history (query, timestamp, results_count)
@@ -1038,7 +1184,7 @@ class FileIndex:
             List of search history entries
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT query, timestamp, results_count 
@@ -1063,14 +1209,15 @@ class FileIndex:
     def clear_index(self):
         """Clear all indexed files, FTS index, and embeddings."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 # Delete from all related tables
                 cursor.execute("DELETE FROM files")
                 cursor.execute("DELETE FROM files_fts")
                 cursor.execute("DELETE FROM embeddings")
+                cursor.execute("DELETE FROM plan_cache")  # Plans refer to file IDs
                 conn.commit()
-                logger.info("File index cleared (files, files_fts, embeddings)")
+                logger.info("File index cleared (files, files_fts, embeddings, plan cache)")
         except Exception as e:
             logger.error(f"Error clearing index: {e}")
             raise  # Re-raise to let caller handle it
@@ -1095,7 +1242,7 @@ class FileIndex:
             logger.warning("Metadata utils not available, skipping metadata extraction")
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Get all file paths
@@ -1165,7 +1312,7 @@ class FileIndex:
         logger.info("Auto-rebuilding corrupted FTS index...")
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Drop corrupted FTS table
@@ -1221,7 +1368,7 @@ class FileIndex:
         stats = {'total': 0, 'indexed': 0, 'errors': 0}
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Get total count
@@ -3,6 +3,7 @@ File scanning and discovery logic.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any
 from .categorize import get_file_metadata
@@ -10,6 +11,22 @@ from .categorize import get_file_metadata
 
 logger = logging.getLogger(__name__)
 
+# Files whose metadata is read at once. The work is stat/header reads and
+# tesseract subprocesses, which release the GIL, so threads are enough.
+SCAN_METADATA_THREADS = 8
+
+
+def _scan_one(file_path: Path):
+    try:
+        metadata = get_file_metadata(file_path)
+        if metadata:
+            # Include full source path for files in subfolders
+            metadata['source_path'] = str(file_path)
+        return metadata
+    except Exception as e:
+        logger.error(f"Error processing file {file_path}: {e}")
+        return None
+
 
 def scan_directory(source_path: Path, max_files: int = 1000) -> List[Dict[str, Any]]:
     """
@@ -35,9 +52,10 @@ def scan_directory(source_path: Path, max_files: int = 1000) -> List[Dict[str, A
         
         logger.info(f"Starting scan of directory: {source_path}")
         
-        # Walk through directory recursively
+        # Walk through directory recursively, collecting paths first
+        paths = []
         for file_path in source_path.rglob('*'):
-            if len(files) >= max_files:
+            if len(paths) >= max_files:
                 logger.warning(f"Reached maximum file limit ({max_files})")
                 break
             
@@ -49,16 +67,15 @@ def scan_directory(source_path: Path, max_files: int = 1000) -> List[Dict[str, A
             if _should_skip_file(file_path):
                 continue
             
-            try:
-                metadata = get_file_metadata(file_path)
-                if metadata:
-                    # Include full source path for files in subfolders
-                    metadata['source_path'] = str(file_path)
-                    files.append(metadata)
-                    
-            except Exception as e:
-                logger.error(f"Error processing file {file_path}: {e}")
-                continue
+            paths.append(file_path)
+        
+        # Read metadata in parallel; map keeps the walk order
+        if len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(SCAN_METADATA_THREADS, len(paths))) as executor:
+                results = list(executor.map(_scan_one, paths))
+        else:
+            results = [_scan_one(p) for p in paths]
+        files = [m for m in results if m]
         
         logger.info(f"Scan completed. Found {len(files)} files.")
         return files
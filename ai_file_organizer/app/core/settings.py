@@ -74,6 +74,16 @@ class Settings:
         # List of contextual tip IDs that have been seen/dismissed
         self.seen_tips: List[str] = []
         
+        # ======= ORGANIZE SETTINGS =======
+        # Destination folder -> fingerprint of its whole folder tree at the last path
+        # check that walked it and found nothing moved or unindexed
+        self.verified_destinations: Dict[str, str] = {}
+        
+        # ======= VOICE SETTINGS =======
+        # Opt-in: transcribe on this machine when faster-whisper is installed (smaller
+        # model than OpenAI's whisper-1; falls back to OpenAI when unavailable)
+        self.local_transcription: bool = False
+        
         # Load persisted config if available
         try:
             self._load_config()
@@ -323,6 +333,17 @@ class Settings:
         self.has_completed_onboarding = bool(data.get('has_completed_onboarding', False))
         self.onboarding_remind_count = int(data.get('onboarding_remind_count', 0))
         self.seen_tips = list(data.get('seen_tips', []))
+        
+        # Organize
+        verified = data.get('verified_destinations')
+        if isinstance(verified, dict):
+            # Older top-level-only mtimes (ints) missed changes in subfolders, so drop them
+            self.verified_destinations = {
+                str(k): v for k, v in verified.items() if isinstance(v, str)
+            }
+        
+        # Voice
+        self.local_transcription = bool(data.get('local_transcription', False))
 
     def _save_config(self) -> None:
         cfg = {
@@ -358,6 +379,10 @@ class Settings:
             'has_completed_onboarding': self.has_completed_onboarding,
             'onboarding_remind_count': self.onboarding_remind_count,
             'seen_tips': self.seen_tips,
+            # Organize
+            'verified_destinations': self.verified_destinations,
+            # Voice
+            'local_transcription': self.local_transcription,
         }
         try:
             with open(self._config_file(), 'w', encoding='utf-8') as f:
@@ -667,6 +692,30 @@ class Settings:
         """Reset all contextual tips to show them again"""
         self.seen_tips = []
         self._save_config()
+    
+    # ======= ORGANIZE METHODS =======
+    
+    def get_verified_destination_fingerprint(self, destination: str) -> Optional[str]:
+        """Get the destination's tree fingerprint from its last clean path check, if any"""
+        return self.verified_destinations.get(os.path.normpath(destination))
+    
+    def set_verified_destination_fingerprint(self, destination: str, fingerprint: Optional[str]) -> None:
+        """Record (or with None, forget) the tree fingerprint of a clean path check"""
+        key = os.path.normpath(destination)
+        if self.verified_destinations.get(key) == fingerprint:
+            return
+        if fingerprint is None:
+            self.verified_destinations.pop(key, None)
+        else:
+            self.verified_destinations[key] = fingerprint
+        self._save_config()
+    
+    # ======= VOICE METHODS =======
+    
+    def set_local_transcription(self, enabled: bool) -> None:
+        """Enable or disable on-device voice transcription (faster-whisper)"""
+        self.local_transcription = bool(enabled)
+        self._save_config()
 
 
 # Global settings instance
@@ -2065,6 +2065,52 @@ class MainWindow(QMainWindow):
         
         layout.addWidget(search_card)
         
+        # ======= VOICE INPUT CARD =======
+        voice_card = QFrame()
+        voice_card.setObjectName("settingsCardVoice")
+        voice_card.setStyleSheet("""
+            QFrame#settingsCardVoice {
+                background-color: #111119;
+                border: 1px solid #1C1C28;
+                border-radius: 16px;
+            }
+            QFrame#settingsCardVoice > QLabel {
+                border: none;
+                background: transparent;
+            }
+        """)
+        voice_layout = QVBoxLayout(voice_card)
+        voice_layout.setContentsMargins(20, 20, 20, 20)
+        voice_layout.setSpacing(12)
+        
+        voice_title = QLabel("🎤 Voice Input")
+        voice_title.setStyleSheet(settings_title_style)
+        voice_layout.addWidget(voice_title)
+        
+        # On-device transcription toggle
+        voice_row = QHBoxLayout()
+        self.local_transcription_btn = QPushButton(
+            "On-Device Transcription: ON" if settings.local_transcription else "On-Device Transcription: OFF"
+        )
+        self.local_transcription_btn.setCheckable(True)
+        self.local_transcription_btn.setChecked(settings.local_transcription)
+        self.local_transcription_btn.setMinimumHeight(36)
+        self.local_transcription_btn.setMinimumWidth(230)
+        self.local_transcription_btn.setCursor(Qt.PointingHandCursor)
+        self.local_transcription_btn.setStyleSheet(toggle_btn_style)
+        self.local_transcription_btn.setToolTip("Transcribe voice input offline with faster-whisper when it is installed")
+        self.local_transcription_btn.clicked.connect(self.on_local_transcription_toggle)
+        voice_row.addWidget(self.local_transcription_btn)
+        voice_row.addStretch()
+        voice_layout.addLayout(voice_row)
+        
+        voice_info = QLabel("💡 Off uses OpenAI Whisper. On keeps audio on this PC but is less accurate; the model downloads on first use.")
+        voice_info.setWordWrap(True)
+        voice_info.setStyleSheet(settings_hint_style)
+        voice_layout.addWidget(voice_info)
+        
+        layout.addWidget(voice_card)
+        
         # ======= ACCOUNT CARD =======
         account_card = QFrame()
         account_card.setObjectName("settingsCardAccount")
@@ -4152,6 +4198,13 @@ class MainWindow(QMainWindow):
         self.spell_check_btn.setText("Spell Check: ON" if checked else "Spell Check: OFF")
         self.status_bar.showMessage("Spell check " + ("enabled" if checked else "disabled"))
 
+    def on_local_transcription_toggle(self, checked: bool):
+        settings.set_local_transcription(bool(checked))
+        self.local_transcription_btn.setText(
+            "On-Device Transcription: ON" if checked else "On-Device Transcription: OFF"
+        )
+        self.status_bar.showMessage("On-device transcription " + ("enabled" if checked else "disabled"))
+
     # Quick Search settings handlers
     def on_qs_autopaste(self, checked: bool):
         settings.set_quick_search_autopaste(bool(checked))
@@ -7014,20 +7067,37 @@ Move Plan Summary:
     def _update_usage_labels(self):
         """Update the usage indicator labels (main tab and overlay)."""
         try:
-            from app.core.supabase_client import supabase_auth, INDEX_LIMIT_STARTER, INDEX_LIMIT_ULTRA
-            
-            # Get current usage
-            usage = supabase_auth.get_index_usage()
-            plan = supabase_auth.get_plan_tier()
-            
-            if plan == 'free':
-                usage_text = "Sign in to track media indexing"
-            else:
-                limit = INDEX_LIMIT_ULTRA if plan == 'ultra' else INDEX_LIMIT_STARTER
-                count = usage.get('count', 0)
-                remaining = max(0, limit - count)
-                usage_text = f"{count:,} / {limit:,} media files indexed • {remaining:,} remaining"
-            
+            usage_text = self._fetch_usage_text()
+        except Exception as e:
+            logger.debug(f"Could not update usage labels: {e}")
+            self._clear_usage_text()
+            return
+        self._apply_usage_text(usage_text)
+    
+    def _clear_usage_text(self, _error: str = ""):
+        """Blank the main tab usage label after a failed usage query."""
+        if hasattr(self, 'usage_label') and self.usage_label:
+            self.usage_label.setText("")
+    
+    @staticmethod
+    def _fetch_usage_text() -> str:
+        """Query the account's index usage (network call, safe to run off the UI thread)."""
+        from app.core.supabase_client import supabase_auth, INDEX_LIMIT_STARTER, INDEX_LIMIT_ULTRA
+        
+        # Get current usage
+        usage = supabase_auth.get_index_usage()
+        plan = supabase_auth.get_plan_tier()
+        
+        if plan == 'free':
+            return "Sign in to track media indexing"
+        limit = INDEX_LIMIT_ULTRA if plan == 'ultra' else INDEX_LIMIT_STARTER
+        count = usage.get('count', 0)
+        remaining = max(0, limit - count)
+        return f"{count:,} / {limit:,} media files indexed • {remaining:,} remaining"
+    
+    def _apply_usage_text(self, usage_text: str):
+        """Show a usage string on the main tab and overlay labels."""
+        try:
             # Update main tab label
             if hasattr(self, 'usage_label') and self.usage_label:
                 from app.ui.theme_manager import get_theme_colors
@@ -11,48 +11,566 @@ Flow:
 """
 
 import os
+import errno
 import sqlite3
 import json
 import logging
+import bisect
+import io
+import functools
+import hashlib
+import itertools
+import threading
+import shutil
+import wave
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QLineEdit, QTextEdit, QTreeWidget, QTreeWidgetItem,
+    QLineEdit, QTextEdit, QTreeView,
     QProgressBar, QMessageBox, QFileDialog, QGroupBox,
     QSplitter, QFrame, QSizePolicy, QScrollArea,
     QDialog, QListWidget, QListWidgetItem, QCheckBox,
     QSpacerItem, QStackedWidget, QButtonGroup, QApplication,
-    QRadioButton, QGraphicsDropShadowEffect
+    QRadioButton, QGraphicsDropShadowEffect, QListView, QAbstractItemView,
+    QStyledItemDelegate, QStyle
+)
+from PySide6.QtCore import (
+    Qt, QObject, QThread, Signal, QTimer, QEvent, QAbstractItemModel, QAbstractListModel, QModelIndex
 )
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
 
 from app.core.settings import settings
 
 from app.core.database import file_index
 from app.core.ai_organizer import (
-    request_organization_plan, validate_plan, plan_to_moves, get_plan_summary,
-    deduplicate_plan, ensure_all_files_included
+    request_organization_plan, validate_plan, plan_to_moves,
+    ensure_all_files_included
 )
 from app.core.apply import apply_moves
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=512)
+def _norm(path: str) -> str:
+    """Memoized os.path.normpath for watch-folder paths re-read from settings."""
+    return os.path.normpath(path)
+
+
+@functools.lru_cache(maxsize=512)
+def _format_ts(timestamp_str: str) -> str:
+    """Display form of a move-log timestamp; memoized across history reloads."""
+    from datetime import datetime
+    try:
+        return datetime.fromisoformat(timestamp_str).strftime("%b %d, %Y at %I:%M %p")
+    except (TypeError, ValueError):
+        return timestamp_str[:19] if timestamp_str else "Unknown date"
+
+
+# Instruction sent when the user leaves the box empty - MUST organize ALL files
+_AUTO_ORGANIZE_INSTRUCTION = (
+    "[AUTO-ORGANIZE] Organize ALL of the provided files into a logical folder structure. "
+    "CRITICAL: EVERY single file must be placed in a folder - do NOT leave any file out. "
+    "Keep it simple - use only a few broad, clear folder names (e.g., screenshots, documents, images). "
+    "Avoid deep nesting (no subfolders inside subfolders). "
+    "Group similar files together based on their type, tags, and content. "
+    "If some files don't fit any clear category, put them in a 'misc' or 'other' folder. "
+    "EVERY file_id provided MUST appear in exactly one folder."
+)
+
+
+# Only the columns the planner uses; never SELECT * so large OCR/metadata text isn't read
+_LOAD_FILES_SQL = (
+    "SELECT id, file_path, file_name, file_size, label, caption, tags, category FROM files"
+)
+
+
+# Theme-independent part of the OrganizePage stylesheet, built once at import.
+_QSS_ORGANIZE_PAGE = """
+    /* ---- Tab switcher ---- */
+    QPushButton#tabOrganizeNow {
+        background-color: #7C4DFF;
+        color: white;
+        border: 1px solid #7C4DFF;
+        border-top-left-radius: 12px;
+        border-bottom-left-radius: 12px;
+        border-top-right-radius: 0px;
+        border-bottom-right-radius: 0px;
+        font-weight: 600;
+        font-size: 14px;
+        padding: 10px 20px;
+    }
+    QPushButton#tabOrganizeNow:checked, QPushButton#tabAutoOrganize:checked {
+        background-color: #7C4DFF;
+        color: white;
+        border-color: #7C4DFF;
+    }
+    QPushButton#tabOrganizeNow:!checked:hover, QPushButton#tabAutoOrganize:!checked:hover {
+        background-color: rgba(124, 77, 255, 0.06);
+        border-color: rgba(124, 77, 255, 0.30);
+        color: #B39DFF;
+    }
+
+    /* ---- Cards ---- */
+    QFrame#instructionCard {
+        padding: 24px;
+    }
+    QFrame#planCard {
+        background-color: rgba(124, 77, 255, 0.06);
+        border: 2px dashed rgba(124, 77, 255, 0.5);
+        border-radius: 20px;
+    }
+    QLabel#cardTitle {
+        font-size: 16px; font-weight: 600; color: #7C4DFF; background: transparent;
+    }
+    QLabel#planTitle {
+        font-family: "Segoe UI", sans-serif;
+        font-weight: 600; font-size: 16px;
+        color: #7C4DFF; background: transparent;
+    }
+    QLabel#destIcon {
+        font-size: 24px; background: transparent;
+    }
+
+    /* ---- Instruction input + mic ---- */
+    QPushButton#micButton:hover {
+        background-color: rgba(124, 77, 255, 0.08);
+        border-color: #7C4DFF;
+    }
+    QPushButton#micButton:pressed {
+        background-color: rgba(124, 77, 255, 0.12);
+    }
+    QPushButton#micButton[recording="true"] {
+        background-color: #ff4444;
+        border: 1px solid #cc0000;
+        border-radius: 6px;
+        color: white;
+    }
+    QPushButton#micButton[recording="true"]:hover {
+        background-color: #ff6666;
+    }
+
+    /* ---- Action buttons ---- */
+    QPushButton#destButton {
+        background-color: transparent;
+        color: #7C4DFF;
+        border: 1px solid rgba(124, 77, 255, 0.30);
+        border-radius: 10px;
+        font-size: 14px;
+        font-weight: 600;
+        padding: 8px 16px;
+    }
+    QPushButton#destButton:hover {
+        background-color: rgba(124, 77, 255, 0.08);
+        border-color: #7C4DFF;
+    }
+    QPushButton#generateButton {
+        background-color: rgba(124, 77, 255, 0.08);
+        color: #7C4DFF;
+        border: 1px solid rgba(124, 77, 255, 0.35);
+        border-radius: 12px;
+        font-weight: 700;
+        font-size: 15px;
+    }
+    QPushButton#generateButton:hover {
+        background-color: #7C4DFF;
+        color: white;
+        border-color: #7C4DFF;
+    }
+    QPushButton#applyButton {
+        background-color: rgba(76, 175, 80, 0.08);
+        color: #4CAF50;
+        border: 1px solid rgba(76, 175, 80, 0.35);
+        border-radius: 12px;
+        font-weight: 700;
+        font-size: 15px;
+    }
+    QPushButton#applyButton:hover {
+        background-color: #4CAF50;
+        color: white;
+        border-color: #4CAF50;
+    }
+    QPushButton#clearButton {
+        background-color: transparent;
+        color: #7C4DFF;
+        border: 1px solid rgba(124, 77, 255, 0.30);
+        border-radius: 12px;
+        font-weight: 600;
+        font-size: 15px;
+    }
+    QPushButton#clearButton:hover {
+        background-color: rgba(124, 77, 255, 0.08);
+    }
+    QPushButton#undoButton {
+        background-color: transparent;
+        color: #9575FF;
+        border: 1px solid rgba(149, 117, 255, 0.30);
+        border-radius: 12px;
+        font-weight: 600;
+        font-size: 15px;
+    }
+    QPushButton#undoButton:hover {
+        background-color: rgba(124, 77, 255, 0.08);
+        color: #B39DFF;
+        border-color: #7C4DFF;
+    }
+    QPushButton#historyButton:hover, QPushButton#pinnedButton:hover, QPushButton#editInputsButton:hover {
+        background-color: rgba(124, 77, 255, 0.06);
+        border-color: #7C4DFF;
+        color: #B39DFF;
+    }
+    QPushButton#editInputsButton {
+        padding: 0px 20px;
+    }
+    QWidget#actionRow {
+        background: transparent;
+    }
+    QScrollArea#actionScroll {
+        border: none; background: transparent;
+    }
+    QScrollArea#actionScroll QScrollBar::handle:horizontal:hover {
+        background: #7C4DFF;
+    }
+    QScrollArea#actionScroll QScrollBar::add-line:horizontal,
+    QScrollArea#actionScroll QScrollBar::sub-line:horizontal {
+        width: 0px;
+    }
+
+    /* ---- Plan tree ---- */
+    QTreeView#planTree {
+        background-color: transparent;
+        border: none;
+        font-family: "Segoe UI", sans-serif;
+        font-size: 14px; padding: 4px; outline: none;
+    }
+    QTreeView#planTree::item:hover {
+        background-color: rgba(124, 77, 255, 0.08);
+    }
+    QTreeView#planTree::item:selected {
+        background-color: rgba(124, 77, 255, 0.15);
+        color: #7C4DFF; font-weight: 600;
+    }
+    QTreeView#planTree::branch {
+        background: transparent; width: 0px; border: none; image: none;
+    }
+
+    /* ---- Refine ---- */
+    QPushButton#refineButton, QPushButton#regenerateButton {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #7C4DFF, stop:1 #9575FF);
+        color: white;
+        border: none;
+        border-radius: 10px;
+        font-weight: 600;
+        font-size: 14px;
+    }
+    QPushButton#refineButton:hover, QPushButton#regenerateButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #9575FF, stop:1 #B39DFF);
+    }
+
+    /* ---- Auto-Organize card ---- */
+    QLabel#watchIcon {
+        font-size: 28px; background: transparent;
+    }
+    QLabel#watchTitle {
+        font-size: 18px; font-weight: 600; color: #7C4DFF; background: transparent;
+    }
+    QFrame#watchSeparator {
+        background-color: rgba(124, 77, 255, 0.2); border: none; max-height: 1px;
+    }
+    QLabel#watchFolderLabel[state="watching"] {
+        color: #7C4DFF; font-weight: 500;
+    }
+    QPushButton#watchConfigBtn {
+        background-color: transparent;
+        color: #7C4DFF;
+        border: 1px solid rgba(124, 77, 255, 0.30);
+        border-radius: 12px;
+        font-size: 14px;
+        font-weight: 600;
+        padding: 0 16px;
+    }
+    QPushButton#watchConfigBtn:hover {
+        background-color: rgba(124, 77, 255, 0.08);
+        border-color: #7C4DFF;
+    }
+    QPushButton#watchToggleBtn {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #7C4DFF, stop:1 #9575FF);
+        color: white;
+        border: none;
+        border-radius: 12px;
+        font-size: 14px;
+        font-weight: 600;
+        padding: 0 20px;
+    }
+    QPushButton#watchToggleBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #9575FF, stop:1 #B39DFF);
+    }
+    QPushButton#watchToggleBtn:disabled {
+        background: rgba(124, 77, 255, 0.3);
+        color: rgba(255, 255, 255, 0.5);
+    }
+    QPushButton#watchToggleBtn[state="watching"] {
+        background: transparent;
+        color: #7C4DFF;
+        border: 2px solid #7C4DFF;
+    }
+    QPushButton#watchToggleBtn[state="watching"]:hover {
+        background: rgba(124, 77, 255, 0.1);
+    }
+"""
+
+# Round purple "X" close button shared by the modern dialogs (36px). Kept as
+# one module-level string instead of a literal repeated in every dialog.
+_QSS_CLOSE_BUTTON = """
+    QPushButton {
+        background-color: #7C4DFF;
+        color: white;
+        border: none;
+        border-radius: 18px;
+        font-size: 20px;
+        font-weight: bold;
+        font-family: Arial, Helvetica, sans-serif;
+        padding: 0px;
+        margin: 0px;
+    }
+    QPushButton:hover {
+        background-color: #5E35B1;
+    }
+"""
+
+# Same button at 32px, for the smaller history and watch dialogs.
+_QSS_CLOSE_BUTTON_SMALL = """
+    QPushButton {
+        background-color: #7C4DFF;
+        color: white;
+        border: none;
+        border-radius: 16px;
+        font-size: 18px;
+        font-weight: bold;
+        font-family: Arial, Helvetica, sans-serif;
+        padding: 0px;
+        margin: 0px;
+    }
+    QPushButton:hover {
+        background-color: #5E35B1;
+    }
+"""
+
+# Filled purple footer button (Close/Done) of the history and pinned dialogs.
+_QSS_PRIMARY_BUTTON = """
+    QPushButton {
+        background-color: #7C4DFF;
+        color: white;
+        border: none;
+        border-radius: 10px;
+        font-weight: 600;
+        font-size: 14px;
+        padding: 8px 28px;
+    }
+    QPushButton:hover {
+        background-color: #9575FF;
+    }
+"""
+
+# Outlined "Pin File" / "Pin Folder" buttons.
+_QSS_PIN_ACTION_BUTTON = """
+    QPushButton {
+        background-color: rgba(124, 77, 255, 0.06);
+        color: #7C4DFF;
+        border: 1px solid rgba(124, 77, 255, 0.15);
+        border-radius: 10px;
+        font-size: 13px;
+        font-weight: 600;
+        padding: 8px 16px;
+    }
+    QPushButton:hover {
+        background-color: rgba(124, 77, 255, 0.12);
+        border-color: #7C4DFF;
+    }
+"""
+
+# Theme-independent rules for pinned list rows. Row widgets only get an
+# objectName; the list container carries one sheet for every row.
+_QSS_LIST_ROWS = """
+    QLabel#pinnedIcon { font-size: 18px; }
+    QLabel#pinnedStatus { font-size: 14px; }
+    QPushButton#unpinButton {
+        background-color: #E53935;
+        color: white;
+        border: none;
+        border-radius: 14px;
+        font-size: 16px;
+        font-weight: bold;
+        font-family: Arial, Helvetica, sans-serif;
+        padding: 0px;
+        margin: 0px;
+    }
+    QPushButton#unpinButton:hover {
+        background-color: #C62828;
+    }
+    QFrame#listRow:hover {
+        background-color: rgba(124, 77, 255, 0.06);
+        border-color: rgba(124, 77, 255, 0.15);
+    }
+"""
+
+
+def _list_rows_qss(c: Dict[str, str]) -> str:
+    """Sheet for the pinned list container: theme colours plus _QSS_LIST_ROWS."""
+    return f"""
+    QFrame#listRow {{
+        background-color: {c['card']};
+        border-radius: 12px;
+        border: 1px solid {c['border']};
+    }}
+    QLabel#rowTitle {{
+        font-family: "Segoe UI", sans-serif;
+        font-size: 14px;
+        font-weight: 600;
+        color: {c['text']};
+    }}
+    QLabel#rowSubtitleSmall {{
+        font-family: "Segoe UI", sans-serif;
+        font-size: 11px;
+        color: {c['text_muted']};
+    }}
+""" + _QSS_LIST_ROWS
+
+
+# Right-click menu on plan tree items.
+_QSS_PLAN_TREE_MENU = """
+    QMenu {
+        background-color: #111119;
+        border: 1px solid #1C1C28;
+        border-radius: 8px;
+        padding: 6px 4px;
+    }
+    QMenu::item {
+        padding: 8px 20px;
+        border-radius: 6px;
+        font-family: "Segoe UI", sans-serif;
+        font-size: 13px;
+        color: #E8E8F0;
+    }
+    QMenu::item:selected {
+        background-color: rgba(124, 77, 255, 0.10);
+        color: #B39DFF;
+    }
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _voice_deps():
+    """Import the voice-recording libraries once and reuse them across recordings.
+    
+    Only what capture needs; openai is imported by _get_whisper_client once
+    recording stops, so the first recording starts without waiting on it.
+    """
+    import sounddevice as sd
+    import numpy as np
+    return sd, np
+
+
+@functools.lru_cache(maxsize=1)
+def _opus_encoder():
+    """Return soundfile if it can write OGG/Opus, otherwise None (uploads fall back to WAV)."""
+    try:
+        import soundfile as sf
+        if 'OPUS' in sf.available_subtypes('OGG'):
+            return sf
+    except Exception as e:  # missing package or libsndfile without Opus
+        logger.debug(f"OGG/Opus encoding unavailable: {e}")
+    return None
+
+
+def _encode_audio(samples, sample_rate: int):
+    """Encode mono int16 samples in memory as an upload tuple for Whisper.
+    
+    Opus cuts the upload 10-20x versus 16 kHz WAV, which dominates latency on
+    slow links; WAV is used when soundfile/libsndfile lacks Opus support.
+    """
+    buffer = io.BytesIO()
+    sf = _opus_encoder()
+    if sf is not None:
+        try:
+            sf.write(buffer, samples, sample_rate, format='OGG', subtype='OPUS')
+            return ("audio.ogg", buffer.getvalue(), "audio/ogg")
+        except Exception as e:
+            logger.debug(f"Opus encode failed, sending WAV: {e}")
+            buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)  # int16
+        w.setframerate(sample_rate)
+        w.writeframes(samples.tobytes())
+    return ("audio.wav", buffer.getvalue(), "audio/wav")
+
+
+# faster-whisper model used for on-device transcription when installed
+LOCAL_WHISPER_MODEL = "tiny.en"
+
+_local_whisper = None
+_local_whisper_failed = False
+_local_whisper_lock = threading.Lock()
+
+
+def _get_local_whisper():
+    """Return the shared faster-whisper model, or None if it can't be used.
+    
+    Loaded lazily on the first recording (not at import) since it reads the
+    model from disk; a failed load is remembered so later recordings go
+    straight to OpenAI.
+    """
+    global _local_whisper, _local_whisper_failed
+    if _local_whisper is None and not _local_whisper_failed:
+        with _local_whisper_lock:
+            if _local_whisper is None and not _local_whisper_failed:
+                try:
+                    from faster_whisper import WhisperModel
+                    _local_whisper = WhisperModel(LOCAL_WHISPER_MODEL, device="auto", compute_type="int8")
+                    logger.info(f"Using local Whisper model: {LOCAL_WHISPER_MODEL}")
+                except Exception as e:
+                    logger.info(f"Local transcription unavailable, using OpenAI: {e}")
+                    _local_whisper_failed = True
+    return _local_whisper
+
+
+_whisper_client = None
+_whisper_client_key = None
+_whisper_client_lock = threading.Lock()  # Both voice inputs can transcribe at once
+
+
+def _get_whisper_client(api_key: str):
+    """Return a shared OpenAI client so the HTTP connection pool survives between recordings."""
+    global _whisper_client, _whisper_client_key
+    client = _whisper_client
+    if client is not None and _whisper_client_key == api_key:
+        return client
+    with _whisper_client_lock:
+        if _whisper_client is None or _whisper_client_key != api_key:
+            from openai import OpenAI
+            _whisper_client = OpenAI(api_key=api_key)
+            _whisper_client_key = api_key
+        return _whisper_client
+
+
 class PlanWorker(QThread):
     """Background worker for LLM planning - keeps UI responsive."""
     finished = Signal(object)  # plan dict or None
     error = Signal(str)
     
-    def __init__(self, instruction: str, files: list):
+    def __init__(self, instruction: str, files: list, use_cache: bool = True):
         super().__init__()
         self.instruction = instruction
         self.files = files
+        self.use_cache = use_cache
     
     def run(self):
         try:
-            plan = request_organization_plan(self.instruction, self.files)
+            plan = request_organization_plan(self.instruction, self.files, use_cache=self.use_cache)
             self.finished.emit(plan)
         except Exception as e:
             logger.error(f"Plan worker error: {e}")
@@ -86,77 +604,230 @@ class RefineWorker(QThread):
             self.error.emit(str(e))
 
 
+class ApplyMovesWorker(QThread):
+    """Background worker for moving files so the progress bar keeps updating."""
+    progress = Signal(int)
+    finished = Signal(bool, list, str, int)  # success, errors, log file, renamed count
+    
+    def __init__(self, move_plan: list):
+        super().__init__()
+        self.move_plan = move_plan
+    
+    def run(self):
+        try:
+            success, errors, log_file, renamed_count = apply_moves(
+                self.move_plan, on_progress=self.progress.emit
+            )
+        except Exception as e:
+            logger.error(f"Apply moves worker error: {e}")
+            success, errors, log_file, renamed_count = False, [str(e)], "", 0
+        # Cached plans describe where files were before this move
+        file_index.clear_plan_cache()
+        self.finished.emit(success, errors, log_file, renamed_count)
+
+
+class UndoMovesWorker(QThread):
+    """Background worker that moves organized files back to where they came from."""
+    progress = Signal(int)
+    finished = Signal(int, list)  # restored count, error messages
+    
+    def __init__(self, moves: list):
+        super().__init__()
+        self.moves = moves
+    
+    @staticmethod
+    def _restore(move: dict) -> str:
+        source = move["source"]
+        os.makedirs(os.path.dirname(source), exist_ok=True)
+        shutil.move(move["destination"], source)
+        return source
+    
+    def run(self):
+        restored = []
+        errors = []
+        # Moves are I/O-bound, so several in flight at once overlap their disk waits
+        with ThreadPoolExecutor(max_workers=_UNDO_MOVE_THREADS) as executor:
+            futures = {executor.submit(self._restore, move): move for move in self.moves}
+            for done, future in enumerate(as_completed(futures), 1):
+                move = futures[future]
+                try:
+                    restored.append((move["file_id"], future.result()))
+                    logger.info(f"Undo: {move['destination']} -> {move['source']}")
+                except Exception as e:
+                    errors.append(f"{os.path.basename(move['destination'])}: {e}")
+                    logger.error(f"Undo failed for {move['destination']}: {e}")
+                self.progress.emit(done)
+        
+        # Single writer: all index updates go through one transaction at the end
+        updated_ids = file_index.update_file_paths_bulk(restored)
+        if updated_ids is None:
+            for file_id, path in restored:
+                file_index.update_file_path(file_id, path)
+        file_index.clear_plan_cache()
+        
+        self.finished.emit(len(restored), errors)
+
+
+def _quiet_cut(samples, start: int, end: int, sample_rate: int) -> int:
+    """Pick a segment boundary in the quietest 50 ms of the last second before end.
+    
+    Cutting in a pause keeps words whole across transcription segments.
+    """
+    block = sample_rate // 20
+    search_start = max(start + block, end - sample_rate)
+    n_blocks = (end - search_start) // block
+    if n_blocks < 1:
+        return end
+    window = samples[end - n_blocks * block:end, 0].reshape(n_blocks, block)
+    loudness = abs(window.astype('int32')).mean(axis=1)
+    return end - (n_blocks - int(loudness.argmin())) * block
+
+
+def _trim_silence(samples, sample_rate: int, head: bool = True, tail: bool = True,
+                  min_seconds: float = 0.5, pad_seconds: float = 0.2):
+    """Cut leading (head) and/or trailing (tail) dead air from int16 samples before upload.
+    
+    Whisper latency and billing scale with duration. Loudness is a 100 ms
+    moving average of |x| (cumsum, so O(n)); the threshold adapts to the
+    noise floor. The input is returned unchanged if nothing clears the
+    threshold or the voiced part would be shorter than min_seconds.
+    """
+    if not (head or tail):
+        return samples
+    np = _voice_deps()[1]
+    window = sample_rate // 10
+    level = np.abs(samples.reshape(-1).astype(np.int32))
+    if len(level) <= window:
+        return samples
+    csum = np.cumsum(level, dtype=np.int64)
+    energy = (csum[window:] - csum[:-window]) // window
+    threshold = max(200, np.percentile(energy, 10) * 3)
+    voiced = np.flatnonzero(energy > threshold)
+    if not len(voiced):
+        return samples
+    pad = int(pad_seconds * sample_rate)
+    first = max(0, int(voiced[0]) - pad) if head else 0
+    last = min(len(level), int(voiced[-1]) + window + pad) if tail else len(level)
+    if last - first < min_seconds * sample_rate:
+        return samples
+    return samples[first:last]
+
+
 class VoiceRecordWorker(QThread):
-    """Background worker for voice recording and transcription."""
+    """Background worker for voice recording and transcription.
+    
+    Speech is sent to Whisper in segments while recording continues, so once
+    the user stops only the last segment is still waiting on the network.
+    """
     finished = Signal(str)  # transcribed text
+    partial = Signal(str)  # text of the segments transcribed so far
     error = Signal(str)
     recording_stopped = Signal()  # emitted when recording stops
     
+    # Shorter segments would hurt Whisper's accuracy; tails below the minimum
+    # are too short for the API and are folded into nothing
+    SEGMENT_SECONDS = 5
+    MIN_TAIL_SECONDS = 0.25
+    
     def __init__(self, duration: int = 30, sample_rate: int = 16000):
         super().__init__()
         self.duration = duration
         self.sample_rate = sample_rate
         self.is_recording = False
-        self.audio_data = []
+    
+    def _transcribe(self, samples, trim_head: bool = False, trim_tail: bool = False) -> str:
+        """Transcribe one segment, on-device if possible, else with OpenAI Whisper.
+        
+        Only the recording's own start and end are trimmed: inner segment edges
+        are already cut in a pause, and a segment's noise floor mid-speech is
+        too loud to trim against.
+        """
+        samples = _trim_silence(samples, self.sample_rate, head=trim_head, tail=trim_tail)
+        
+        # faster-whisper takes 16 kHz float32 audio directly - no encode or upload
+        model = _get_local_whisper() if settings.local_transcription and self.sample_rate == 16000 else None
+        if model is not None:
+            np = _voice_deps()[1]
+            audio = samples.reshape(-1).astype(np.float32) / 32768.0
+            segments, _info = model.transcribe(audio, language="en", vad_filter=True)
+            return " ".join(s.text.strip() for s in segments).strip()
+        
+        client = _get_whisper_client(settings.openai_api_key)
+        transcription = client.audio.transcriptions.create(
+            model="whisper-1",
+            file=_encode_audio(samples, self.sample_rate),
+            language="en"
+        )
+        return transcription.text.strip()
     
     def run(self):
         try:
-            import sounddevice as sd
-            import numpy as np
-            from scipy.io import wavfile
-            import tempfile
-            import os
-            from openai import OpenAI
-            from app.core.settings import settings
+            sd, np = _voice_deps()
             
             self.is_recording = True
-            self.audio_data = []
+            # Frames are written straight into one buffer sized for `duration`;
+            # it only grows (doubling) if the user keeps talking past that
+            buf = np.empty((self.duration * self.sample_rate, 1), dtype=np.int16)
+            write_pos = 0
             
             def audio_callback(indata, frames, time, status):
+                nonlocal buf, write_pos
                 if self.is_recording:
-                    self.audio_data.append(indata.copy())
+                    end = write_pos + frames
+                    if end > len(buf):
+                        grown = np.empty((max(end, 2 * len(buf)), 1), dtype=np.int16)
+                        grown[:write_pos] = buf[:write_pos]
+                        buf = grown
+                    buf[write_pos:end] = indata
+                    write_pos = end
             
-            # Start recording
-            with sd.InputStream(samplerate=self.sample_rate, channels=1, 
-                              dtype='int16', callback=audio_callback):
-                while self.is_recording:
-                    sd.sleep(100)  # Check every 100ms
+            segment_frames = self.SEGMENT_SECONDS * self.sample_rate
+            segment_start = 0
+            futures = []  # in dispatch order, which is transcript order
+            heard = []  # texts of the leading segments that have finished
             
-            self.recording_stopped.emit()
-            
-            if not self.audio_data:
-                self.error.emit("No audio recorded")
-                return
-            
-            # Combine audio chunks
-            audio = np.concatenate(self.audio_data, axis=0)
-            
-            # Save to temporary WAV file
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-                temp_path = f.name
-                wavfile.write(temp_path, self.sample_rate, audio)
-            
-            try:
-                # Transcribe with OpenAI Whisper
-                client = OpenAI(api_key=settings.openai_api_key)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Start recording. 100ms blocks match the polling below, so the
+                # Python callback runs ~10x/s instead of once per host buffer
+                with sd.InputStream(samplerate=self.sample_rate, channels=1, 
+                                  dtype='int16', blocksize=self.sample_rate // 10,
+                                  callback=audio_callback):
+                    while self.is_recording:
+                        sd.sleep(100)  # Check every 100ms
+                        
+                        end = write_pos
+                        if end - segment_start >= segment_frames:
+                            cut = _quiet_cut(buf, segment_start, end, self.sample_rate)
+                            futures.append(executor.submit(
+                                self._transcribe, buf[segment_start:cut].copy(), segment_start == 0
+                            ))
+                            segment_start = cut
+                        
+                        shown = len(heard)
+                        while len(heard) < len(futures) and futures[len(heard)].done() \
+                                and not futures[len(heard)].exception():
+                            heard.append(futures[len(heard)].result())
+                        if len(heard) > shown:
+                            self.partial.emit(" ".join(t for t in heard if t))
                 
-                with open(temp_path, 'rb') as audio_file:
-                    transcription = client.audio.transcriptions.create(
-                        model="whisper-1",
-                        file=audio_file,
-                        language="en"
-                    )
+                self.recording_stopped.emit()
                 
-                self.finished.emit(transcription.text)
-            finally:
-                # Clean up temp file
-                try:
-                    os.unlink(temp_path)
-                except:
-                    pass
+                if not write_pos:
+                    self.error.emit("No audio recorded")
+                    return
+                
+                # Only the tail is still to send; earlier segments are in flight or done
+                if not futures or write_pos - segment_start >= self.MIN_TAIL_SECONDS * self.sample_rate:
+                    futures.append(executor.submit(
+                        self._transcribe, buf[segment_start:write_pos], segment_start == 0, True
+                    ))
+                
+                texts = [f.result() for f in futures]
+            
+            self.finished.emit(" ".join(t for t in texts if t))
                     
         except ImportError as e:
-            self.error.emit(f"Missing audio library: {e}\nRun: pip install sounddevice scipy")
+            self.error.emit(f"Missing audio library: {e}\nRun: pip install sounddevice numpy")
         except Exception as e:
             logger.error(f"Voice recording error: {e}")
             self.error.emit(str(e))
@@ -166,95 +837,507 @@ class VoiceRecordWorker(QThread):
         self.is_recording = False
 
 
-class IndexBeforeOrganizeWorker(QThread):
-    """Background worker for indexing files before organizing."""
-    progress = Signal(int, int, str)  # current, total, message
-    finished = Signal(dict)  # stats dict
+class UsageRefreshWorker(QThread):
+    """Background worker that fetches the index-usage text without blocking the UI."""
+    finished = Signal(str)  # usage text
     error = Signal(str)
-    cancelled = Signal()  # Emitted when user cancels
     
-    def __init__(self, folder_path: Path):
+    def __init__(self, fetch_usage_text):
         super().__init__()
-        self.folder_path = folder_path
-        self._cancelled = False
+        self.fetch_usage_text = fetch_usage_text
     
-    def cancel(self):
-        """Request cancellation of the indexing operation."""
-        self._cancelled = True
+    def run(self):
+        try:
+            self.finished.emit(self.fetch_usage_text())
+        except Exception as e:
+            logger.debug(f"Usage refresh error: {e}")
+            self.error.emit(str(e))
+
+
+# Existing-file scans stop once this many items are seen; the caller mainly
+# needs to know whether a watched folder already has content, and shows "2000+".
+_EXISTING_SCAN_LIMIT = 2000
+
+# Top-level subfolders of the destination walked at once during path verification.
+_DEST_SCAN_THREADS = 8
+
+# Files moved back at once when undoing an organization.
+_UNDO_MOVE_THREADS = 8
+
+
+def _count_existing_items(folders: List[str], limit: Optional[int] = _EXISTING_SCAN_LIMIT):
+    """Count files and visible subfolders (one level deep) in the given folders.
     
-    def is_cancelled(self):
-        """Check if cancellation was requested."""
-        return self._cancelled
+    Uses os.scandir so file/dir checks come from the directory listing instead
+    of an extra stat per entry. Stops early once limit items have been counted
+    (pass limit=None for exact counts).
+    
+    Returns:
+        Tuple of (existing_count, subfolder_count, truncated), where truncated
+        means the limit was hit and the counts are lower bounds
+    """
+    existing_count = 0
+    subfolder_count = 0
+    for folder in folders:
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if entry.is_file(follow_symlinks=False):
+                        existing_count += 1
+                    elif entry.is_dir(follow_symlinks=False) and entry.name[:1] != '.':
+                        # Count files in subfolders too
+                        subfolder_count += 1
+                        try:
+                            with os.scandir(entry.path) as sub:
+                                existing_count += sum(1 for se in sub if se.is_file(follow_symlinks=False))
+                        except OSError:
+                            pass
+                    if limit is not None and existing_count + subfolder_count >= limit:
+                        return existing_count, subfolder_count, True
+        except OSError:
+            pass
+    return existing_count, subfolder_count, False
+
+
+def _count_files(folder) -> int:
+    """Count the regular files directly inside folder (no recursion)."""
+    with os.scandir(folder) as it:
+        return sum(1 for entry in it if entry.is_file())
+
+
+def _iter_files(root, dir_mtimes: Optional[list] = None):
+    """Yield a DirEntry for every file under root, like os.walk without symlinked dirs.
+    
+    Unreadable subfolders are skipped, matching os.walk's default. If dir_mtimes is
+    given, (path, st_mtime_ns) of every subfolder is appended to it on the way.
+    """
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if dir_mtimes is not None:
+                            dir_mtimes.append((entry.path, entry.stat(follow_symlinks=False).st_mtime_ns))
+                        yield from _iter_files(entry.path, dir_mtimes)
+                    elif entry.is_file():
+                        yield entry
+                except OSError:
+                    continue
+    except OSError:
+        return
+
+
+def _iter_dir_mtimes(root):
+    """Yield (path, st_mtime_ns) for every subfolder under root, like _iter_files but folders only."""
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield entry.path, entry.stat(follow_symlinks=False).st_mtime_ns
+                        yield from _iter_dir_mtimes(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        return
+
+
+def _tree_fingerprint(root_mtime_ns: int, dir_mtimes, indexed_paths=()) -> str:
+    """Digest of a folder tree's directory mtimes and the paths indexed under it.
+    
+    A folder's mtime changes whenever an entry is added, removed or renamed in it,
+    so this changes whenever a file appears or disappears anywhere in the tree.
+    """
+    digest = hashlib.blake2b(str(root_mtime_ns).encode(), digest_size=16)
+    for path, mtime_ns in sorted(dir_mtimes):
+        digest.update(f"\0{path}\0{mtime_ns}".encode("utf-8", "surrogatepass"))
+    digest.update(b"\1")
+    for path in sorted(indexed_paths):
+        digest.update(f"\0{path}".encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+# Folders never descended into when looking for empty folders (hidden ones are skipped too).
+# They still count as content, so their parents are never reported as empty.
+_EMPTY_SCAN_SKIP_DIRS = frozenset({
+    '__pycache__', 'node_modules', '$RECYCLE.BIN', 'System Volume Information',
+})
+
+
+def _collect_empty_dirs(root, found: list) -> bool:
+    """Append every empty directory under root to found, deepest first.
+    
+    Returns True if root itself is empty. Symlinked dirs count as content and are not followed.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError as e:
+        logger.debug(f"Could not check folder {root}: {e}")
+        return False
+    for entry in entries:
+        name = entry.name
+        if name.startswith('.') or name in _EMPTY_SCAN_SKIP_DIRS:
+            continue
+        try:
+            if entry.is_dir(follow_symlinks=False) and _collect_empty_dirs(entry.path, found):
+                found.append(entry.path)
+        except OSError:
+            continue
+    return not entries
+
+
+class ExistingFilesScanWorker(QThread):
+    """Background worker that counts files already present in the watched folders."""
+    finished = Signal(int, int, bool)  # existing_count, subfolder_count, truncated
+    
+    def __init__(self, folders: List[str]):
+        super().__init__()
+        self.folders = folders
+    
+    def run(self):
+        self.finished.emit(*_count_existing_items(self.folders))
+
+
+class HistoryLoadWorker(QThread):
+    """Background worker that reads the move logs for the history dialog."""
+    finished = Signal(list)  # most recent first, at most 20
     
     def run(self):
+        from app.core.apply import get_move_history
         try:
-            from app.core.search import SearchService
-            
-            search_service = SearchService()
-            
-            def progress_callback(current, total, message):
-                if self._cancelled:
-                    raise InterruptedError("Indexing cancelled by user")
-                self.progress.emit(current, total, message)
-            
-            stats = search_service.index_directory(
-                self.folder_path,
-                recursive=False,  # Only top-level files
-                progress_cb=progress_callback
-            )
-            
-            if self._cancelled:
-                self.cancelled.emit()
-            else:
-                self.finished.emit(stats)
-            
-        except InterruptedError:
-            self.cancelled.emit()
+            history = get_move_history()[:20]
         except Exception as e:
-            if self._cancelled:
-                self.cancelled.emit()
-            else:
-                logger.error(f"Index before organize error: {e}")
-                self.error.emit(str(e))
+            logger.error(f"History load error: {e}")
+            history = []
+        self.finished.emit(history)
 
 
-class IndexProgressDialog(QDialog):
-    """Modal progress dialog for indexing with Cancel/Skip options."""
+class MoveLogLoadWorker(QThread):
+    """Background worker that parses one move log for the details view."""
+    finished = Signal(dict)
+    error = Signal(str)
     
-    # Signals for the result
-    skip_requested = Signal()  # User wants to skip indexing
+    def __init__(self, log_file: str):
+        super().__init__()
+        self.log_file = log_file
     
-    def __init__(self, folder_name: str, total_files: int, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Indexing Files")
-        self.setMinimumSize(480, 280)
-        self.setModal(True)
-        self._drag_pos = None
-        self.total_files = total_files
-        self.current_file = 0
-        self._result = None  # 'cancel', 'skip', or None (completed)
+    def run(self):
+        try:
+            with open(self.log_file, 'r', encoding='utf-8') as f:
+                self.finished.emit(json.load(f))
+        except Exception as e:
+            logger.error(f"Move log load error: {e}")
+            self.error.emit(str(e))
+
+
+class PathVerifyWorker(QThread):
+    """Background worker that checks indexed paths and relocates moved files.
+    
+    For each file:
+    1. Check if it exists at the recorded path
+    2. If not, search for it by name in the destination folder
+    3. Try partial matching for renamed files (Windows adds (1), (2) etc)
+    4. If found elsewhere, update the database path
+    5. If not found anywhere, drop it from the list
+    
+    The same walk reports files in the destination that aren't indexed yet.
+    """
+    progress = Signal(int, int)  # current, total
+    finished = Signal(list, int, int, list)  # verified files, updated_count, removed_count, unindexed paths
+    
+    def __init__(self, files: List[Dict[str, Any]], destination_path: Path,
+                 last_fingerprint: Optional[str] = None, cached_names: Optional[set] = None):
+        super().__init__()
+        self.files = files
+        self.destination_path = destination_path
+        # Destination tree fingerprint after the last clean run (persisted) and this session's listing
+        self.last_fingerprint = last_fingerprint
+        self.cached_names = cached_names
+        self.mtime_ns: Optional[int] = None
+        # Fingerprint of the tree as this run saw it, or None if it couldn't be taken
+        self.fingerprint: Optional[str] = None
+        # normcase'd names directly inside the destination, or None if the scan failed
+        self.top_level_names: Optional[set] = set()
+    
+    def _can_skip_scan(self) -> bool:
+        """True if no folder in the destination tree changed and every recorded path still exists."""
+        try:
+            self.mtime_ns = os.stat(self.destination_path).st_mtime_ns
+        except OSError:
+            return False
+        if self.last_fingerprint is None:
+            return False
+        # Walks folders only; still far cheaper than listing and matching every file
+        fingerprint = _tree_fingerprint(
+            self.mtime_ns, _iter_dir_mtimes(str(self.destination_path)), self._indexed_paths()
+        )
+        if fingerprint != self.last_fingerprint:
+            return False
+        self.fingerprint = fingerprint
+        # Any missing file still needs the full walk to find where it went
+        return all(os.path.exists(f.get("file_path", "")) for f in self.files)
+    
+    def _indexed_paths(self):
+        """Recorded paths of the files being verified."""
+        return (f.get("file_path", "") for f in self.files)
+    
+    def _scan_destination(self):
+        """Yield every file under the destination, noting top-level names on the way.
         
-        # Remove default window frame for custom styling
-        self.setWindowFlags(self.windowFlags() | Qt.FramelessWindowHint)
-        self.setAttribute(Qt.WA_TranslucentBackground)
+        Top-level subfolders are walked in parallel; scandir releases the GIL, so
+        directory round trips overlap on network and USB drives.
+        """
+        subdirs = []
+        dir_mtimes = []
+        with os.scandir(str(self.destination_path)) as it:
+            for entry in it:
+                self.top_level_names.add(os.path.normcase(entry.name))
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dir_mtimes.append((entry.path, entry.stat(follow_symlinks=False).st_mtime_ns))
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+                except OSError:
+                    continue
         
-        self._setup_ui(folder_name)
+        if len(subdirs) < 2:
+            for path in subdirs:
+                yield from _iter_files(path, dir_mtimes)
+        else:
+            def walk(path):
+                # Each thread collects into its own list, merged below
+                sub_mtimes = []
+                return list(_iter_files(path, sub_mtimes)), sub_mtimes
+            
+            with ThreadPoolExecutor(max_workers=min(_DEST_SCAN_THREADS, len(subdirs))) as executor:
+                for entries, sub_mtimes in executor.map(walk, subdirs):
+                    dir_mtimes.extend(sub_mtimes)
+                    yield from entries
+        
+        if self.mtime_ns is not None:
+            self.fingerprint = _tree_fingerprint(self.mtime_ns, dir_mtimes, self._indexed_paths())
     
-    def _setup_ui(self, folder_name: str):
-        """Setup the dialog UI."""
-        from app.ui.theme_manager import get_theme_colors
-        c = get_theme_colors()
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(0, 0, 0, 0)
+    def run(self):
+        if self._can_skip_scan():
+            logger.info(f"Destination unchanged since last verification, skipped scan of {self.destination_path}")
+            self.top_level_names = self.cached_names
+            # Only runs that walked the tree and found no unindexed files are recorded,
+            # and neither the folders nor the index changed since, so none can exist now
+            self.finished.emit(list(self.files), 0, 0, [])
+            return
         
-        # Container with styled background
-        container = QFrame()
-        container.setObjectName("progressContainer")
-        container.setStyleSheet(f"""
-            QFrame#progressContainer {{
-                background-color: {c['surface']};
-                border-radius: 16px;
-                border: 1px solid rgba(124, 77, 255, 0.25);
+        verified_files = []
+        updated_count = 0
+        removed_count = 0
+        
+        # Build maps of all files in the destination folder for quick lookup
+        existing_files = defaultdict(list)  # exact filename -> [paths]
+        files_by_ext = defaultdict(list)  # extension -> [(filename_lower, full_path), ...] for partial matching
+        dest_paths = set()  # every path seen, so most recorded paths skip a stat
+        try:
+            for entry in self._scan_destination():
+                full_path = entry.path
+                # Store by filename (lowercase for case-insensitive matching)
+                key = entry.name.lower()
+                existing_files[key].append(full_path)
+                files_by_ext[os.path.splitext(key)[1]].append((key, full_path))
+                dest_paths.add(full_path)
+        except Exception as e:
+            logger.warning(f"Error scanning destination folder: {e}")
+            self.top_level_names = None
+            self.fingerprint = None
+        
+        logger.info(f"Scanned {len(dest_paths)} files in destination folder")
+        
+        # Paths already claimed by a verified file, so a partial match isn't reused
+        assigned_paths = set()
+        # Moved files, written to the database in one transaction after the loop
+        pending_updates = []  # [(file_dict, new_path), ...]
+        
+        total = len(self.files)
+        for i, f in enumerate(self.files, 1):
+            if i % 200 == 0:
+                self.progress.emit(i, total)
+            file_path = f.get("file_path", "")
+            file_name = f.get("file_name", "")
+            
+            # Check if file exists at recorded path
+            if file_path in dest_paths or os.path.exists(file_path):
+                verified_files.append(f)
+                assigned_paths.add(file_path)
+                continue
+            
+            # File not at recorded path - try to find it
+            logger.info(f"File not found at recorded path: {file_path}")
+            
+            # Search by exact filename in destination folder
+            key = file_name.lower()
+            candidates = existing_files.get(key)
+            
+            new_path = None
+            
+            if candidates:
+                # Found file(s) with exact same name
+                new_path = candidates[0]
+                candidates.pop(0)
+            else:
+                # Try partial matching - look for files that start with same base name
+                # This handles Windows renaming like "file.png" -> "file (1).png"
+                base_name, extension = os.path.splitext(key)
+                # Without an extension every name "ends with" it, so search everything
+                pool = files_by_ext.get(extension, ()) if extension else itertools.chain.from_iterable(files_by_ext.values())
+                
+                for existing_name, existing_path in pool:
+                    # Bucketed by extension already, so only the base-name prefix needs checking
+                    if existing_name.startswith(base_name):
+                        # Make sure it's not already matched to another file
+                        if existing_path not in assigned_paths:
+                            new_path = existing_path
+                            logger.info(f"Partial match: {file_name} -> {os.path.basename(existing_path)}")
+                            break
+            
+            if new_path:
+                logger.info(f"Found moved file: {file_name} -> {new_path}")
+                
+                # Assume the database update succeeds; checked after the loop
+                verified_files.append(f)
+                assigned_paths.add(new_path)
+                pending_updates.append((f, new_path))
+            else:
+                # File not found anywhere - skip it
+                logger.info(f"File no longer exists, skipping: {file_name}")
+                removed_count += 1
+        
+        if pending_updates:
+            updated_ids = file_index.update_file_paths_bulk(
+                [(f.get("id"), new_path) for f, new_path in pending_updates]
+            )
+            failed = []
+            for f, new_path in pending_updates:
+                # Fall back to per-file updates only if the batch itself failed
+                ok = f.get("id") in updated_ids if updated_ids is not None else file_index.update_file_path(f.get("id"), new_path)
+                if ok:
+                    f["file_path"] = new_path
+                    updated_count += 1
+                else:
+                    logger.warning(f"Failed to update path in database for {f.get('file_name', '')}")
+                    failed.append(f)
+            if failed:
+                failed_ids = {id(f) for f in failed}
+                verified_files = [f for f in verified_files if id(f) not in failed_ids]
+                removed_count += len(failed)
+        
+        if updated_count > 0 or removed_count > 0:
+            logger.info(f"Path verification: {updated_count} updated, {removed_count} removed, {len(verified_files)} verified")
+        
+        self.finished.emit(verified_files, updated_count, removed_count, self._unindexed_paths(dest_paths))
+    
+    def _unindexed_paths(self, dest_paths: set) -> List[str]:
+        """Paths seen in the destination that no indexed file points at."""
+        if self.top_level_names is None:
+            return []  # Scan failed; don't report a partial listing as new files
+        
+        # self.files holds every indexed, non-excluded file under the destination,
+        # with paths already updated for files found elsewhere above
+        indexed_paths = {os.path.normpath(f.get("file_path", "")).lower() for f in self.files}
+        should_exclude = settings.should_exclude
+        return [
+            path for path in dest_paths
+            if os.path.normpath(path).lower() not in indexed_paths and not should_exclude(path)
+        ]
+
+
+class IndexBeforeOrganizeWorker(QThread):
+    """Background worker for indexing files before organizing."""
+    progress = Signal(int, int, str)  # current, total, message
+    finished = Signal(dict)  # stats dict
+    error = Signal(str)
+    cancelled = Signal()  # Emitted when user cancels
+    
+    def __init__(self, folder_path: Path):
+        super().__init__()
+        self.folder_path = folder_path
+        self._cancelled = False
+    
+    def cancel(self):
+        """Request cancellation of the indexing operation."""
+        self._cancelled = True
+    
+    def is_cancelled(self):
+        """Check if cancellation was requested."""
+        return self._cancelled
+    
+    def run(self):
+        try:
+            from app.core.search import SearchService
+            
+            search_service = SearchService()
+            
+            def progress_callback(current, total, message):
+                if self._cancelled:
+                    raise InterruptedError("Indexing cancelled by user")
+                self.progress.emit(current, total, message)
+            
+            stats = search_service.index_directory(
+                self.folder_path,
+                recursive=False,  # Only top-level files
+                progress_cb=progress_callback
+            )
+            
+            if self._cancelled:
+                self.cancelled.emit()
+            else:
+                self.finished.emit(stats)
+            
+        except InterruptedError:
+            self.cancelled.emit()
+        except Exception as e:
+            if self._cancelled:
+                self.cancelled.emit()
+            else:
+                logger.error(f"Index before organize error: {e}")
+                self.error.emit(str(e))
+
+
+class IndexProgressDialog(QDialog):
+    """Modal progress dialog for indexing with Cancel/Skip options."""
+    
+    # Signals for the result
+    skip_requested = Signal()  # User wants to skip indexing
+    
+    def __init__(self, folder_name: str, total_files: int, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Indexing Files")
+        self.setMinimumSize(480, 280)
+        self.setModal(True)
+        self._drag_pos = None
+        self.total_files = total_files
+        self.current_file = 0
+        self._result = None  # 'cancel', 'skip', or None (completed)
+        
+        # Remove default window frame for custom styling
+        self.setWindowFlags(self.windowFlags() | Qt.FramelessWindowHint)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        
+        self._setup_ui(folder_name)
+    
+    def _setup_ui(self, folder_name: str):
+        """Setup the dialog UI."""
+        from app.ui.theme_manager import get_theme_colors
+        c = get_theme_colors()
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Container with styled background
+        container = QFrame()
+        container.setObjectName("progressContainer")
+        container.setStyleSheet(f"""
+            QFrame#progressContainer {{
+                background-color: {c['surface']};
+                border-radius: 16px;
+                border: 1px solid rgba(124, 77, 255, 0.25);
             }}
         """)
         
@@ -434,6 +1517,134 @@ class IndexProgressDialog(QDialog):
             event.accept()
 
 
+class _DragMover(QObject):
+    """Throttles drag moves of a frameless dialog to about one per frame.
+    
+    Moving a translucent window re-renders its drop shadow, and high-rate mice
+    send far more move events than the screen can show.
+    """
+    
+    def __init__(self, window: QWidget, interval_ms: int = 16):
+        super().__init__(window)
+        self._window = window
+        self._pending = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._apply_pending)
+    
+    def move_to(self, pos):
+        """Move now if idle, otherwise keep only the latest position for the next frame."""
+        if self._timer.isActive():
+            self._pending = pos
+        else:
+            self._window.move(pos)
+            self._timer.start()
+    
+    def flush(self):
+        """Apply any held-back position right away (end of drag)."""
+        self._timer.stop()
+        self._apply_pending()
+    
+    def _apply_pending(self):
+        if self._pending is not None:
+            self._window.move(self._pending)
+            self._pending = None
+            self._timer.start()
+
+
+@functools.lru_cache(maxsize=None)
+def _shadow_nine_slice(blur: int, y_offset: int, alpha: int, radius: int = 24, margin: int = 20):
+    """Render a rounded-container drop shadow once, for nine-slice painting.
+    
+    QGraphicsDropShadowEffect re-blurs the whole container on every repaint;
+    this runs the same effect a single time on a small square and keeps only
+    the shadow (the container paints its own fill over the centre).
+    """
+    from PySide6.QtWidgets import QGraphicsScene
+    from PySide6.QtGui import QColor, QImage, QPainter, QPainterPath, QPixmap
+    from PySide6.QtCore import QRectF
+    
+    side = 2 * (radius + blur) + 2  # leaves a 2px flat strip for the stretched middle
+    size = side + 2 * margin
+    path = QPainterPath()
+    path.addRoundedRect(QRectF(margin, margin, side, side), radius, radius)
+    
+    scene = QGraphicsScene(0, 0, size, size)
+    item = scene.addPath(path, Qt.NoPen, QColor(0, 0, 0))
+    shadow = QGraphicsDropShadowEffect()
+    shadow.setBlurRadius(blur)
+    shadow.setXOffset(0)
+    shadow.setYOffset(y_offset)
+    shadow.setColor(QColor(0, 0, 0, alpha))
+    item.setGraphicsEffect(shadow)
+    
+    image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    scene.render(painter, QRectF(0, 0, size, size), QRectF(0, 0, size, size))
+    painter.setCompositionMode(QPainter.CompositionMode_Clear)
+    painter.fillPath(path, QColor(0, 0, 0))
+    painter.end()
+    return QPixmap.fromImage(image)
+
+
+@functools.lru_cache(maxsize=None)
+def _emoji_pixmap(emoji: str, font_px: int, dpr: float):
+    """Render an emoji glyph once so dialog headers can reuse it as a pixmap.
+    
+    Colour-emoji glyphs go through text shaping and font fallback on each new
+    label; a cached pixmap is a plain blit. The label's QSS still draws the
+    rounded background and border.
+    """
+    from PySide6.QtGui import QFont, QImage, QPainter, QPixmap
+    from PySide6.QtCore import QRect
+    
+    side = int(font_px * 1.5)
+    image = QImage(int(side * dpr), int(side * dpr), QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(dpr)
+    image.fill(Qt.transparent)
+    font = QFont(QApplication.font())
+    font.setPixelSize(font_px)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.TextAntialiasing)
+    painter.setFont(font)
+    painter.drawText(QRect(0, 0, side, side), Qt.AlignCenter, emoji)  # logical coordinates
+    painter.end()
+    return QPixmap.fromImage(image)
+
+
+def _set_emoji_icon(label: QLabel, emoji: str, font_px: int):
+    """Show emoji on label via the shared pixmap cache."""
+    screen = label.screen() or QApplication.primaryScreen()
+    label.setPixmap(_emoji_pixmap(emoji, font_px, screen.devicePixelRatio() if screen else 1.0))
+
+
+def _paint_drop_shadow(widget: QWidget, target, blur: int, y_offset: int, alpha: int, margin: int = 20):
+    """Paint the cached shadow around target (a child's geometry) as nine slices."""
+    from PySide6.QtGui import QPainter
+    from PySide6.QtCore import QRect
+    
+    pixmap = _shadow_nine_slice(blur, y_offset, alpha, margin=margin)
+    corner = (pixmap.width() - 2) // 2
+    middle = pixmap.width() - 2 * corner
+    outer = target.adjusted(-margin, -margin, margin, margin)
+    if outer.width() < 2 * corner or outer.height() < 2 * corner:
+        return
+    
+    src = [(0, corner), (corner, middle), (corner + middle, corner)]
+    dst_x = [(outer.left(), corner), (outer.left() + corner, outer.width() - 2 * corner),
+             (outer.right() + 1 - corner, corner)]
+    dst_y = [(outer.top(), corner), (outer.top() + corner, outer.height() - 2 * corner),
+             (outer.bottom() + 1 - corner, corner)]
+    painter = QPainter(widget)
+    for (sy, sh), (dy, dh) in zip(src, dst_y):
+        for (sx, sw), (dx, dw) in zip(src, dst_x):
+            painter.drawPixmap(QRect(dx, dy, dw, dh), pixmap, QRect(sx, sy, sw, sh))
+    painter.end()
+
+
 class EmptyFolderDialog(QDialog):
     """Modern dialog to let user choose which empty folders to delete."""
     
@@ -443,6 +1654,7 @@ class EmptyFolderDialog(QDialog):
         self.setMinimumSize(520, 400)
         self.setModal(True)
         self._drag_pos = None
+        self._drag_mover = _DragMover(self)
         
         self.empty_folders = empty_folders
         self.folders_to_delete = []
@@ -464,16 +1676,6 @@ class EmptyFolderDialog(QDialog):
             }}
         """)
         
-        # Add drop shadow
-        from PySide6.QtWidgets import QGraphicsDropShadowEffect
-        from PySide6.QtGui import QColor
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(30)
-        shadow.setXOffset(0)
-        shadow.setYOffset(5)
-        shadow.setColor(QColor(0, 0, 0, 50))
-        self.container.setGraphicsEffect(shadow)
-        
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(20, 20, 20, 20)
         main_layout.addWidget(self.container)
@@ -486,9 +1688,9 @@ class EmptyFolderDialog(QDialog):
         header_layout = QHBoxLayout()
         header_layout.setSpacing(14)
         
-        icon_label = QLabel("🗑️")
+        icon_label = QLabel()
+        _set_emoji_icon(icon_label, "🗑️", 24)
         icon_label.setStyleSheet("""
-            font-size: 24px;
             background-color: rgba(255, 152, 0, 0.08);
             border-radius: 20px;
             border: 1px solid rgba(255, 152, 0, 0.20);
@@ -571,19 +1773,18 @@ class EmptyFolderDialog(QDialog):
             }}
         """)
         
+        # (item, path) pairs, so the buttons below don't re-query the widget row by row
+        self._items = []
+        checkable = QListWidgetItem().flags() | Qt.ItemIsUserCheckable
         for folder_path in empty_folders:
             # Show just the folder name with path hint
-            from pathlib import Path
-            folder = Path(folder_path)
-            display_text = f"📁 {folder.name}"
-            
-            item = QListWidgetItem()
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item = QListWidgetItem(f"📁 {os.path.basename(folder_path)}")
+            item.setFlags(checkable)
             item.setCheckState(Qt.Checked)  # Default to checked
-            item.setText(display_text)
             item.setToolTip(folder_path)  # Full path on hover
             item.setData(Qt.UserRole, folder_path)
             self.folder_list.addItem(item)
+            self._items.append((item, folder_path))
         
         layout.addWidget(self.folder_list, 1)
         
@@ -686,25 +1887,27 @@ class EmptyFolderDialog(QDialog):
         
         layout.addLayout(button_layout)
     
+    def _set_all_checked(self, state):
+        # One repaint for the whole list instead of one per item
+        self.folder_list.setUpdatesEnabled(False)
+        try:
+            for item, _ in self._items:
+                item.setCheckState(state)
+        finally:
+            self.folder_list.setUpdatesEnabled(True)
+    
     def _select_all(self):
-        for i in range(self.folder_list.count()):
-            self.folder_list.item(i).setCheckState(Qt.Checked)
+        self._set_all_checked(Qt.Checked)
     
     def _deselect_all(self):
-        for i in range(self.folder_list.count()):
-            self.folder_list.item(i).setCheckState(Qt.Unchecked)
+        self._set_all_checked(Qt.Unchecked)
     
     def _delete_selected(self):
-        self.folders_to_delete = []
-        for i in range(self.folder_list.count()):
-            item = self.folder_list.item(i)
-            if item.checkState() == Qt.Checked:
-                self.folders_to_delete.append(item.data(Qt.UserRole))
+        self.folders_to_delete = [path for item, path in self._items if item.checkState() == Qt.Checked]
         self.accept()
     
     def _delete_all(self):
-        self.folders_to_delete = [item.data(Qt.UserRole) for i in range(self.folder_list.count())
-                                   for item in [self.folder_list.item(i)]]
+        self.folders_to_delete = [path for _, path in self._items]
         self.accept()
     
     def get_folders_to_delete(self) -> list:
@@ -717,12 +1920,17 @@ class EmptyFolderDialog(QDialog):
     
     def mouseMoveEvent(self, event):
         if self._drag_pos is not None and event.buttons() == Qt.LeftButton:
-            self.move(event.globalPosition().toPoint() - self._drag_pos)
+            self._drag_mover.move_to(event.globalPosition().toPoint() - self._drag_pos)
             event.accept()
     
     def mouseReleaseEvent(self, event):
         self._drag_pos = None
+        self._drag_mover.flush()
         event.accept()
+    
+    def paintEvent(self, event):
+        """Draw the cached drop shadow around the container."""
+        _paint_drop_shadow(self, self.container.geometry(), 30, 5, 50)
 
 
 class ModernConfirmDialog(QDialog):
@@ -740,6 +1948,7 @@ class ModernConfirmDialog(QDialog):
         self.setModal(True)
         self.result_accepted = False
         self._drag_pos = None
+        self._drag_mover = _DragMover(self)
         
         # Get theme colors
         from app.ui.theme_manager import get_theme_colors
@@ -760,16 +1969,6 @@ class ModernConfirmDialog(QDialog):
             }}
         """)
         
-        # Add subtle drop shadow effect
-        from PySide6.QtWidgets import QGraphicsDropShadowEffect
-        from PySide6.QtGui import QColor
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(25)
-        shadow.setXOffset(0)
-        shadow.setYOffset(4)
-        shadow.setColor(QColor(0, 0, 0, 40))
-        self.container.setGraphicsEffect(shadow)
-        
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(20, 20, 20, 20)  # Space for shadow
         main_layout.addWidget(self.container)
@@ -783,9 +1982,9 @@ class ModernConfirmDialog(QDialog):
         header_layout.setSpacing(16)
         
         # Clean icon background
-        icon_label = QLabel("✨")
+        icon_label = QLabel()
+        _set_emoji_icon(icon_label, "✨", 26)
         icon_label.setStyleSheet("""
-            font-size: 26px;
             background-color: rgba(124, 77, 255, 0.08);
             border-radius: 22px;
             border: 1px solid rgba(124, 77, 255, 0.20);
@@ -809,22 +2008,7 @@ class ModernConfirmDialog(QDialog):
         close_btn = QPushButton("X")
         close_btn.setFixedSize(36, 36)
         close_btn.setCursor(Qt.PointingHandCursor)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #7C4DFF;
-                color: white;
-                border: none;
-                border-radius: 18px;
-                font-size: 20px;
-                font-weight: bold;
-                font-family: Arial, Helvetica, sans-serif;
-                padding: 0px;
-                margin: 0px;
-            }
-            QPushButton:hover {
-                background-color: #5E35B1;
-            }
-        """)
+        close_btn.setStyleSheet(_QSS_CLOSE_BUTTON)
         close_btn.clicked.connect(self.reject)
         header_layout.addWidget(close_btn)
         
@@ -862,6 +2046,13 @@ class ModernConfirmDialog(QDialog):
             details_layout.setContentsMargins(20, 16, 20, 16)
             details_layout.setSpacing(12)
             
+            # Same style for every row, so format it once
+            detail_qss = f"""
+                font-family: "Segoe UI", sans-serif;
+                font-size: 14px;
+                color: {c['text']};
+                font-weight: 500;
+            """
             for detail in details:
                 detail_row = QHBoxLayout()
                 detail_row.setSpacing(12)
@@ -873,12 +2064,7 @@ class ModernConfirmDialog(QDialog):
                 detail_row.addWidget(dot)
                 
                 detail_label = QLabel(detail)
-                detail_label.setStyleSheet(f"""
-                    font-family: "Segoe UI", sans-serif;
-                    font-size: 14px;
-                    color: {c['text']};
-                    font-weight: 500;
-                """)
+                detail_label.setStyleSheet(detail_qss)
                 detail_row.addWidget(detail_label)
                 detail_row.addStretch()
                 
@@ -975,14 +2161,19 @@ class ModernConfirmDialog(QDialog):
     def mouseMoveEvent(self, event):
         """Handle drag movement."""
         if self._drag_pos is not None and event.buttons() == Qt.LeftButton:
-            self.move(event.globalPosition().toPoint() - self._drag_pos)
+            self._drag_mover.move_to(event.globalPosition().toPoint() - self._drag_pos)
             event.accept()
     
     def mouseReleaseEvent(self, event):
         """End dragging."""
         self._drag_pos = None
+        self._drag_mover.flush()
         event.accept()
     
+    def paintEvent(self, event):
+        """Draw the cached drop shadow around the container."""
+        _paint_drop_shadow(self, self.container.geometry(), 25, 4, 40)
+    
     def accept(self):
         self.result_accepted = True
         super().accept()
@@ -1013,6 +2204,7 @@ class ModernInfoDialog(QDialog):
         self.setMinimumWidth(480)
         self.setModal(True)
         self._drag_pos = None
+        self._drag_mover = _DragMover(self)
         
         # Get theme colors
         from app.ui.theme_manager import get_theme_colors
@@ -1033,16 +2225,6 @@ class ModernInfoDialog(QDialog):
             }}
         """)
         
-        # Add subtle drop shadow effect
-        from PySide6.QtWidgets import QGraphicsDropShadowEffect
-        from PySide6.QtGui import QColor
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(25)
-        shadow.setXOffset(0)
-        shadow.setYOffset(4)
-        shadow.setColor(QColor(0, 0, 0, 40))
-        self.container.setGraphicsEffect(shadow)
-        
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(20, 20, 20, 20)
         main_layout.addWidget(self.container)
@@ -1058,9 +2240,9 @@ class ModernInfoDialog(QDialog):
         # Icon with appropriate color
         icon_bg = "rgba(255, 152, 0, 0.08)" if is_warning else "rgba(124, 77, 255, 0.08)"
         icon_border = "rgba(255, 152, 0, 0.20)" if is_warning else "rgba(124, 77, 255, 0.20)"
-        icon_label = QLabel(icon)
+        icon_label = QLabel()
+        _set_emoji_icon(icon_label, icon, 24)
         icon_label.setStyleSheet(f"""
-            font-size: 24px;
             background-color: {icon_bg};
             border-radius: 22px;
             border: 2px solid {icon_border};
@@ -1084,22 +2266,7 @@ class ModernInfoDialog(QDialog):
         close_btn = QPushButton("X")
         close_btn.setFixedSize(36, 36)
         close_btn.setCursor(Qt.PointingHandCursor)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #7C4DFF;
-                color: white;
-                border: none;
-                border-radius: 18px;
-                font-size: 20px;
-                font-weight: bold;
-                font-family: Arial, Helvetica, sans-serif;
-                padding: 0px;
-                margin: 0px;
-            }
-            QPushButton:hover {
-                background-color: #5E35B1;
-            }
-        """)
+        close_btn.setStyleSheet(_QSS_CLOSE_BUTTON)
         close_btn.clicked.connect(self.accept)
         header_layout.addWidget(close_btn)
         
@@ -1137,6 +2304,12 @@ class ModernInfoDialog(QDialog):
             details_layout.setContentsMargins(18, 14, 18, 14)
             details_layout.setSpacing(10)
             
+            # Same style for every row, so format it once
+            detail_qss = f"""
+                font-family: "Segoe UI", sans-serif;
+                font-size: 14px;
+                color: {c['text_muted']};
+            """
             for detail in details:
                 detail_row = QHBoxLayout()
                 detail_row.setSpacing(10)
@@ -1148,11 +2321,7 @@ class ModernInfoDialog(QDialog):
                 
                 detail_label = QLabel(detail)
                 detail_label.setWordWrap(True)
-                detail_label.setStyleSheet(f"""
-                    font-family: "Segoe UI", sans-serif;
-                    font-size: 14px;
-                    color: {c['text_muted']};
-                """)
+                detail_label.setStyleSheet(detail_qss)
                 detail_row.addWidget(detail_label)
                 detail_row.addStretch()
                 
@@ -1209,13 +2378,18 @@ class ModernInfoDialog(QDialog):
     
     def mouseMoveEvent(self, event):
         if self._drag_pos is not None and event.buttons() == Qt.LeftButton:
-            self.move(event.globalPosition().toPoint() - self._drag_pos)
+            self._drag_mover.move_to(event.globalPosition().toPoint() - self._drag_pos)
             event.accept()
     
     def mouseReleaseEvent(self, event):
         self._drag_pos = None
+        self._drag_mover.flush()
         event.accept()
     
+    def paintEvent(self, event):
+        """Draw the cached drop shadow around the container."""
+        _paint_drop_shadow(self, self.container.geometry(), 25, 4, 40)
+    
     @staticmethod
     def show_warning(parent, title: str, message: str, details: list = None, 
                      info_text: str = "", ok_text: str = "OK"):
@@ -1320,22 +2494,7 @@ class ModernInputDialog(QDialog):
         close_btn = QPushButton("X")
         close_btn.setFixedSize(36, 36)
         close_btn.setCursor(Qt.PointingHandCursor)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #7C4DFF;
-                color: white;
-                border: none;
-                border-radius: 18px;
-                font-size: 20px;
-                font-weight: bold;
-                font-family: Arial, Helvetica, sans-serif;
-                padding: 0px;
-                margin: 0px;
-            }
-            QPushButton:hover {
-                background-color: #5E35B1;
-            }
-        """)
+        close_btn.setStyleSheet(_QSS_CLOSE_BUTTON)
         close_btn.clicked.connect(self.reject)
         header_layout.addWidget(close_btn)
         
@@ -2205,6 +3364,141 @@ class UpdateDownloadDialog(QDialog):
             self.cancel_btn.setEnabled(True)
 
 
+class HistoryModel(QAbstractListModel):
+    """Rows of get_move_history() for the history list, formatted once up front."""
+    
+    def __init__(self, history: List[Dict[str, Any]], parent=None):
+        super().__init__(parent)
+        self._rows: List[tuple] = []  # (formatted_date, files_count, log_file)
+        self.set_history(history)
+    
+    def set_history(self, history: List[Dict[str, Any]]):
+        rows = [
+            (_format_ts(item.get("timestamp") or ""),
+             item.get("successful_moves", item.get("total_files", 0)),
+             item.get("log_file", ""))
+            for item in history
+        ]
+        
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.UserRole:
+            return self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][0]
+        return None
+
+
+class HistoryItemDelegate(QStyledItemDelegate):
+    """Paints a history row (card, icon, date, file count and a "View" pill).
+    
+    Rows are never widgets: the view only paints the visible ones, and a click
+    inside the pill emits view_clicked with the row's log file.
+    """
+    
+    view_clicked = Signal(str)
+    
+    ROW_HEIGHT = 64
+    ROW_SPACING = 10
+    
+    def __init__(self, colors: Dict[str, str], parent=None):
+        super().__init__(parent)
+        from PySide6.QtGui import QColor, QFont
+        
+        self._c = colors
+        self._card = QColor(colors['card'])
+        self._hover = QColor(124, 77, 255, 15)
+        self._border = QColor(colors['border'])
+        self._hover_border = QColor(124, 77, 255, 38)
+        self._text = QColor(colors['text'])
+        self._muted = QColor(colors['text_muted'])
+        self._accent = QColor("#7C4DFF")
+        self._title_font = QFont("Segoe UI")
+        self._title_font.setPixelSize(14)
+        self._title_font.setWeight(QFont.DemiBold)
+        self._subtitle_font = QFont("Segoe UI")
+        self._subtitle_font.setPixelSize(12)
+        self._button_font = QFont(self._title_font)
+        self._button_font.setPixelSize(12)
+        self._button_hover_row = -1
+    
+    def _card_rect(self, rect):
+        return rect.adjusted(0, 0, 0, -self.ROW_SPACING)
+    
+    def _button_rect(self, rect):
+        from PySide6.QtCore import QRect
+        
+        card = self._card_rect(rect)
+        return QRect(card.right() - 16 - 70 + 1, card.center().y() - 15, 70, 32)
+    
+    def sizeHint(self, option, index):
+        from PySide6.QtCore import QSize
+        return QSize(option.rect.width(), self.ROW_HEIGHT + self.ROW_SPACING)
+    
+    def paint(self, painter, option, index):
+        from PySide6.QtCore import QRect, QRectF
+        from PySide6.QtGui import QPen
+        
+        formatted_date, files_count, _ = index.data(Qt.UserRole)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        card = self._card_rect(option.rect)
+        
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        painter.setPen(QPen(self._hover_border if hovered else self._border, 1))
+        painter.setBrush(self._hover if hovered else self._card)
+        painter.drawRoundedRect(QRectF(card).adjusted(0.5, 0.5, -0.5, -0.5), 12, 12)
+        
+        icon = _emoji_pixmap("📁", 20, painter.device().devicePixelRatioF())
+        icon_size = icon.deviceIndependentSize()
+        painter.drawPixmap(int(card.left() + 16 + (28 - icon_size.width()) / 2),
+                           int(card.center().y() - icon_size.height() / 2 + 1), icon)
+        
+        text_left = card.left() + 16 + 28 + 14
+        button = self._button_rect(option.rect)
+        text_width = button.left() - 14 - text_left
+        painter.setFont(self._title_font)
+        painter.setPen(self._text)
+        painter.drawText(QRect(text_left, card.top() + 13, text_width, 20),
+                         Qt.AlignLeft | Qt.AlignVCenter, formatted_date)
+        painter.setFont(self._subtitle_font)
+        painter.setPen(self._muted)
+        painter.drawText(QRect(text_left, card.top() + 35, text_width, 16),
+                         Qt.AlignLeft | Qt.AlignVCenter, f"{files_count} file(s) organized")
+        
+        button_hovered = hovered and index.row() == self._button_hover_row
+        painter.setPen(QPen(self._accent, 1))
+        painter.setBrush(self._accent if button_hovered else Qt.transparent)
+        painter.drawRoundedRect(QRectF(button).adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
+        painter.setFont(self._button_font)
+        painter.setPen(Qt.white if button_hovered else self._accent)
+        painter.drawText(button, Qt.AlignCenter, "View")
+        painter.restore()
+    
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseMove and option.widget is not None:
+            over = self._button_rect(option.rect).contains(event.position().toPoint())
+            row = index.row() if over else -1
+            if row != self._button_hover_row:
+                self._button_hover_row = row
+                viewport = option.widget.viewport()
+                viewport.setCursor(Qt.PointingHandCursor if over else Qt.ArrowCursor)
+                viewport.update(option.rect)
+        elif (event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton
+              and self._button_rect(option.rect).contains(event.position().toPoint())):
+            self.view_clicked.emit(index.data(Qt.UserRole)[2])
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
 class HistoryDialog(QDialog):
     """
     Modern dialog showing organization history with undo capability.
@@ -2218,6 +3512,9 @@ class HistoryDialog(QDialog):
         self.setMinimumSize(600, 500)
         self.setModal(True)
         self._drag_pos = None
+        self._loaded = False  # History is read on first show, off the UI thread
+        self._history_worker = None
+        self._details_worker = None
         
         # Remove default window frame for custom styling
         self.setWindowFlags(self.windowFlags() | Qt.FramelessWindowHint)
@@ -2283,22 +3580,7 @@ class HistoryDialog(QDialog):
         close_btn = QPushButton("X")
         close_btn.setFixedSize(36, 36)
         close_btn.setCursor(Qt.PointingHandCursor)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #7C4DFF;
-                color: white;
-                border: none;
-                border-radius: 18px;
-                font-size: 20px;
-                font-weight: bold;
-                font-family: Arial, Helvetica, sans-serif;
-                padding: 0px;
-                margin: 0px;
-            }
-            QPushButton:hover {
-                background-color: #5E35B1;
-            }
-        """)
+        close_btn.setStyleSheet(_QSS_CLOSE_BUTTON)
         close_btn.clicked.connect(self.accept)
         header_layout.addWidget(close_btn)
         
@@ -2310,18 +3592,20 @@ class HistoryDialog(QDialog):
         divider.setStyleSheet(f"background-color: {c['border']};")
         layout.addWidget(divider)
         
-        # History list container
-        self.history_list = QWidget()
-        self.history_layout = QVBoxLayout(self.history_list)
-        self.history_layout.setContentsMargins(0, 0, 0, 0)
-        self.history_layout.setSpacing(10)
-        
-        # Scroll area for history items
-        scroll = QScrollArea()
-        scroll.setWidget(self.history_list)
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet(f"""
-            QScrollArea {{
+        # History list: a model/delegate view, so only visible rows are painted
+        self.history_model = HistoryModel([], self)
+        self.history_delegate = HistoryItemDelegate(c, self)
+        self.history_delegate.view_clicked.connect(self._view_details)
+        self.history_view = QListView()
+        self.history_view.setModel(self.history_model)
+        self.history_view.setItemDelegate(self.history_delegate)
+        self.history_view.setUniformItemSizes(True)
+        self.history_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.history_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.history_view.setFocusPolicy(Qt.NoFocus)
+        self.history_view.setMouseTracking(True)
+        self.history_view.setStyleSheet(f"""
+            QListView {{
                 border: none;
                 background-color: transparent;
             }}
@@ -2340,16 +3624,28 @@ class HistoryDialog(QDialog):
                 background: #7C4DFF;
             }}
         """)
-        layout.addWidget(scroll, 1)
+        layout.addWidget(self.history_view, 1)
         
-        # Load history
-        self._load_history()
+        # Placeholder until the history arrives, then the empty state
+        self.empty_label = QLabel("Loading…")
+        self.empty_label.setAlignment(Qt.AlignCenter)
+        self.empty_label.setStyleSheet(f"""
+            font-family: "Segoe UI", sans-serif;
+            font-size: 15px;
+            color: {c['text_muted']};
+            padding: 40px;
+        """)
+        layout.addWidget(self.empty_label, 1)
+        self.history_view.hide()
         
         # Footer with clear button
         footer_layout = QHBoxLayout()
         footer_layout.addStretch()
         
         clear_btn = QPushButton("Clear History")
+        # Enabled once the history has loaded, so a clear can't be undone by a late result
+        clear_btn.setEnabled(False)
+        self.clear_btn = clear_btn
         clear_btn.setMinimumHeight(40)
         clear_btn.setCursor(Qt.PointingHandCursor)
         clear_btn.setStyleSheet(f"""
@@ -2373,150 +3669,69 @@ class HistoryDialog(QDialog):
         close_dialog_btn = QPushButton("Close")
         close_dialog_btn.setMinimumHeight(40)
         close_dialog_btn.setCursor(Qt.PointingHandCursor)
-        close_dialog_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #7C4DFF;
-                color: white;
-                border: none;
-                border-radius: 10px;
-                font-weight: 600;
-                font-size: 14px;
-                padding: 8px 28px;
-            }
-            QPushButton:hover {
-                background-color: #9575FF;
-            }
-        """)
+        close_dialog_btn.setStyleSheet(_QSS_PRIMARY_BUTTON)
         close_dialog_btn.clicked.connect(self.accept)
         footer_layout.addWidget(close_dialog_btn)
         
         layout.addLayout(footer_layout)
     
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._loaded:
+            self._loaded = True
+            self._load_history()
+    
     def _load_history(self):
-        """Load move history from log files."""
-        from app.core.apply import get_move_history
-        
-        history = get_move_history()
-        c = self._theme_colors
-        
-        if not history:
-            # Show empty state
-            empty_label = QLabel("No organization history yet")
-            empty_label.setAlignment(Qt.AlignCenter)
-            empty_label.setStyleSheet(f"""
-                font-family: "Segoe UI", sans-serif;
-                font-size: 15px;
-                color: {c['text_muted']};
-                padding: 40px;
-            """)
-            self.history_layout.addWidget(empty_label)
-            self.history_layout.addStretch()
+        """Load move history from log files in the background."""
+        if self._history_worker is not None:
             return
-        
-        # Add history items (most recent first, limit to 20)
-        for item in history[:20]:
-            self._add_history_item(item)
-        
-        self.history_layout.addStretch()
-    
-    def _add_history_item(self, item: dict):
-        """Add a single history item to the list."""
-        from datetime import datetime
-        c = self._theme_colors
-        
-        item_frame = QFrame()
-        item_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {c['card']};
-                border-radius: 12px;
-                border: 1px solid {c['border']};
-            }}
-            QFrame:hover {{
-                background-color: rgba(124, 77, 255, 0.06);
-                border-color: rgba(124, 77, 255, 0.15);
-            }}
-        """)
-        
-        item_layout = QHBoxLayout(item_frame)
-        item_layout.setContentsMargins(16, 14, 16, 14)
-        item_layout.setSpacing(14)
-        
-        # Icon
-        icon = QLabel("📁")
-        icon.setStyleSheet("font-size: 20px; background: transparent; border: none;")
-        icon.setFixedWidth(28)
-        item_layout.addWidget(icon)
-        
-        # Info section
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(4)
-        
-        # Parse timestamp
-        timestamp_str = item.get("timestamp", "")
-        try:
-            dt = datetime.fromisoformat(timestamp_str)
-            formatted_date = dt.strftime("%b %d, %Y at %I:%M %p")
-        except:
-            formatted_date = timestamp_str[:19] if timestamp_str else "Unknown date"
-        
-        date_label = QLabel(formatted_date)
-        date_label.setStyleSheet(f"""
-            font-family: "Segoe UI", sans-serif;
-            font-size: 14px;
-            font-weight: 600;
-            color: {c['text']};
-            background: transparent;
-            border: none;
-        """)
-        info_layout.addWidget(date_label)
-        
-        files_count = item.get("successful_moves", item.get("total_files", 0))
-        details_label = QLabel(f"{files_count} file(s) organized")
-        details_label.setStyleSheet(f"""
-            font-family: "Segoe UI", sans-serif;
-            font-size: 12px;
-            color: {c['text_muted']};
-            background: transparent;
-            border: none;
-        """)
-        info_layout.addWidget(details_label)
-        
-        item_layout.addLayout(info_layout, 1)
-        
-        # View button
-        view_btn = QPushButton("View")
-        view_btn.setFixedSize(70, 32)
-        view_btn.setCursor(Qt.PointingHandCursor)
-        view_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #7C4DFF;
-                border: 1px solid #7C4DFF;
-                border-radius: 8px;
-                font-size: 12px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #7C4DFF;
-                color: white;
-            }
-        """)
-        log_file = item.get("log_file", "")
-        view_btn.clicked.connect(lambda checked, lf=log_file: self._view_details(lf))
-        item_layout.addWidget(view_btn)
-        
-        self.history_layout.addWidget(item_frame)
+        self._history_worker = HistoryLoadWorker()
+        self._history_worker.finished.connect(self._on_history_loaded)
+        self._history_worker.start()
+    
+    def _on_history_loaded(self, history: list):
+        self._history_worker.wait()
+        self._history_worker = None
+        self._show_history(history)
+        self.clear_btn.setEnabled(True)
+    
+    def _show_history(self, history: List[Dict[str, Any]]):
+        """Fill the list view, or show the empty state when there is nothing to list."""
+        self.empty_label.setText("No organization history yet")
+        self.history_model.set_history(history)
+        self.history_view.setVisible(bool(history))
+        self.empty_label.setVisible(not history)
     
     def _view_details(self, log_file: str):
+        """Read a move log in the background, then show its details."""
+        if self._details_worker is not None:
+            return  # Another log is still loading
+        self._details_worker = MoveLogLoadWorker(log_file)
+        self._details_worker.finished.connect(self._on_details_loaded)
+        self._details_worker.error.connect(self._on_details_error)
+        self._details_worker.start()
+    
+    def _on_details_loaded(self, log_data: dict):
+        self._details_worker.wait()
+        self._details_worker = None
+        self._show_details(log_data)
+    
+    def _on_details_error(self, message: str):
+        self._details_worker.wait()
+        self._details_worker = None
+        ModernInfoDialog.show_warning(
+            self,
+            title="Error",
+            message="Could not load operation details.",
+            details=[message]
+        )
+    
+    def _show_details(self, log_data: dict):
         """Show details of a specific organization operation in a scrollable dialog."""
-        import json
         from pathlib import Path
         c = self._theme_colors
         
         try:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                log_data = json.load(f)
-            
             moves = log_data.get("moves", [])
             renamed = log_data.get("renamed_files", [])
             
@@ -2578,10 +3793,7 @@ class HistoryDialog(QDialog):
             close_btn = QPushButton("X")
             close_btn.setFixedSize(32, 32)
             close_btn.setCursor(Qt.PointingHandCursor)
-            close_btn.setStyleSheet("""
-                QPushButton { background: #7C4DFF; border: none; color: white; font-size: 18px; font-weight: bold; font-family: Arial, Helvetica, sans-serif; border-radius: 16px; padding: 0px; margin: 0px; }
-                QPushButton:hover { background: #5E35B1; }
-            """)
+            close_btn.setStyleSheet(_QSS_CLOSE_BUTTON_SMALL)
             close_btn.clicked.connect(dialog.accept)
             header.addWidget(close_btn)
             
@@ -2603,7 +3815,15 @@ class HistoryDialog(QDialog):
                 QScrollBar::handle:vertical:hover {{ background: #7C4DFF; }}
             """)
             
+            # One sheet for every row (there can be thousands), matched by objectName
             list_widget = QWidget()
+            list_widget.setStyleSheet(f"""
+                QLabel#moveRow {{
+                    font-family: 'Segoe UI'; font-size: 13px; color: {c['text_muted']};
+                    padding: 8px 12px; background: {c['input_bg']}; border-radius: 8px;
+                }}
+                QLabel#renameRow {{ font-family: 'Segoe UI'; font-size: 12px; color: {c['text_muted']}; padding: 4px 12px; }}
+            """)
             list_layout = QVBoxLayout(list_widget)
             list_layout.setContentsMargins(0, 8, 0, 8)
             list_layout.setSpacing(6)
@@ -2614,10 +3834,7 @@ class HistoryDialog(QDialog):
                 to_folder = Path(move.get("to", "")).parent.name
                 
                 item = QLabel(f"📄 {from_name}  →  {to_folder}/")
-                item.setStyleSheet(f"""
-                    font-family: 'Segoe UI'; font-size: 13px; color: {c['text_muted']};
-                    padding: 8px 12px; background: {c['input_bg']}; border-radius: 8px;
-                """)
+                item.setObjectName("moveRow")
                 item.setWordWrap(True)
                 list_layout.addWidget(item)
             
@@ -2635,7 +3852,7 @@ class HistoryDialog(QDialog):
                     orig = r.get("original_name", "?")
                     new = r.get("new_name", "?")
                     rename_item = QLabel(f"  {orig}  →  {new}")
-                    rename_item.setStyleSheet(f"font-family: 'Segoe UI'; font-size: 12px; color: {c['text_muted']}; padding: 4px 12px;")
+                    rename_item.setObjectName("renameRow")
                     list_layout.addWidget(rename_item)
             
             list_layout.addStretch()
@@ -2649,11 +3866,7 @@ class HistoryDialog(QDialog):
             ok_btn = QPushButton("Close")
             ok_btn.setMinimumHeight(40)
             ok_btn.setCursor(Qt.PointingHandCursor)
-            ok_btn.setStyleSheet("""
-                QPushButton { background: #7C4DFF; color: white; border: none; border-radius: 10px;
-                              font-weight: 600; font-size: 14px; padding: 8px 28px; }
-                QPushButton:hover { background: #9575FF; }
-            """)
+            ok_btn.setStyleSheet(_QSS_PRIMARY_BUTTON)
             ok_btn.clicked.connect(dialog.accept)
             footer.addWidget(ok_btn)
             
@@ -2707,23 +3920,7 @@ class HistoryDialog(QDialog):
                     log_file.unlink()
                 
                 # Refresh the list
-                # Clear existing items
-                while self.history_layout.count() > 0:
-                    item = self.history_layout.takeAt(0)
-                    if item.widget():
-                        item.widget().deleteLater()
-                
-                # Show empty state
-                empty_label = QLabel("No organization history yet")
-                empty_label.setAlignment(Qt.AlignCenter)
-                empty_label.setStyleSheet("""
-                    font-family: "Segoe UI", sans-serif;
-                    font-size: 15px;
-                    color: #7A7A90;
-                    padding: 40px;
-                """)
-                self.history_layout.addWidget(empty_label)
-                self.history_layout.addStretch()
+                self._show_history([])
                 
             except Exception as e:
                 ModernInfoDialog.show_warning(
@@ -2746,6 +3943,13 @@ class HistoryDialog(QDialog):
     def mouseReleaseEvent(self, event):
         self._drag_pos = None
         event.accept()
+    
+    def done(self, result):
+        # Don't let a running loader outlive the dialog
+        for worker in (self._history_worker, self._details_worker):
+            if worker is not None:
+                worker.wait()
+        super().done(result)
 
 
 class PinnedDialog(QDialog):
@@ -2825,22 +4029,7 @@ class PinnedDialog(QDialog):
         close_btn = QPushButton("X")
         close_btn.setFixedSize(36, 36)
         close_btn.setCursor(Qt.PointingHandCursor)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #7C4DFF;
-                color: white;
-                border: none;
-                border-radius: 18px;
-                font-size: 20px;
-                font-weight: bold;
-                font-family: Arial, Helvetica, sans-serif;
-                padding: 0px;
-                margin: 0px;
-            }
-            QPushButton:hover {
-                background-color: #5E35B1;
-            }
-        """)
+        close_btn.setStyleSheet(_QSS_CLOSE_BUTTON)
         close_btn.clicked.connect(self.accept)
         header_layout.addWidget(close_btn)
         
@@ -2863,6 +4052,7 @@ class PinnedDialog(QDialog):
         
         # Pinned items list container
         self.pinned_list = QWidget()
+        self.pinned_list.setStyleSheet(_list_rows_qss(c))
         self.pinned_layout = QVBoxLayout(self.pinned_list)
         self.pinned_layout.setContentsMargins(0, 0, 0, 0)
         self.pinned_layout.setSpacing(8)
@@ -2903,42 +4093,14 @@ class PinnedDialog(QDialog):
         add_file_btn = QPushButton("📄 Pin File")
         add_file_btn.setMinimumHeight(40)
         add_file_btn.setCursor(Qt.PointingHandCursor)
-        add_file_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(124, 77, 255, 0.06);
-                color: #7C4DFF;
-                border: 1px solid rgba(124, 77, 255, 0.15);
-                border-radius: 10px;
-                font-size: 13px;
-                font-weight: 600;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: rgba(124, 77, 255, 0.12);
-                border-color: #7C4DFF;
-            }
-        """)
+        add_file_btn.setStyleSheet(_QSS_PIN_ACTION_BUTTON)
         add_file_btn.clicked.connect(self._add_pinned_file)
         add_layout.addWidget(add_file_btn)
         
         add_folder_btn = QPushButton("📁 Pin Folder")
         add_folder_btn.setMinimumHeight(40)
         add_folder_btn.setCursor(Qt.PointingHandCursor)
-        add_folder_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(124, 77, 255, 0.06);
-                color: #7C4DFF;
-                border: 1px solid rgba(124, 77, 255, 0.15);
-                border-radius: 10px;
-                font-size: 13px;
-                font-weight: 600;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: rgba(124, 77, 255, 0.12);
-                border-color: #7C4DFF;
-            }
-        """)
+        add_folder_btn.setStyleSheet(_QSS_PIN_ACTION_BUTTON)
         add_folder_btn.clicked.connect(self._add_pinned_folder)
         add_layout.addWidget(add_folder_btn)
         
@@ -2973,20 +4135,7 @@ class PinnedDialog(QDialog):
         close_dialog_btn = QPushButton("Done")
         close_dialog_btn.setMinimumHeight(40)
         close_dialog_btn.setCursor(Qt.PointingHandCursor)
-        close_dialog_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #7C4DFF;
-                color: white;
-                border: none;
-                border-radius: 10px;
-                font-weight: 600;
-                font-size: 14px;
-                padding: 8px 28px;
-            }
-            QPushButton:hover {
-                background-color: #9575FF;
-            }
-        """)
+        close_dialog_btn.setStyleSheet(_QSS_PRIMARY_BUTTON)
         close_dialog_btn.clicked.connect(self.accept)
         footer_layout.addWidget(close_dialog_btn)
         
@@ -3020,20 +4169,10 @@ class PinnedDialog(QDialog):
     def _add_pinned_item_row(self, path: str):
         """Add a single pinned item row."""
         from pathlib import Path
-        c = self._theme_colors
         
+        # Styled by objectName from the sheet on self.pinned_list
         item_frame = QFrame()
-        item_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {c['card']};
-                border-radius: 12px;
-                border: 1px solid {c['border']};
-            }}
-            QFrame:hover {{
-                background-color: rgba(124, 77, 255, 0.06);
-                border-color: rgba(124, 77, 255, 0.15);
-            }}
-        """)
+        item_frame.setObjectName("listRow")
         
         item_layout = QHBoxLayout(item_frame)
         item_layout.setContentsMargins(14, 12, 14, 12)
@@ -3043,7 +4182,7 @@ class PinnedDialog(QDialog):
         p = Path(path)
         is_folder = p.is_dir() if p.exists() else ('.' not in p.name)
         icon = QLabel("📁" if is_folder else "📄")
-        icon.setStyleSheet("font-size: 18px; background: transparent; border: none;")
+        icon.setObjectName("pinnedIcon")
         icon.setFixedWidth(26)
         item_layout.addWidget(icon)
         
@@ -3052,14 +4191,7 @@ class PinnedDialog(QDialog):
         info_layout.setSpacing(2)
         
         name_label = QLabel(p.name)
-        name_label.setStyleSheet(f"""
-            font-family: "Segoe UI", sans-serif;
-            font-size: 14px;
-            font-weight: 600;
-            color: {c['text']};
-            background: transparent;
-            border: none;
-        """)
+        name_label.setObjectName("rowTitle")
         info_layout.addWidget(name_label)
         
         # Show parent folder
@@ -3067,13 +4199,7 @@ class PinnedDialog(QDialog):
         if len(parent_str) > 45:
             parent_str = "..." + parent_str[-42:]
         parent_label = QLabel(parent_str)
-        parent_label.setStyleSheet(f"""
-            font-family: "Segoe UI", sans-serif;
-            font-size: 11px;
-            color: {c['text_muted']};
-            background: transparent;
-            border: none;
-        """)
+        parent_label.setObjectName("rowSubtitleSmall")
         info_layout.addWidget(parent_label)
         
         item_layout.addLayout(info_layout, 1)
@@ -3081,31 +4207,16 @@ class PinnedDialog(QDialog):
         # Status indicator - exists or not
         if not p.exists():
             status = QLabel("⚠️")
+            status.setObjectName("pinnedStatus")
             status.setToolTip("File/folder no longer exists")
-            status.setStyleSheet("font-size: 14px; background: transparent; border: none;")
             item_layout.addWidget(status)
         
         # Unpin button - solid red with white X (ALWAYS visible)
         unpin_btn = QPushButton("X")
         unpin_btn.setFixedSize(28, 28)
         unpin_btn.setCursor(Qt.PointingHandCursor)
+        unpin_btn.setObjectName("unpinButton")
         unpin_btn.setToolTip("Unpin this item")
-        unpin_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #E53935;
-                color: white;
-                border: none;
-                border-radius: 14px;
-                font-size: 16px;
-                font-weight: bold;
-                font-family: Arial, Helvetica, sans-serif;
-                padding: 0px;
-                margin: 0px;
-            }
-            QPushButton:hover {
-                background-color: #C62828;
-            }
-        """)
         unpin_btn.clicked.connect(lambda checked, p=path: self._unpin_item(p))
         item_layout.addWidget(unpin_btn)
         
@@ -3196,7 +4307,7 @@ class ApplyInstructionsDialog(QDialog):
     ORGANIZE_AS_IS = 2
     CONTINUE_WATCHING = 3
     
-    def __init__(self, parent=None, file_count: int = 0, subfolder_count: int = 0):
+    def __init__(self, parent=None, file_count: int = 0, subfolder_count: int = 0, truncated: bool = False):
         super().__init__(parent)
         self.setWindowTitle("Apply Instructions")
         self.setMinimumWidth(420)
@@ -3270,32 +4381,18 @@ class ApplyInstructionsDialog(QDialog):
         close_btn = QPushButton("X")
         close_btn.setFixedSize(32, 32)
         close_btn.setCursor(Qt.PointingHandCursor)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #7C4DFF;
-                color: white;
-                border: none;
-                border-radius: 16px;
-                font-size: 18px;
-                font-weight: bold;
-                font-family: Arial, Helvetica, sans-serif;
-                padding: 0px;
-                margin: 0px;
-            }
-            QPushButton:hover {
-                background-color: #5E35B1;
-            }
-        """)
+        close_btn.setStyleSheet(_QSS_CLOSE_BUTTON_SMALL)
         close_btn.clicked.connect(self._on_continue)
         header_layout.addWidget(close_btn)
         
         layout.addLayout(header_layout)
         
-        # Subtitle with file count
+        # Subtitle with file count (a lower bound when the scan stopped early)
+        plus = "+" if truncated else ""
         if subfolder_count > 0:
-            subtitle = f"Found {file_count} files in {subfolder_count} subfolders"
+            subtitle = f"Found {file_count}{plus} files in {subfolder_count}{plus} subfolders"
         else:
-            subtitle = f"Found {file_count} existing files"
+            subtitle = f"Found {file_count}{plus} existing files"
         
         subtitle_label = QLabel(subtitle)
         subtitle_label.setStyleSheet(f"""
@@ -3523,22 +4620,7 @@ class ApplyInstructionsDialogPerFolder(QDialog):
         close_btn = QPushButton("X")
         close_btn.setFixedSize(32, 32)
         close_btn.setCursor(Qt.PointingHandCursor)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #7C4DFF;
-                color: white;
-                border: none;
-                border-radius: 16px;
-                font-size: 18px;
-                font-weight: bold;
-                font-family: Arial, Helvetica, sans-serif;
-                padding: 0px;
-                margin: 0px;
-            }
-            QPushButton:hover {
-                background-color: #5E35B1;
-            }
-        """)
+        close_btn.setStyleSheet(_QSS_CLOSE_BUTTON_SMALL)
         close_btn.clicked.connect(self._on_cancel)
         header_layout.addWidget(close_btn)
         
@@ -3871,22 +4953,7 @@ class ApplyInstructionsDialogSingleFolder(QDialog):
         close_btn = QPushButton("X")
         close_btn.setFixedSize(32, 32)
         close_btn.setCursor(Qt.PointingHandCursor)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #7C4DFF;
-                color: white;
-                border: none;
-                border-radius: 16px;
-                font-size: 18px;
-                font-weight: bold;
-                font-family: Arial, Helvetica, sans-serif;
-                padding: 0px;
-                margin: 0px;
-            }
-            QPushButton:hover {
-                background-color: #5E35B1;
-            }
-        """)
+        close_btn.setStyleSheet(_QSS_CLOSE_BUTTON_SMALL)
         close_btn.clicked.connect(self._on_skip)
         header_layout.addWidget(close_btn)
         
@@ -4115,6 +5182,9 @@ class WatchConfigDialog(QDialog):
         
         # Track folder data: {path: instruction}
         self.folder_data: Dict[str, str] = {}
+        # Canonical (resolved, case-folded on Windows) path -> display path in folder_data
+        self._canonical_folders: Dict[str, str] = {}
+        self._canon_cache: Dict[str, str] = {}
         # Track folder widgets for updates
         self.folder_widgets: Dict[str, Dict] = {}
         
@@ -4293,7 +5363,7 @@ class WatchConfigDialog(QDialog):
             # Normalize path
             folder = os.path.normpath(folder)
             
-            if folder in self.folder_data:
+            if self._canon(folder) in self._canonical_folders:
                 # Use modern info dialog
                 dialog = ModernInfoDialog(
                     self,
@@ -4309,6 +5379,18 @@ class WatchConfigDialog(QDialog):
             self._create_folder_widget(folder, '')
             self._update_no_folders_visibility()
     
+    def _canon(self, folder_path: str) -> str:
+        """Canonical form of a folder path for duplicate detection (cached per dialog).
+        
+        Resolves symlinks/relative parts and folds case on Windows, so the same
+        folder picked as 'C:\\Users' and 'c:\\users' is recognised as one entry.
+        """
+        canon = self._canon_cache.get(folder_path)
+        if canon is None:
+            canon = os.path.normcase(str(Path(folder_path).resolve(strict=False)))
+            self._canon_cache[folder_path] = canon
+        return canon
+    
     def _create_folder_widget(self, folder_path: str, instruction: str):
         """Create a widget card for a folder."""
         folder_path = os.path.normpath(folder_path)
@@ -4319,6 +5401,7 @@ class WatchConfigDialog(QDialog):
         
         # Store in data
         self.folder_data[folder_path] = instruction
+        self._canonical_folders[self._canon(folder_path)] = folder_path
         
         # Create card frame
         frame = QFrame()
@@ -4488,6 +5571,7 @@ class WatchConfigDialog(QDialog):
             # Remove data
             if folder_path in self.folder_data:
                 del self.folder_data[folder_path]
+            self._canonical_folders.pop(self._canon(folder_path), None)
             
             self._update_no_folders_visibility()
     
@@ -4539,21 +5623,8 @@ class WatchConfigDialog(QDialog):
         # Save instruction first
         settings.update_auto_organize_instruction(folder_path, instruction)
         
-        # Count files in this folder
-        file_count = 0
-        subfolder_count = 0
-        try:
-            for item in os.listdir(folder_path):
-                item_path = os.path.join(folder_path, item)
-                if os.path.isfile(item_path):
-                    file_count += 1
-                elif os.path.isdir(item_path) and not item.startswith('.'):
-                    subfolder_count += 1
-                    for sub_item in os.listdir(item_path):
-                        if os.path.isfile(os.path.join(item_path, sub_item)):
-                            file_count += 1
-        except Exception:
-            pass
+        # Count files in this folder (exact - the dialog shows the numbers)
+        file_count, subfolder_count, _ = _count_existing_items([folder_path], limit=None)
         
         # Get the previously selected action
         saved_action = settings.get_auto_organize_action(folder_path)
@@ -4705,7 +5776,6 @@ class WatchConfigDialog(QDialog):
         self.current_recording_folder = None
         
         # Show error in a simple message
-        from PySide6.QtWidgets import QMessageBox
         QMessageBox.warning(self, "Voice Error", f"Could not transcribe: {error}")
     
     def _reset_folder_mic_button(self):
@@ -4736,6 +5806,349 @@ class WatchConfigDialog(QDialog):
 
 
 
+class PlanTreeModel(QAbstractItemModel):
+    """Lazy two-level model for the "Proposed Organization" tree.
+    
+    Top-level rows are plan folders; their children (file names) are only
+    resolved when the view asks for them, and with uniform row heights the view
+    only asks for visible rows, so every file can be listed without a cap.
+    
+    Child indexes carry their folder's serial number (0 marks a top-level row),
+    which stays valid while folders are inserted or removed around it, so
+    update_folders() can apply a refined plan as row diffs.
+    """
+    
+    def __init__(self, folders: Dict[str, List[Any]], files_by_id: Dict[int, Dict[str, Any]], parent=None):
+        super().__init__(parent)
+        self.files_by_id = files_by_id
+        self._folders: List[List[Any]] = []  # [name, file_ids, serial], sorted by name
+        self._rows: Dict[int, int] = {}  # serial -> current row
+        self._next_serial = 1
+        self._children: Dict[int, List[int]] = {}  # serial -> valid file ids shown
+        self._expanded: set = set()  # folder names
+        # Own copies of the id lists: callers edit the plan's lists in place (e.g. pinning),
+        # and update_folders() needs the old contents to see that anything changed
+        for name, file_ids in sorted(folders.items()):
+            self._folders.append([name, list(file_ids), self._take_serial()])
+        self._reindex()
+    
+    def _take_serial(self) -> int:
+        serial = self._next_serial
+        self._next_serial += 1
+        return serial
+    
+    def _reindex(self):
+        self._rows = {entry[2]: row for row, entry in enumerate(self._folders)}
+    
+    @staticmethod
+    def _valid_ids(file_ids) -> List[int]:
+        # _on_plan_received already coerces ids to int, so this is normally a plain copy
+        if all(type(fid) is int for fid in file_ids):
+            return list(file_ids)
+        ids = []
+        for fid in file_ids:
+            try:
+                ids.append(int(fid))
+            except (TypeError, ValueError):
+                pass
+        return ids
+    
+    def _child_ids(self, serial: int) -> List[int]:
+        ids = self._children.get(serial)
+        if ids is None:
+            ids = self._valid_ids(self._folders[self._rows[serial]][1])
+            self._children[serial] = ids
+        return ids
+    
+    def index(self, row, column, parent=QModelIndex()):
+        if column != 0 or row < 0:
+            return QModelIndex()
+        if not parent.isValid():
+            if row < len(self._folders):
+                return self.createIndex(row, 0, 0)
+            return QModelIndex()
+        if parent.internalId() == 0 and row < self.rowCount(parent):
+            return self.createIndex(row, 0, self._folders[parent.row()][2])
+        return QModelIndex()
+    
+    def parent(self, index):
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        row = self._rows.get(index.internalId())
+        if row is None:
+            return QModelIndex()
+        return self.createIndex(row, 0, 0)
+    
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._folders)
+        if parent.internalId() != 0:
+            return 0
+        return len(self._child_ids(self._folders[parent.row()][2]))
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+    
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return bool(self._folders)
+        if parent.internalId() != 0:
+            return False
+        # Avoid resolving children just to draw the collapsed folder row
+        folder_ids, serial = self._folders[parent.row()][1:]
+        resolved = self._children.get(serial)
+        return bool(resolved if resolved is not None else folder_ids)
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.UserRole):
+            return None
+        
+        if index.internalId() == 0:
+            folder_name, file_ids, _ = self._folders[index.row()]
+            if role == Qt.UserRole:
+                return {"type": "folder", "name": folder_name}
+            arrow = "▼" if folder_name in self._expanded else "▶"
+            return f"{arrow}  📁 {folder_name}  ({len(file_ids)} files)"
+        
+        fid = self._child_ids(index.internalId())[index.row()]
+        if role == Qt.UserRole:
+            return {"type": "file", "id": fid}
+        return self.files_by_id.get(fid, {}).get("file_name", f"id:{fid}")
+    
+    def set_expanded(self, index, expanded: bool):
+        """Record a folder's expand state so its arrow prefix can be redrawn."""
+        if not index.isValid() or index.internalId() != 0:
+            return
+        name = self._folders[index.row()][0]
+        if expanded:
+            self._expanded.add(name)
+        else:
+            self._expanded.discard(name)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+    
+    def update_folders(self, folders: Dict[str, List[Any]]):
+        """Apply a new plan as row inserts/removals so expansion and selection survive."""
+        # Folders that are gone
+        for row in range(len(self._folders) - 1, -1, -1):
+            name, _, serial = self._folders[row]
+            if name not in folders:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._folders[row]
+                self._children.pop(serial, None)
+                self._expanded.discard(name)
+                self._reindex()
+                self.endRemoveRows()
+        
+        # Folders still present whose files changed
+        for row, entry in enumerate(self._folders):
+            new_ids = folders[entry[0]]
+            if new_ids == entry[1]:
+                continue
+            if entry[2] in self._children:
+                self._update_children(row, entry[2], self._valid_ids(new_ids))
+            # Only after the child diff, so hasChildren() matches rowCount() throughout it
+            entry[1] = list(new_ids)
+            folder_index = self.index(row, 0)
+            self.dataChanged.emit(folder_index, folder_index, [Qt.DisplayRole])
+        
+        # New folders, at their sorted position
+        names = [entry[0] for entry in self._folders]
+        for name in sorted(set(folders) - set(names)):
+            row = bisect.bisect_left(names, name)
+            self.beginInsertRows(QModelIndex(), row, row)
+            names.insert(row, name)
+            self._folders.insert(row, [name, list(folders[name]), self._take_serial()])
+            self._reindex()
+            self.endInsertRows()
+    
+    def _update_children(self, row: int, serial: int, new_ids: List[int]):
+        """Diff a resolved folder's file rows: drop removed files, append new ones."""
+        parent = self.index(row, 0)
+        ids = self._children[serial]
+        keep = set(new_ids)
+        i = len(ids) - 1
+        while i >= 0:
+            # Remove contiguous runs of dropped files in one go
+            if ids[i] in keep:
+                i -= 1
+                continue
+            end = i
+            while i >= 0 and ids[i] not in keep:
+                i -= 1
+            self.beginRemoveRows(parent, i + 1, end)
+            del ids[i + 1:end + 1]
+            self.endRemoveRows()
+        
+        remaining = set(ids)
+        added = [fid for fid in new_ids if fid not in remaining]
+        if [fid for fid in new_ids if fid in remaining] != ids:
+            # Kept files were reordered; rebuild this folder's rows
+            if ids:
+                self.beginRemoveRows(parent, 0, len(ids) - 1)
+                ids.clear()
+                self.endRemoveRows()
+            added = new_ids
+        if added:
+            self.beginInsertRows(parent, len(ids), len(ids) + len(added) - 1)
+            ids.extend(added)
+            self.endInsertRows()
+
+
+@functools.lru_cache(maxsize=2)
+def _organize_page_qss(theme: str) -> str:
+    """Build the single stylesheet applied to OrganizePage for a theme.
+    
+    Every page widget is targeted by objectName, so the sheet is parsed once per
+    theme change instead of once per widget. Only the colour-dependent rules are
+    formatted here; the rest is the _QSS_ORGANIZE_PAGE constant. State changes
+    (recording, watching, destination chosen) are dynamic properties.
+    """
+    from app.ui.theme_manager import get_theme_colors
+    c = get_theme_colors(theme)
+    return _QSS_ORGANIZE_PAGE + f"""
+        /* ---- Tab switcher ---- */
+        QPushButton#tabAutoOrganize {{
+            background-color: {c['tab_unchecked_bg']};
+            color: {c['tab_unchecked_text']};
+            border: 1px solid {c['tab_unchecked_border']};
+            border-top-right-radius: 12px;
+            border-bottom-right-radius: 12px;
+            border-top-left-radius: 0px;
+            border-bottom-left-radius: 0px;
+            font-weight: 600;
+            font-size: 14px;
+            padding: 10px 20px;
+        }}
+        QPushButton#tabOrganizeNow:!checked, QPushButton#tabAutoOrganize:!checked {{
+            background-color: {c['tab_unchecked_bg']};
+            color: {c['tab_unchecked_text']};
+            border: 1px solid {c['tab_unchecked_border']};
+        }}
+
+        /* ---- Cards ---- */
+        QFrame#instructionCard, QFrame#destCard, QFrame#watchAutoCard {{
+            background-color: {c['surface']};
+            border: 1px solid {c['border']};
+            border-radius: 20px;
+        }}
+
+        /* ---- Instruction input + mic ---- */
+        QLineEdit#instructionInput {{
+            font-size: 15px;
+            padding: 12px 16px;
+            background-color: {c['bg']};
+            border: 1px solid {c['border']};
+            border-radius: 12px;
+            color: {c['text']};
+        }}
+        QLineEdit#instructionInput:focus {{
+            border: 1px solid #7C4DFF;
+            background-color: {c['card']};
+        }}
+        QLineEdit#instructionInput::placeholder {{
+            color: {c['text_disabled']};
+        }}
+        QPushButton#micButton {{
+            font-size: 18px;
+            background-color: {c['card']};
+            border: 1px solid {c['border']};
+            border-radius: 12px;
+            color: {c['text']};
+            padding: 0px;
+        }}
+
+        /* ---- Labels ---- */
+        QLabel#examplesLabel {{
+            color: {c['text_disabled']}; font-size: 12px; background: transparent;
+        }}
+        QLabel#destLabel {{
+            color: {c['text_muted']}; font-size: 13px; background: transparent;
+        }}
+        QLabel#destLabel[selected="true"] {{
+            color: {c['text']}; font-weight: bold;
+        }}
+        QLabel#statusLabel {{
+            color: {c['text_muted']}; font-style: italic; font-size: 13px;
+        }}
+        QLabel#planSummaryLabel {{
+            font-family: "Segoe UI", sans-serif;
+            font-size: 13px; font-weight: 500;
+            color: {c['text_muted']}; padding: 4px 0px;
+        }}
+        QLabel#existingFoldersNote {{
+            font-family: "Segoe UI", sans-serif;
+            font-size: 12px; color: {c['text_disabled']};
+            font-style: italic; padding: 2px 0px;
+        }}
+
+        /* ---- Action buttons ---- */
+        QPushButton#generateButton:disabled {{
+            background-color: {c['card']};
+            border: 1px solid {c['border']};
+            color: {c['text_disabled']};
+        }}
+        QPushButton#applyButton:disabled {{
+            background-color: {c['card']};
+            border-color: {c['border']};
+            color: {c['text_disabled']};
+        }}
+        QPushButton#undoButton:disabled {{
+            background-color: {c['card']};
+            border-color: {c['border']};
+            color: {c['text_disabled']};
+        }}
+        QPushButton#historyButton, QPushButton#pinnedButton, QPushButton#editInputsButton {{
+            background-color: transparent;
+            color: {c['text_muted']};
+            border: 1px solid {c['border_strong']};
+            border-radius: 12px;
+            font-weight: 600;
+            font-size: 15px;
+        }}
+        QScrollArea#actionScroll QScrollBar:horizontal {{
+            border: none; background: {c['scrollbar_bg']};
+            height: 8px; border-radius: 4px; margin-top: 4px;
+        }}
+        QScrollArea#actionScroll QScrollBar::handle:horizontal {{
+            background: {c['scrollbar_handle']};
+            border-radius: 4px; min-width: 40px;
+        }}
+
+        /* ---- Plan tree ---- */
+        QTreeView#planTree::item {{
+            height: 38px; color: {c['text']};
+            border-radius: 10px; padding-left: 8px; margin: 2px 0px;
+        }}
+
+        /* ---- Auto-Organize card ---- */
+        QLabel#watchDesc {{
+            color: {c['text_muted']}; font-size: 13px; background: transparent;
+        }}
+        QLabel#watchFolderLabel {{
+            font-size: 13px; color: {c['text_muted']};
+            background: transparent; padding: 4px 0; font-weight: 400;
+        }}
+    """
+
+
+def _set_style_state(widget: QWidget, name: str, value) -> None:
+    """Set a dynamic property used by the page stylesheet and re-polish the widget.
+    
+    Re-polishing is skipped when the property already holds value, so repeated
+    summary refreshes don't restyle an unchanged button.
+    """
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
 class OrganizePage(QWidget):
     """
     AI Organization page widget.
@@ -4760,6 +6173,25 @@ class OrganizePage(QWidget):
         # Watch & Auto-Organize
         self.auto_watcher = None
         self.watch_folders: List[str] = []
+        self._usage_worker = None
+        self._usage_refresh_pending = False
+        self._scan_worker = None
+        self._verify_worker = None
+        self._apply_worker = None
+        self._undo_worker = None
+        self._db_conn: Optional[sqlite3.Connection] = None  # Read connection reused across plan loads
+        self._dest_top_level_names = None  # From the last path verification, for existing-folder checks
+        self._pending_watch_start = False  # True while a scan is due to show the popup
+        # Coalesce watch-summary refreshes requested in the same event-loop tick
+        self._summary_timer = QTimer(self)
+        self._summary_timer.setSingleShot(True)
+        self._summary_timer.setInterval(0)
+        self._summary_timer.timeout.connect(self._do_update_watch_summary)
+        # Same for the indexed-file count, which clear_plan and apply/undo can request back to back
+        self._file_count_timer = QTimer(self)
+        self._file_count_timer.setSingleShot(True)
+        self._file_count_timer.setInterval(0)
+        self._file_count_timer.timeout.connect(self._do_update_file_count)
         self._init_auto_watcher()
         
         self.setup_ui()
@@ -4769,8 +6201,21 @@ class OrganizePage(QWidget):
         self._apply_theme_styles(theme_manager.current_theme)
         theme_manager.theme_changed.connect(self._apply_theme_styles)
         
-        # Check auto-start after UI is fully ready (2 second delay to prevent lag)
-        QTimer.singleShot(2000, self._check_auto_start)
+        # Check auto-start once the main window is first shown (this page may be
+        # hidden behind another tab, so watch the top-level window instead)
+        self._auto_start_checked = False
+        self._auto_start_target = self.window()
+        self._auto_start_target.installEventFilter(self)
+    
+    def eventFilter(self, obj, event):
+        """Kick off the auto-start check exactly once, right after the first show."""
+        if (not self._auto_start_checked and obj is self._auto_start_target
+                and event.type() == QEvent.Show):
+            self._auto_start_checked = True
+            self._auto_start_target.removeEventFilter(self)
+            # Queue behind the pending layout/paint events of the first show
+            QTimer.singleShot(0, self._check_auto_start)
+        return super().eventFilter(obj, event)
     
     def _init_auto_watcher(self):
         """Initialize the auto-organize watcher."""
@@ -4824,34 +6269,7 @@ class OrganizePage(QWidget):
         self.tab_organize_now.setCursor(Qt.PointingHandCursor)
         self.tab_organize_now.setCheckable(True)
         self.tab_organize_now.setChecked(True)
-        self.tab_organize_now.setStyleSheet("""
-            QPushButton {
-                background-color: #7C4DFF;
-                color: white;
-                border: 1px solid #7C4DFF;
-                border-top-left-radius: 12px;
-                border-bottom-left-radius: 12px;
-                border-top-right-radius: 0px;
-                border-bottom-right-radius: 0px;
-                font-weight: 600;
-                font-size: 14px;
-                padding: 10px 20px;
-            }
-            QPushButton:checked {
-                background-color: #7C4DFF;
-                color: white;
-            }
-            QPushButton:!checked {
-                background-color: #16161F;
-                color: #7A7A90;
-                border: 1px solid #252535;
-            }
-            QPushButton:!checked:hover {
-                background-color: rgba(124, 77, 255, 0.06);
-                border-color: rgba(124, 77, 255, 0.30);
-                color: #B39DFF;
-            }
-        """)
+        self.tab_organize_now.setObjectName("tabOrganizeNow")
         tab_container.addWidget(self.tab_organize_now)
         
         self.tab_auto_organize = QPushButton("👁️ Auto-Organize")
@@ -4860,34 +6278,7 @@ class OrganizePage(QWidget):
         self.tab_auto_organize.setCursor(Qt.PointingHandCursor)
         self.tab_auto_organize.setCheckable(True)
         self.tab_auto_organize.setChecked(False)
-        self.tab_auto_organize.setStyleSheet("""
-            QPushButton {
-                background-color: #16161F;
-                color: #7A7A90;
-                border: 1px solid #252535;
-                border-top-right-radius: 12px;
-                border-bottom-right-radius: 12px;
-                border-top-left-radius: 0px;
-                border-bottom-left-radius: 0px;
-                font-weight: 600;
-                font-size: 14px;
-                padding: 10px 20px;
-            }
-            QPushButton:checked {
-                background-color: #7C4DFF;
-                color: white;
-                border-color: #7C4DFF;
-            }
-            QPushButton:!checked {
-                background-color: #16161F;
-                color: #7A7A90;
-            }
-            QPushButton:!checked:hover {
-                background-color: rgba(124, 77, 255, 0.06);
-                border-color: rgba(124, 77, 255, 0.30);
-                color: #B39DFF;
-            }
-        """)
+        self.tab_auto_organize.setObjectName("tabAutoOrganize")
         tab_container.addWidget(self.tab_auto_organize)
         
         tab_container.addStretch()
@@ -4907,22 +6298,14 @@ class OrganizePage(QWidget):
         
         # Instruction Input Card
         self.instruction_card = QFrame()
-        self.instruction_card.setObjectName("organizeCard")
-        self.instruction_card.setStyleSheet("""
-            QFrame#organizeCard {
-                background-color: #111119;
-                border: 1px solid #1C1C28;
-                border-radius: 20px;
-                padding: 24px;
-            }
-        """)
+        self.instruction_card.setObjectName("instructionCard")
         instruction_layout = QVBoxLayout(self.instruction_card)
         instruction_layout.setContentsMargins(20, 20, 20, 20)
         instruction_layout.setSpacing(12)
         
         # Section title
         inst_title = QLabel("✨ Your Instruction")
-        inst_title.setStyleSheet("font-size: 16px; font-weight: 600; color: #7C4DFF; background: transparent;")
+        inst_title.setObjectName("cardTitle")
         instruction_layout.addWidget(inst_title)
         
         # Input row with text field and mic button
@@ -4934,23 +6317,7 @@ class OrganizePage(QWidget):
             "e.g., Organize thumbnails by client name or Sort invoices by year"
         )
         self.instruction_input.setMinimumHeight(50)
-        self.instruction_input.setStyleSheet("""
-            QLineEdit {
-                font-size: 15px;
-                padding: 12px 16px;
-                background-color: #0F0F1A;
-                border: 1px solid #1C1C28;
-                border-radius: 12px;
-                color: #E8E8F0;
-            }
-            QLineEdit:focus {
-                border: 1px solid #7C4DFF;
-                background-color: #12121E;
-            }
-            QLineEdit::placeholder {
-                color: #4A4A5A;
-            }
-        """)
+        self.instruction_input.setObjectName("instructionInput")
         self.instruction_input.textChanged.connect(self._update_generate_button)
         self.instruction_input.returnPressed.connect(self.generate_plan)
         input_row.addWidget(self.instruction_input)
@@ -4961,23 +6328,7 @@ class OrganizePage(QWidget):
         self.mic_button.setMinimumWidth(60)
         self.mic_button.setMaximumWidth(60)
         self.mic_button.setToolTip("Click to speak your instruction (click again to stop)")
-        self.mic_button.setStyleSheet("""
-            QPushButton {
-                font-size: 18px;
-                background-color: #16161F;
-                border: 1px solid #1C1C28;
-                border-radius: 12px;
-                color: #E8E8F0;
-                padding: 0px;
-            }
-            QPushButton:hover {
-                background-color: rgba(124, 77, 255, 0.08);
-                border-color: #7C4DFF;
-            }
-            QPushButton:pressed {
-                background-color: rgba(124, 77, 255, 0.12);
-            }
-        """)
+        self.mic_button.setObjectName("micButton")
         self.mic_button.clicked.connect(self._toggle_voice_recording)
         input_row.addWidget(self.mic_button)
         
@@ -4990,7 +6341,7 @@ class OrganizePage(QWidget):
         self._examples_label = QLabel(
             "💡 Examples: Organize by file type, Group photos by date, Sort by topic"
         )
-        self._examples_label.setStyleSheet("color: #4A4A5A; font-size: 12px; background: transparent;")
+        self._examples_label.setObjectName("examplesLabel")
         self._examples_label.setWordWrap(True)
         instruction_layout.addWidget(self._examples_label)
         
@@ -4998,31 +6349,24 @@ class OrganizePage(QWidget):
         
         # Destination Folder Card
         self.dest_card = QFrame()
-        self.dest_card.setObjectName("organizeCard")
-        self.dest_card.setStyleSheet("""
-            QFrame#organizeCard {
-                background-color: #111119;
-                border: 1px solid #1C1C28;
-                border-radius: 20px;
-            }
-        """)
+        self.dest_card.setObjectName("destCard")
         dest_layout = QHBoxLayout(self.dest_card)
         dest_layout.setContentsMargins(20, 16, 20, 16)
         dest_layout.setSpacing(16)
         
         dest_icon = QLabel("📂")
-        dest_icon.setStyleSheet("font-size: 24px; background: transparent;")
+        dest_icon.setObjectName("destIcon")
         dest_layout.addWidget(dest_icon)
         
         dest_info = QVBoxLayout()
         dest_info.setSpacing(4)
         
         dest_title = QLabel("Destination Folder")
-        dest_title.setStyleSheet("font-size: 16px; font-weight: 600; color: #7C4DFF; background: transparent;")
+        dest_title.setObjectName("cardTitle")
         dest_info.addWidget(dest_title)
         
         self.dest_label = QLabel("Select where organized files will be moved...")
-        self.dest_label.setStyleSheet("color: #7A7A90; font-size: 13px; background: transparent;")
+        self.dest_label.setObjectName("destLabel")
         self.dest_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
         dest_info.addWidget(self.dest_label)
         
@@ -5032,21 +6376,7 @@ class OrganizePage(QWidget):
         self.dest_button.setMinimumHeight(40)
         self.dest_button.setMinimumWidth(140)
         self.dest_button.setCursor(Qt.PointingHandCursor)
-        self.dest_button.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #7C4DFF;
-                border: 1px solid rgba(124, 77, 255, 0.30);
-                border-radius: 10px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: rgba(124, 77, 255, 0.08);
-                border-color: #7C4DFF;
-            }
-        """)
+        self.dest_button.setObjectName("destButton")
         self.dest_button.clicked.connect(self.select_destination)
         dest_layout.addWidget(self.dest_button)
         
@@ -5061,26 +6391,7 @@ class OrganizePage(QWidget):
         self.generate_button.setMinimumWidth(180)
         self.generate_button.setEnabled(False)
         self.generate_button.setCursor(Qt.PointingHandCursor)
-        self.generate_button.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(124, 77, 255, 0.08);
-                color: #7C4DFF;
-                border: 1px solid rgba(124, 77, 255, 0.35);
-                border-radius: 12px;
-                font-weight: 700;
-                font-size: 15px;
-            }
-            QPushButton:hover {
-                background-color: #7C4DFF;
-                color: white;
-                border-color: #7C4DFF;
-            }
-            QPushButton:disabled {
-                background-color: #16161F;
-                border: 1px solid #1C1C28;
-                color: #4A4A5A;
-            }
-        """)
+        self.generate_button.setObjectName("generateButton")
         self.generate_button.clicked.connect(self.generate_plan)
         action_layout.addWidget(self.generate_button)
         
@@ -5089,45 +6400,14 @@ class OrganizePage(QWidget):
         self.apply_button.setMinimumWidth(200)
         self.apply_button.setEnabled(False)
         self.apply_button.setCursor(Qt.PointingHandCursor)
-        self.apply_button.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(76, 175, 80, 0.08);
-                color: #4CAF50;
-                border: 1px solid rgba(76, 175, 80, 0.35);
-                border-radius: 12px;
-                font-weight: 700;
-                font-size: 15px;
-            }
-            QPushButton:hover {
-                background-color: #4CAF50;
-                color: white;
-                border-color: #4CAF50;
-            }
-            QPushButton:disabled {
-                background-color: #16161F;
-                border-color: #1C1C28;
-                color: #4A4A5A;
-            }
-        """)
+        self.apply_button.setObjectName("applyButton")
         self.apply_button.clicked.connect(self.apply_organization)
         action_layout.addWidget(self.apply_button)
         
         self.clear_button = QPushButton("Clear")
         self.clear_button.setMinimumHeight(48)
         self.clear_button.setCursor(Qt.PointingHandCursor)
-        self.clear_button.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #7C4DFF;
-                border: 1px solid rgba(124, 77, 255, 0.30);
-                border-radius: 12px;
-                font-weight: 600;
-                font-size: 15px;
-            }
-            QPushButton:hover {
-                background-color: rgba(124, 77, 255, 0.08);
-            }
-        """)
+        self.clear_button.setObjectName("clearButton")
         self.clear_button.clicked.connect(self.clear_plan)
         action_layout.addWidget(self.clear_button)
         
@@ -5137,26 +6417,7 @@ class OrganizePage(QWidget):
         self.undo_button.setEnabled(False)
         self.undo_button.setCursor(Qt.PointingHandCursor)
         self.undo_button.setToolTip("Undo the last organization (move files back)")
-        self.undo_button.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #9575FF;
-                border: 1px solid rgba(149, 117, 255, 0.30);
-                border-radius: 12px;
-                font-weight: 600;
-                font-size: 15px;
-            }
-            QPushButton:hover {
-                background-color: rgba(124, 77, 255, 0.08);
-                color: #B39DFF;
-                border-color: #7C4DFF;
-            }
-            QPushButton:disabled {
-                background-color: #16161F;
-                border-color: #1C1C28;
-                color: #4A4A5A;
-            }
-        """)
+        self.undo_button.setObjectName("undoButton")
         self.undo_button.clicked.connect(self.undo_last_organization)
         action_layout.addWidget(self.undo_button)
         
@@ -5166,21 +6427,7 @@ class OrganizePage(QWidget):
         self.history_button.setMinimumWidth(130)
         self.history_button.setCursor(Qt.PointingHandCursor)
         self.history_button.setToolTip("View past organization operations")
-        self.history_button.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #7A7A90;
-                border: 1px solid #252535;
-                border-radius: 12px;
-                font-weight: 600;
-                font-size: 15px;
-            }
-            QPushButton:hover {
-                background-color: rgba(124, 77, 255, 0.06);
-                border-color: #7C4DFF;
-                color: #B39DFF;
-            }
-        """)
+        self.history_button.setObjectName("historyButton")
         self.history_button.clicked.connect(self._show_history_dialog)
         action_layout.addWidget(self.history_button)
         
@@ -5190,21 +6437,7 @@ class OrganizePage(QWidget):
         self.pinned_button.setMinimumWidth(130)
         self.pinned_button.setCursor(Qt.PointingHandCursor)
         self.pinned_button.setToolTip("View and manage pinned files/folders that won't be organized")
-        self.pinned_button.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #7A7A90;
-                border: 1px solid #252535;
-                border-radius: 12px;
-                font-weight: 600;
-                font-size: 15px;
-            }
-            QPushButton:hover {
-                background-color: rgba(124, 77, 255, 0.06);
-                border-color: #7C4DFF;
-                color: #B39DFF;
-            }
-        """)
+        self.pinned_button.setObjectName("pinnedButton")
         self.pinned_button.clicked.connect(self._show_pinned_dialog)
         action_layout.addWidget(self.pinned_button)
         
@@ -5212,22 +6445,7 @@ class OrganizePage(QWidget):
         self.edit_inputs_button = QPushButton("✏️ Edit")
         self.edit_inputs_button.setMinimumHeight(48)
         self.edit_inputs_button.setCursor(Qt.PointingHandCursor)
-        self.edit_inputs_button.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #7A7A90;
-                border: 1px solid #252535;
-                border-radius: 12px;
-                font-weight: 600;
-                font-size: 15px;
-                padding: 0px 20px;
-            }
-            QPushButton:hover {
-                background-color: rgba(124, 77, 255, 0.06);
-                border-color: #7C4DFF;
-                color: #B39DFF;
-            }
-        """)
+        self.edit_inputs_button.setObjectName("editInputsButton")
         self.edit_inputs_button.clicked.connect(self._show_input_cards)
         self.edit_inputs_button.setVisible(False)
         action_layout.addWidget(self.edit_inputs_button)
@@ -5242,7 +6460,7 @@ class OrganizePage(QWidget):
         # Wrap action buttons in a scroll area to prevent cutoff on small windows
         action_widget = QWidget()
         action_widget.setLayout(action_layout)
-        action_widget.setStyleSheet("background: transparent;")
+        action_widget.setObjectName("actionRow")
         
         self._action_scroll = QScrollArea()
         self._action_scroll.setWidget(action_widget)
@@ -5250,30 +6468,7 @@ class OrganizePage(QWidget):
         self._action_scroll.setFixedHeight(70)  # Fixed height for the button row + scrollbar space
         self._action_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self._action_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self._action_scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:horizontal {
-                border: none;
-                background: #1C1C28;
-                height: 8px;
-                border-radius: 4px;
-                margin-top: 4px;
-            }
-            QScrollBar::handle:horizontal {
-                background: #252535;
-                border-radius: 4px;
-                min-width: 40px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background: #7C4DFF;
-            }
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                width: 0px;
-            }
-        """)
+        self._action_scroll.setObjectName("actionScroll")
         
         organize_now_layout.addWidget(self._action_scroll)
         
@@ -5284,146 +6479,30 @@ class OrganizePage(QWidget):
         organize_now_layout.addWidget(self.progress_bar)
         
         self.status_label = QLabel("")
-        self.status_label.setStyleSheet("color: #7A7A90; font-style: italic; font-size: 13px;")
+        self.status_label.setObjectName("statusLabel")
         organize_now_layout.addWidget(self.status_label)
 
-        # Results Area (Splitter: Tree + Details) - Hidden until plan is generated
-        self.results_splitter = QSplitter(Qt.Horizontal)
-        self.results_splitter.setChildrenCollapsible(False)
-        
-        # Plan Tree Card - Matching the clean input card style
-        plan_card = QFrame()
-        plan_card.setObjectName("planCard")
-        plan_card.setStyleSheet("""
-            QFrame#planCard {
-                background-color: rgba(124, 77, 255, 0.06);
-                border: 2px dashed rgba(124, 77, 255, 0.5);
-                border-radius: 20px;
-            }
-        """)
+        # Results Area (Splitter: Tree) - built on first plan by _ensure_results_ui
+        self._organize_now_layout = organize_now_layout
+        self.results_splitter = None
+        self.plan_tree = None
         
-        plan_layout = QVBoxLayout(plan_card)
-        plan_layout.setContentsMargins(20, 20, 20, 20)
-        plan_layout.setSpacing(12)
-        
-        # Simple title matching input card style
-        plan_title = QLabel("📁 Proposed Organization")
-        plan_title.setStyleSheet("""
-            font-family: "Segoe UI", sans-serif;
-            font-weight: 600;
-            font-size: 16px;
-            color: #7C4DFF;
-            background: transparent;
-        """)
-        plan_layout.addWidget(plan_title)
-        
-        self.plan_tree = QTreeWidget()
-        self.plan_tree.setHeaderHidden(True)
-        self.plan_tree.setIndentation(20)
-        self.plan_tree.setAlternatingRowColors(False)
-        self.plan_tree.setStyleSheet("""
-            QTreeWidget {
-                background-color: transparent;
-                border: none;
-                font-family: "Segoe UI", sans-serif;
-                font-size: 14px;
-                padding: 4px;
-                outline: none;
-            }
-            QTreeWidget::item {
-                height: 38px;
-                color: #E8E8F0;
-                border-radius: 10px;
-                padding-left: 8px;
-                margin: 2px 0px;
-            }
-            QTreeWidget::item:hover {
-                background-color: rgba(255, 255, 255, 0.6);
-            }
-            QTreeWidget::item:selected {
-                background-color: rgba(255, 255, 255, 0.8);
-                color: #7C4DFF;
-                font-weight: 600;
-            }
-            /* Hide native branch indicators completely */
-            QTreeView::branch {
-                background: transparent;
-                width: 0px;
-                border: none;
-                image: none;
-            }
-        """)
-        self.plan_tree.setRootIsDecorated(False)  # Remove native expand buttons
-        self.plan_tree.itemClicked.connect(self._on_tree_item_clicked)
-        self.plan_tree.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.plan_tree.customContextMenuRequested.connect(self._show_tree_context_menu)
-        plan_layout.addWidget(self.plan_tree)
-        
-        self.results_splitter.addWidget(plan_card)
-        
-        self.results_splitter.setVisible(False)  # Hidden until plan is generated
-        
-        # Summary line (shown after plan generation) - subtle and clean
-        self.plan_summary_label = QLabel("")
-        self.plan_summary_label.setStyleSheet("""
-            font-family: "Segoe UI", sans-serif;
-            font-size: 13px;
-            font-weight: 500;
-            color: #7A7A90;
-            padding: 4px 0px;
-        """)
-        self.plan_summary_label.setVisible(False)
-        organize_now_layout.addWidget(self.plan_summary_label)
+        # Summary line (shown after plan generation) - subtle and clean
+        self.plan_summary_label = QLabel("")
+        self.plan_summary_label.setObjectName("planSummaryLabel")
+        self.plan_summary_label.setVisible(False)
+        organize_now_layout.addWidget(self.plan_summary_label)
         
         # Info note for existing folders (subtle, not alarming)
         self.existing_folders_note = QLabel("")
         self.existing_folders_note.setWordWrap(True)
-        self.existing_folders_note.setStyleSheet("""
-            font-family: "Segoe UI", sans-serif;
-            font-size: 12px;
-            color: #4A4A5A;
-            font-style: italic;
-            padding: 2px 0px;
-        """)
+        self.existing_folders_note.setObjectName("existingFoldersNote")
         self.existing_folders_note.setVisible(False)
         organize_now_layout.addWidget(self.existing_folders_note)
         
-        organize_now_layout.addWidget(self.results_splitter, 1)
+        # Feedback/Refinement Section - built on first plan by _ensure_feedback_ui
+        self.feedback_group = None
         
-        # Feedback/Refinement Section (hidden until plan is generated)
-        self.feedback_group = QGroupBox("Refine Plan")
-        self.feedback_group.setVisible(False)
-        feedback_layout = QHBoxLayout(self.feedback_group)
-        
-        self.feedback_input = QLineEdit()
-        self.feedback_input.setPlaceholderText(
-            "e.g., 'Move the JSON files to a separate folder' or 'Don't include the screenshots'"
-        )
-        self.feedback_input.setMinimumHeight(36)
-        self.feedback_input.returnPressed.connect(self.refine_plan)
-        feedback_layout.addWidget(self.feedback_input, 1)
-        
-        self.refine_button = QPushButton("🔄 Refine")
-        self.refine_button.setMinimumHeight(42)
-        self.refine_button.setMinimumWidth(110)
-        self.refine_button.setCursor(Qt.PointingHandCursor)
-        self.refine_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #7C4DFF, stop:1 #9575FF);
-                color: white;
-                border: none;
-                border-radius: 10px;
-                font-weight: 600;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #9575FF, stop:1 #B39DFF);
-            }
-        """)
-        self.refine_button.clicked.connect(self.refine_plan)
-        feedback_layout.addWidget(self.refine_button)
-        
-        organize_now_layout.addWidget(self.feedback_group)
         organize_now_layout.addStretch()
         
         self.content_stack.addWidget(organize_now_page)
@@ -5459,13 +6538,6 @@ class OrganizePage(QWidget):
         # Main card container
         self.watch_card = QFrame()
         self.watch_card.setObjectName("watchAutoCard")
-        self.watch_card.setStyleSheet("""
-            QFrame#watchAutoCard {
-                background-color: #111119;
-                border: 1px solid #1C1C28;
-                border-radius: 20px;
-            }
-        """)
         watch_layout = QVBoxLayout(self.watch_card)
         watch_layout.setSpacing(12)
         watch_layout.setContentsMargins(24, 24, 24, 24)
@@ -5475,381 +6547,71 @@ class OrganizePage(QWidget):
         header_row.setSpacing(12)
         
         watch_icon = QLabel("🔄")
-        watch_icon.setStyleSheet("font-size: 28px; background: transparent;")
+        watch_icon.setObjectName("watchIcon")
         header_row.addWidget(watch_icon)
-        
-        header_info = QVBoxLayout()
-        header_info.setSpacing(2)
-        
-        watch_title = QLabel("Auto-Organize")
-        watch_title.setStyleSheet("font-size: 18px; font-weight: 600; color: #7C4DFF; background: transparent;")
-        header_info.addWidget(watch_title)
-        
-        self._watch_desc = QLabel("Monitor folders and organize new files automatically")
-        self._watch_desc.setStyleSheet("color: #7A7A90; font-size: 13px; background: transparent;")
-        header_info.addWidget(self._watch_desc)
-        
-        header_row.addLayout(header_info, 1)
-        watch_layout.addLayout(header_row)
-        
-        # Separator line
-        separator = QFrame()
-        separator.setFrameShape(QFrame.HLine)
-        separator.setStyleSheet("background-color: rgba(124, 77, 255, 0.2); border: none; max-height: 1px;")
-        watch_layout.addWidget(separator)
-        
-        # Combined folder count + status on one line
-        self.watch_folder_label = QLabel("📁 No folders configured")
-        self.watch_folder_label.setStyleSheet("""
-            font-size: 13px; 
-            color: #7A7A90; 
-            background: transparent;
-            padding: 4px 0;
-        """)
-        watch_layout.addWidget(self.watch_folder_label)
-        
-        # Buttons row
-        btn_row = QHBoxLayout()
-        btn_row.setSpacing(12)
-        
-        # Edit button (previously Configure)
-        self.watch_config_btn = QPushButton("✏️ Edit")
-        self.watch_config_btn.setMinimumHeight(42)
-        self.watch_config_btn.setMinimumWidth(100)
-        self.watch_config_btn.setCursor(Qt.PointingHandCursor)
-        self.watch_config_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #7C4DFF;
-                border: 1px solid rgba(124, 77, 255, 0.30);
-                border-radius: 12px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0 16px;
-            }
-            QPushButton:hover {
-                background-color: rgba(124, 77, 255, 0.08);
-                border-color: #7C4DFF;
-            }
-        """)
-        self.watch_config_btn.clicked.connect(self._open_watch_config)
-        btn_row.addWidget(self.watch_config_btn)
-        
-        # Start/Stop button (purple theme)
-        self.watch_toggle_btn = QPushButton("▶ Start")
-        self.watch_toggle_btn.setMinimumHeight(42)
-        self.watch_toggle_btn.setMinimumWidth(120)
-        self.watch_toggle_btn.setCursor(Qt.PointingHandCursor)
-        self.watch_toggle_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #7C4DFF, stop:1 #9575FF);
-                color: white;
-                border: none;
-                border-radius: 12px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0 20px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #9575FF, stop:1 #B39DFF);
-            }
-            QPushButton:disabled {
-                background: rgba(124, 77, 255, 0.3);
-                color: rgba(255, 255, 255, 0.5);
-            }
-        """)
-        self.watch_toggle_btn.clicked.connect(self._toggle_watch_mode)
-        btn_row.addWidget(self.watch_toggle_btn)
-        
-        btn_row.addStretch()
-        watch_layout.addLayout(btn_row)
-        
-        # Hidden summary label for compatibility
-        self.watch_summary_label = QLabel("")
-        self.watch_summary_label.setVisible(False)
-        
-        parent_layout.addWidget(self.watch_card)
-        
-        # Initial UI update
-        self._update_watch_summary()
-    
-    def _apply_theme_styles(self, theme=None):
-        """Re-apply all theme-dependent inline styles for the current theme."""
-        from app.ui.theme_manager import get_theme_colors
-        c = get_theme_colors(theme)
-
-        # ---- Cards ----
-        self.instruction_card.setStyleSheet(f"""
-            QFrame#organizeCard {{
-                background-color: {c['surface']};
-                border: 1px solid {c['border']};
-                border-radius: 20px;
-                padding: 24px;
-            }}
-        """)
-        self.dest_card.setStyleSheet(f"""
-            QFrame#organizeCard {{
-                background-color: {c['surface']};
-                border: 1px solid {c['border']};
-                border-radius: 20px;
-            }}
-        """)
-        self.watch_card.setStyleSheet(f"""
-            QFrame#watchAutoCard {{
-                background-color: {c['surface']};
-                border: 1px solid {c['border']};
-                border-radius: 20px;
-            }}
-        """)
-
-        # ---- Inputs ----
-        self.instruction_input.setStyleSheet(f"""
-            QLineEdit {{
-                font-size: 15px;
-                padding: 12px 16px;
-                background-color: {c['bg']};
-                border: 1px solid {c['border']};
-                border-radius: 12px;
-                color: {c['text']};
-            }}
-            QLineEdit:focus {{
-                border: 1px solid #7C4DFF;
-                background-color: {c['card']};
-            }}
-            QLineEdit::placeholder {{
-                color: {c['text_disabled']};
-            }}
-        """)
-
-        # ---- Mic button ----
-        self.mic_button.setStyleSheet(f"""
-            QPushButton {{
-                font-size: 18px;
-                background-color: {c['card']};
-                border: 1px solid {c['border']};
-                border-radius: 12px;
-                color: {c['text']};
-                padding: 0px;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(124, 77, 255, 0.08);
-                border-color: #7C4DFF;
-            }}
-            QPushButton:pressed {{
-                background-color: rgba(124, 77, 255, 0.12);
-            }}
-        """)
-
-        # ---- Tab buttons ----
-        self.tab_organize_now.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #7C4DFF;
-                color: white;
-                border: 1px solid #7C4DFF;
-                border-top-left-radius: 12px;
-                border-bottom-left-radius: 12px;
-                border-top-right-radius: 0px;
-                border-bottom-right-radius: 0px;
-                font-weight: 600;
-                font-size: 14px;
-                padding: 10px 20px;
-            }}
-            QPushButton:checked {{
-                background-color: #7C4DFF;
-                color: white;
-            }}
-            QPushButton:!checked {{
-                background-color: {c['tab_unchecked_bg']};
-                color: {c['tab_unchecked_text']};
-                border: 1px solid {c['tab_unchecked_border']};
-            }}
-            QPushButton:!checked:hover {{
-                background-color: rgba(124, 77, 255, 0.06);
-                border-color: rgba(124, 77, 255, 0.30);
-                color: #B39DFF;
-            }}
-        """)
-        self.tab_auto_organize.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {c['tab_unchecked_bg']};
-                color: {c['tab_unchecked_text']};
-                border: 1px solid {c['tab_unchecked_border']};
-                border-top-right-radius: 12px;
-                border-bottom-right-radius: 12px;
-                border-top-left-radius: 0px;
-                border-bottom-left-radius: 0px;
-                font-weight: 600;
-                font-size: 14px;
-                padding: 10px 20px;
-            }}
-            QPushButton:checked {{
-                background-color: #7C4DFF;
-                color: white;
-                border-color: #7C4DFF;
-            }}
-            QPushButton:!checked {{
-                background-color: {c['tab_unchecked_bg']};
-                color: {c['tab_unchecked_text']};
-            }}
-            QPushButton:!checked:hover {{
-                background-color: rgba(124, 77, 255, 0.06);
-                border-color: rgba(124, 77, 255, 0.30);
-                color: #B39DFF;
-            }}
-        """)
-
-        # ---- Generate button ----
-        self.generate_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: rgba(124, 77, 255, 0.08);
-                color: #7C4DFF;
-                border: 1px solid rgba(124, 77, 255, 0.35);
-                border-radius: 12px;
-                font-weight: 700;
-                font-size: 15px;
-            }}
-            QPushButton:hover {{
-                background-color: #7C4DFF;
-                color: white;
-                border-color: #7C4DFF;
-            }}
-            QPushButton:disabled {{
-                background-color: {c['card']};
-                border: 1px solid {c['border']};
-                color: {c['text_disabled']};
-            }}
-        """)
-
-        # ---- Apply button ----
-        self.apply_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: rgba(76, 175, 80, 0.08);
-                color: #4CAF50;
-                border: 1px solid rgba(76, 175, 80, 0.35);
-                border-radius: 12px;
-                font-weight: 700;
-                font-size: 15px;
-            }}
-            QPushButton:hover {{
-                background-color: #4CAF50;
-                color: white;
-                border-color: #4CAF50;
-            }}
-            QPushButton:disabled {{
-                background-color: {c['card']};
-                border-color: {c['border']};
-                color: {c['text_disabled']};
-            }}
-        """)
-
-        # ---- Undo button ----
-        self.undo_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: #9575FF;
-                border: 1px solid rgba(149, 117, 255, 0.30);
-                border-radius: 12px;
-                font-weight: 600;
-                font-size: 15px;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(124, 77, 255, 0.08);
-                color: #B39DFF;
-                border-color: #7C4DFF;
-            }}
-            QPushButton:disabled {{
-                background-color: {c['card']};
-                border-color: {c['border']};
-                color: {c['text_disabled']};
-            }}
-        """)
-
-        # ---- History, Pinned, Edit buttons ----
-        outline_btn_style = f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {c['text_muted']};
-                border: 1px solid {c['border_strong']};
-                border-radius: 12px;
-                font-weight: 600;
-                font-size: 15px;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(124, 77, 255, 0.06);
-                border-color: #7C4DFF;
-                color: #B39DFF;
-            }}
-        """
-        self.history_button.setStyleSheet(outline_btn_style)
-        self.pinned_button.setStyleSheet(outline_btn_style)
-        self.edit_inputs_button.setStyleSheet(outline_btn_style + """
-            QPushButton { padding: 0px 20px; }
-        """)
-
-        # ---- Labels ----
-        self.status_label.setStyleSheet(f"color: {c['text_muted']}; font-style: italic; font-size: 13px;")
-        self.dest_label.setStyleSheet(f"color: {c['text_muted']}; font-size: 13px; background: transparent;")
-        self._examples_label.setStyleSheet(f"color: {c['text_disabled']}; font-size: 12px; background: transparent;")
-        self.plan_summary_label.setStyleSheet(f"""
-            font-family: "Segoe UI", sans-serif;
-            font-size: 13px; font-weight: 500;
-            color: {c['text_muted']}; padding: 4px 0px;
-        """)
-        self.existing_folders_note.setStyleSheet(f"""
-            font-family: "Segoe UI", sans-serif;
-            font-size: 12px; color: {c['text_disabled']};
-            font-style: italic; padding: 2px 0px;
-        """)
-        self.watch_folder_label.setStyleSheet(f"""
-            font-size: 13px; color: {c['text_muted']};
-            background: transparent; padding: 4px 0;
-        """)
-        self._watch_desc.setStyleSheet(f"color: {c['text_muted']}; font-size: 13px; background: transparent;")
-
-        # ---- Action scroll area ----
-        self._action_scroll.setStyleSheet(f"""
-            QScrollArea {{
-                border: none; background: transparent;
-            }}
-            QScrollBar:horizontal {{
-                border: none; background: {c['scrollbar_bg']};
-                height: 8px; border-radius: 4px; margin-top: 4px;
-            }}
-            QScrollBar::handle:horizontal {{
-                background: {c['scrollbar_handle']};
-                border-radius: 4px; min-width: 40px;
-            }}
-            QScrollBar::handle:horizontal:hover {{
-                background: #7C4DFF;
-            }}
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-                width: 0px;
-            }}
-        """)
-
-        # ---- Tree widget ----
-        self.plan_tree.setStyleSheet(f"""
-            QTreeWidget {{
-                background-color: transparent;
-                border: none;
-                font-family: "Segoe UI", sans-serif;
-                font-size: 14px; padding: 4px; outline: none;
-            }}
-            QTreeWidget::item {{
-                height: 38px; color: {c['text']};
-                border-radius: 10px; padding-left: 8px; margin: 2px 0px;
-            }}
-            QTreeWidget::item:hover {{
-                background-color: rgba(124, 77, 255, 0.08);
-            }}
-            QTreeWidget::item:selected {{
-                background-color: rgba(124, 77, 255, 0.15);
-                color: #7C4DFF; font-weight: 600;
-            }}
-            QTreeView::branch {{
-                background: transparent; width: 0px; border: none; image: none;
-            }}
-        """)
+        
+        header_info = QVBoxLayout()
+        header_info.setSpacing(2)
+        
+        watch_title = QLabel("Auto-Organize")
+        watch_title.setObjectName("watchTitle")
+        header_info.addWidget(watch_title)
+        
+        self._watch_desc = QLabel("Monitor folders and organize new files automatically")
+        self._watch_desc.setObjectName("watchDesc")
+        header_info.addWidget(self._watch_desc)
+        
+        header_row.addLayout(header_info, 1)
+        watch_layout.addLayout(header_row)
+        
+        # Separator line
+        separator = QFrame()
+        separator.setFrameShape(QFrame.HLine)
+        separator.setObjectName("watchSeparator")
+        watch_layout.addWidget(separator)
+        
+        # Combined folder count + status on one line
+        self.watch_folder_label = QLabel("📁 No folders configured")
+        self.watch_folder_label.setObjectName("watchFolderLabel")
+        watch_layout.addWidget(self.watch_folder_label)
+        
+        # Buttons row
+        btn_row = QHBoxLayout()
+        btn_row.setSpacing(12)
+        
+        # Edit button (previously Configure)
+        self.watch_config_btn = QPushButton("✏️ Edit")
+        self.watch_config_btn.setMinimumHeight(42)
+        self.watch_config_btn.setMinimumWidth(100)
+        self.watch_config_btn.setCursor(Qt.PointingHandCursor)
+        self.watch_config_btn.setObjectName("watchConfigBtn")
+        self.watch_config_btn.clicked.connect(self._open_watch_config)
+        btn_row.addWidget(self.watch_config_btn)
+        
+        # Start/Stop button (purple theme)
+        self.watch_toggle_btn = QPushButton("▶ Start")
+        self.watch_toggle_btn.setMinimumHeight(42)
+        self.watch_toggle_btn.setMinimumWidth(120)
+        self.watch_toggle_btn.setCursor(Qt.PointingHandCursor)
+        self.watch_toggle_btn.setObjectName("watchToggleBtn")
+        self.watch_toggle_btn.clicked.connect(self._toggle_watch_mode)
+        btn_row.addWidget(self.watch_toggle_btn)
+        
+        btn_row.addStretch()
+        watch_layout.addLayout(btn_row)
+        
+        # Hidden summary label for compatibility
+        self.watch_summary_label = QLabel("")
+        self.watch_summary_label.setVisible(False)
+        
+        parent_layout.addWidget(self.watch_card)
+        
+        # Initial UI update
+        self._do_update_watch_summary()
+    
+    def _apply_theme_styles(self, theme=None):
+        """Re-apply the page stylesheet for the current theme."""
+        self.setStyleSheet(_organize_page_qss(theme or settings.theme))
 
     def _open_watch_config(self):
         """Open the watch configuration dialog."""
@@ -5866,16 +6628,18 @@ class OrganizePage(QWidget):
     def _apply_config_changes(self):
         """Apply configuration changes while watcher is running."""
         # Update folder instructions from settings
-        folder_instructions = {}
-        for folder_data in settings.auto_organize_folders:
-            folder_path = folder_data.get('path', '')
-            instruction = folder_data.get('instruction', '')
-            if folder_path:
-                normalized_path = os.path.normpath(folder_path)
-                folder_instructions[normalized_path] = instruction
+        folder_instructions = {
+            _norm(folder_data['path']): folder_data.get('instruction') or ''
+            for folder_data in settings.auto_organize_folders
+            if folder_data.get('path')
+        }
         
-        # Update watcher's instructions
-        self.auto_watcher.folder_instructions = folder_instructions
+        # Update watcher's instructions - only the folders that actually changed
+        current = self.auto_watcher.folder_instructions
+        changed = {path: inst for path, inst in folder_instructions.items() if current.get(path) != inst}
+        removed = current.keys() - folder_instructions.keys()
+        if changed or removed:
+            self.auto_watcher.update_instructions(changed, removed)
         
         # NOTE: Per-folder organization choices are now handled by the individual "Save" 
         # buttons next to each folder, so we don't show a dialog here when clicking "Done"
@@ -5885,114 +6649,42 @@ class OrganizePage(QWidget):
         logger.info("Applied configuration changes while watching")
     
     def _update_watch_summary(self):
-        """Update the watch status display."""
-        folder_count = len(settings.auto_organize_folders)
-        is_watching = self.auto_watcher and self.auto_watcher.is_running
+        """Schedule a watch status refresh; repeated calls in one tick run it once."""
+        self._summary_timer.start()
+    
+    def _do_update_watch_summary(self, assume_watching: bool = False):
+        """Update the watch status display.
+        
+        Args:
+            assume_watching: Show the active state right away, before the watcher
+                has actually started (used while the existing-file scan runs)
+        """
+        if assume_watching:
+            self._summary_timer.stop()  # A queued refresh would flip this back to idle
+            folder_count = len(self.watch_folders) or len(settings.auto_organize_folders)
+            is_watching = True
+        else:
+            folder_count = len(settings.auto_organize_folders)
+            is_watching = bool(self.auto_watcher and self.auto_watcher.is_running)
         
         if folder_count == 0:
             # No folders configured
             self.watch_folder_label.setText("📁 No folders configured")
-            self.watch_folder_label.setStyleSheet("""
-                font-size: 13px; 
-                color: #7A7A90; 
-                background: transparent;
-                padding: 4px 0;
-            """)
             self.watch_toggle_btn.setEnabled(False)
         else:
             # Show folder count + status on one line
             if is_watching:
                 status_text = f"📁 {folder_count} folder{'s' if folder_count > 1 else ''} • ✅ Active"
-                color = "#7C4DFF"
             else:
                 status_text = f"📁 {folder_count} folder{'s' if folder_count > 1 else ''} configured"
-                color = "#7A7A90"
             
             self.watch_folder_label.setText(status_text)
-            self.watch_folder_label.setStyleSheet(f"""
-                font-size: 13px; 
-                color: {color}; 
-                background: transparent;
-                padding: 4px 0;
-                font-weight: {'500' if is_watching else '400'};
-            """)
-            
             self.watch_toggle_btn.setEnabled(True)
-        
+        _set_style_state(self.watch_folder_label, "state", "watching" if is_watching and folder_count else "idle")
+
         # Update button state (purple theme for both states)
-        if is_watching:
-            self.watch_toggle_btn.setText("⏹ Stop")
-            self.watch_toggle_btn.setStyleSheet("""
-                QPushButton {
-                    background: transparent;
-                    color: #7C4DFF;
-                    border: 2px solid #7C4DFF;
-                    border-radius: 12px;
-                    font-size: 14px;
-                    font-weight: 600;
-                    padding: 0 20px;
-                }
-                QPushButton:hover {
-                    background: rgba(124, 77, 255, 0.1);
-                }
-            """)
-        else:
-            self.watch_toggle_btn.setText("▶ Start")
-            self.watch_toggle_btn.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #7C4DFF, stop:1 #9575FF);
-                    color: white;
-                    border: none;
-                    border-radius: 12px;
-                    font-size: 14px;
-                    font-weight: 600;
-                    padding: 0 20px;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #9575FF, stop:1 #B39DFF);
-                }
-                QPushButton:disabled {
-                    background: rgba(124, 77, 255, 0.3);
-                    color: rgba(255, 255, 255, 0.5);
-                }
-                QPushButton:hover {
-                    background-color: #27ae60;
-                }
-                QPushButton:disabled {
-                    background-color: #3a3a3a;
-                    color: #4A4A5A;
-                }
-            """)
-    
-    def _update_watch_summary_as_watching(self):
-        """Immediately update UI to show watching state (before watcher actually starts)."""
-        # Update folder label to show active status
-        folder_count = len(self.watch_folders) if self.watch_folders else len(settings.auto_organize_folders)
-        self.watch_folder_label.setText(f"📁 {folder_count} folder{'s' if folder_count > 1 else ''} • ✅ Active")
-        self.watch_folder_label.setStyleSheet("""
-            font-size: 13px; 
-            color: #7C4DFF; 
-            background: transparent;
-            padding: 4px 0;
-            font-weight: 500;
-        """)
-        
-        # Update toggle button to Stop state (purple outline)
-        self.watch_toggle_btn.setText("⏹ Stop")
-        self.watch_toggle_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                color: #7C4DFF;
-                border: 2px solid #7C4DFF;
-                border-radius: 12px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0 20px;
-            }
-            QPushButton:hover {
-                background: rgba(124, 77, 255, 0.1);
-            }
-        """)
+        self.watch_toggle_btn.setText("⏹ Stop" if is_watching else "▶ Start")
+        _set_style_state(self.watch_toggle_btn, "state", "watching" if is_watching else "idle")
     
     def _toggle_watch_mode(self):
         """Toggle the watch mode on/off."""
@@ -6026,26 +6718,18 @@ class OrganizePage(QWidget):
         
         # Build per-folder instructions dict from settings
         # CRITICAL: Use os.path.normpath to match watcher's path format
-        folder_instructions = {}
-        has_any_instruction = False
+        folder_instructions = {
+            _norm(folder_data['path']): folder_data.get('instruction') or ''
+            for folder_data in settings.auto_organize_folders
+            if folder_data.get('path') and os.path.isdir(_norm(folder_data['path']))
+        }
         
-        for folder_data in settings.auto_organize_folders:
-            folder_path = folder_data.get('path', '')
-            instruction = folder_data.get('instruction', '')
-            
-            if folder_path:
-                # Normalize the path to match how watcher stores folders
-                normalized_path = os.path.normpath(folder_path)
-                
-                if os.path.isdir(normalized_path):
-                    self.auto_watcher.add_folder(normalized_path)
-                    self.watch_folders.append(normalized_path)
-                    folder_instructions[normalized_path] = instruction
-                    
-                    if instruction:
-                        has_any_instruction = True
-                    
-                    logger.info(f"Added watch folder: {normalized_path} with instruction: {instruction[:30] if instruction else '(none)'}...")
+        for normalized_path, instruction in folder_instructions.items():
+            self.auto_watcher.add_folder(normalized_path)
+            self.watch_folders.append(normalized_path)
+            # Lazy %-args: nothing is formatted unless INFO is enabled
+            logger.info("Added watch folder: %s with instruction: %s...",
+                        normalized_path, instruction[:30] if instruction else '(none)')
         
         if not self.watch_folders:
             QMessageBox.warning(
@@ -6062,53 +6746,60 @@ class OrganizePage(QWidget):
             self.auto_watcher.catch_up_since = catch_up_since
         
         # UPDATE UI IMMEDIATELY - show "watching" state right away
-        self._update_watch_summary_as_watching()
+        self._do_update_watch_summary(assume_watching=True)
         
-        # Process events to update UI before dialog
-        from PySide6.QtWidgets import QApplication
-        QApplication.processEvents()
+        # The existing-files popup is the scan's only consumer; without it, start now
+        if is_catch_up or skip_existing_popup:
+            self._pending_watch_start = False  # Ignore any scan still in flight
+            self.auto_watcher.start(organize_existing=is_catch_up, flatten_first=False)
+            return
         
-        # Count existing files (including files in subfolders)
-        existing_count = 0
-        subfolder_count = 0
-        for folder in self.watch_folders:
-            try:
-                for item in os.listdir(folder):
-                    item_path = os.path.join(folder, item)
-                    if os.path.isfile(item_path):
-                        existing_count += 1
-                    elif os.path.isdir(item_path) and not item.startswith('.'):
-                        # Count files in subfolders too
-                        subfolder_count += 1
-                        for sub_item in os.listdir(item_path):
-                            if os.path.isfile(os.path.join(item_path, sub_item)):
-                                existing_count += 1
-            except Exception:
-                pass
+        # Count existing files off the UI thread; the popup follows once counts are known
+        self._pending_watch_start = True
+        if self._scan_worker is None:
+            self.watch_toggle_btn.setEnabled(False)
+            self._scan_worker = ExistingFilesScanWorker(list(self.watch_folders))
+            self._scan_worker.finished.connect(self._on_existing_scan_done)
+            self._scan_worker.start()
+    
+    def _on_existing_scan_done(self, existing_count: int, subfolder_count: int, truncated: bool):
+        """Ask what to do with existing files, then start the watcher."""
+        self._scan_worker.wait()
+        self._scan_worker = None
+        self.watch_toggle_btn.setEnabled(True)
         
-        # Ask user what to do with existing files
+        if not self._pending_watch_start:
+            return  # Watch mode was stopped (or started without the popup) while scanning
+        self._pending_watch_start = False
+        
+        # Ask user what to do with existing files (only when there are any)
         organize_existing = False
         flatten_first = False
         
-        total_items = existing_count + subfolder_count
-        if total_items > 0 and not is_catch_up and not skip_existing_popup:
-            dialog = ApplyInstructionsDialog(self, existing_count, subfolder_count)
-            dialog.exec()
-            
-            if dialog.result_choice == ApplyInstructionsDialog.REORGANIZE_ALL:
-                organize_existing = True
-                flatten_first = True
-            elif dialog.result_choice == ApplyInstructionsDialog.ORGANIZE_AS_IS:
-                organize_existing = True
-            # else: CONTINUE_WATCHING - just watch, don't organize existing
-        elif is_catch_up:
-            organize_existing = True
+        if existing_count + subfolder_count > 0:
+            choice = self._ask_reorganize(existing_count, subfolder_count, truncated)
+            organize_existing = choice != 'continue'  # 'continue' - just watch
+            flatten_first = choice == 'reorganize'
         
         # Start the watcher
         self.auto_watcher.start(organize_existing=organize_existing, flatten_first=flatten_first)
+    
+    def _ask_reorganize(self, existing_count: int, subfolder_count: int, truncated: bool = False) -> str:
+        """Ask how to treat files already in the watched folders.
+        
+        Returns:
+            'reorganize', 'organize' or 'continue'
+        """
+        dialog = ApplyInstructionsDialog(self, existing_count, subfolder_count, truncated=truncated)
+        dialog.exec()
+        return {
+            ApplyInstructionsDialog.REORGANIZE_ALL: 'reorganize',
+            ApplyInstructionsDialog.ORGANIZE_AS_IS: 'organize',
+        }.get(dialog.result_choice, 'continue')
         
     def _stop_watch_mode(self):
         """Stop watching folders."""
+        self._pending_watch_start = False
         if self.auto_watcher:
             self.auto_watcher.stop()
         
@@ -6151,10 +6842,38 @@ class OrganizePage(QWidget):
     def _on_watch_file_indexed(self, file_path: str):
         """Handle file indexed signal from watcher."""
         logger.info(f"Watch auto-indexed: {file_path}")
-        # Update usage display in main window
+        # Update usage display in main window (fetched in the background)
+        self._refresh_usage_labels_async()
+    
+    def _refresh_usage_labels_async(self):
+        """Refresh the main window's usage labels without blocking the UI thread.
+        
+        The usage query is a network round-trip, so it runs in a worker. Requests
+        arriving while one is in flight are collapsed into a single follow-up refresh.
+        """
         main_window = self.window()
-        if main_window and hasattr(main_window, '_update_usage_labels'):
-            main_window._update_usage_labels()
+        if not main_window or not hasattr(main_window, '_fetch_usage_text'):
+            return
+        
+        if self._usage_worker is not None:
+            self._usage_refresh_pending = True
+            return
+        
+        self._usage_refresh_pending = False
+        self._usage_worker = UsageRefreshWorker(main_window._fetch_usage_text)
+        self._usage_worker.finished.connect(main_window._apply_usage_text)
+        self._usage_worker.finished.connect(self._on_usage_refresh_done)
+        self._usage_worker.error.connect(main_window._clear_usage_text)
+        self._usage_worker.error.connect(self._on_usage_refresh_done)
+        self._usage_worker.start()
+    
+    def _on_usage_refresh_done(self, _result: str = ""):
+        """Run one more refresh if files were indexed while the last one was in flight."""
+        # The result is emitted as the last step of run(), so this wait is immediate
+        self._usage_worker.wait()
+        self._usage_worker = None
+        if self._usage_refresh_pending:
+            self._refresh_usage_labels_async()
     
     def _on_watch_status(self, status: str):
         """Handle status updates from watcher."""
@@ -6171,6 +6890,10 @@ class OrganizePage(QWidget):
             self._update_file_count()
     
     def _update_file_count(self):
+        """Schedule a file count refresh; repeated calls in one tick query once."""
+        self._file_count_timer.start()
+    
+    def _do_update_file_count(self):
         """Show how many indexed files are available."""
         try:
             count = file_index.get_file_count()
@@ -6197,7 +6920,6 @@ class OrganizePage(QWidget):
         
         # Show tips for the new tab after a short delay
         if hasattr(main_window, 'tips_manager'):
-            from PySide6.QtCore import QTimer
             QTimer.singleShot(150, main_window.tips_manager.show_tips_for_visible_widgets)
     def _hide_input_cards(self):
         """Hide instruction and destination cards after plan is generated."""
@@ -6218,7 +6940,8 @@ class OrganizePage(QWidget):
         self.apply_button.setVisible(False)
         self.clear_button.setVisible(False)
         self.undo_button.setVisible(False)
-        self.feedback_group.setVisible(False)
+        if self.feedback_group is not None:
+            self.feedback_group.setVisible(False)
     
     def _show_plan_summary(self, folder_count: int, file_count: int, total_size_mb: float):
         """Show the plan summary line."""
@@ -6241,7 +6964,8 @@ class OrganizePage(QWidget):
         """Hide plan-related UI elements."""
         self.plan_summary_label.setVisible(False)
         self.existing_folders_note.setVisible(False)
-        self.results_splitter.setVisible(False)
+        if self.results_splitter is not None:
+            self.results_splitter.setVisible(False)
         self.edit_inputs_button.setVisible(False)
 
     
@@ -6252,10 +6976,9 @@ class OrganizePage(QWidget):
         )
         if folder:
             self.destination_path = Path(folder)
+            self._dest_top_level_names = None
             self.dest_label.setText(str(self.destination_path))
-            from app.ui.theme_manager import get_theme_colors
-            c = get_theme_colors()
-            self.dest_label.setStyleSheet(f"color: {c['text']}; font-weight: bold; font-size: 13px; background: transparent;")
+            _set_style_state(self.dest_label, "selected", True)
             self._update_generate_button()
     
     def _update_generate_button(self):
@@ -6274,24 +6997,14 @@ class OrganizePage(QWidget):
         """Start recording voice input."""
         self.is_recording_voice = True
         self.mic_button.setText("⏹️")
-        self.mic_button.setStyleSheet("""
-            QPushButton {
-                font-size: 18px;
-                background-color: #ff4444;
-                border: 1px solid #cc0000;
-                border-radius: 6px;
-                color: white;
-            }
-            QPushButton:hover {
-                background-color: #ff6666;
-            }
-        """)
+        _set_style_state(self.mic_button, "recording", True)
         self.mic_button.setToolTip("Recording... Click to stop")
         self.status_label.setText("🎤 Recording... Speak your instruction, then click to stop.")
         
         # Start voice worker
         self.voice_worker = VoiceRecordWorker()
         self.voice_worker.finished.connect(self._on_voice_transcribed)
+        self.voice_worker.partial.connect(self._on_voice_partial)
         self.voice_worker.error.connect(self._on_voice_error)
         self.voice_worker.recording_stopped.connect(self._on_recording_stopped)
         self.voice_worker.start()
@@ -6324,6 +7037,12 @@ class OrganizePage(QWidget):
         else:
             self.status_label.setText("No speech detected. Try again.")
     
+    def _on_voice_partial(self, text: str):
+        """Show the speech transcribed so far while recording continues."""
+        if self.is_recording_voice and text:
+            tail = text if len(text) <= 60 else f"…{text[-60:]}"
+            self.status_label.setText(f"🎤 Heard: \"{tail}\"")
+    
     def _on_voice_error(self, error: str):
         """Handle voice recording errors."""
         self.is_recording_voice = False
@@ -6341,26 +7060,8 @@ class OrganizePage(QWidget):
     
     def _reset_mic_button(self):
         """Reset mic button to default state."""
-        from app.ui.theme_manager import get_theme_colors
-        c = get_theme_colors()
         self.mic_button.setText("🎤")
-        self.mic_button.setStyleSheet(f"""
-            QPushButton {{
-                font-size: 18px;
-                background-color: {c['card']};
-                border: 1px solid {c['border']};
-                border-radius: 12px;
-                color: {c['text']};
-                padding: 0px;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(124, 77, 255, 0.08);
-                border-color: #7C4DFF;
-            }}
-            QPushButton:pressed {{
-                background-color: rgba(124, 77, 255, 0.12);
-            }}
-        """)
+        _set_style_state(self.mic_button, "recording", False)
         self.mic_button.setToolTip("Click to speak your instruction (click again to stop)")
 
     def _load_files_from_db(self) -> List[Dict[str, Any]]:
@@ -6376,44 +7077,51 @@ class OrganizePage(QWidget):
         
         # Get destination path for filtering (normalized, case-insensitive on Windows)
         dest_path_str = None
+        dest_prefix = None
         if self.destination_path:
             dest_path_str = os.path.normpath(str(self.destination_path)).lower()
+            dest_prefix = dest_path_str + os.sep
+        
+        _pt = self._parse_tags
+        should_exclude = settings.should_exclude
+        files_by_id = self.files_by_id
         
         try:
-            with sqlite3.connect(file_index.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM files")
-                rows = cursor.fetchall()
-            
-            for row in rows:
-                file_path = row["file_path"]
-                
-                # CRITICAL: Only include files within the destination folder
-                # This prevents files from other indexed locations being moved
-                if dest_path_str:
-                    normalized_file_path = os.path.normpath(file_path).lower()
-                    if not normalized_file_path.startswith(dest_path_str + os.sep) and normalized_file_path != dest_path_str:
-                        outside_folder_count += 1
-                        continue  # Skip files outside destination folder
-                
-                # Skip files matching exclusion patterns
-                if settings.should_exclude(file_path):
-                    excluded_count += 1
-                    continue
-                
-                f = {
-                    "id": row["id"],
-                    "file_path": file_path,
-                    "file_name": row["file_name"],
-                    "file_size": row["file_size"] or 0,
-                    "label": row["label"] if "label" in row.keys() else None,
-                    "caption": row["caption"] if "caption" in row.keys() else None,
-                    "tags": self._parse_tags(row["tags"] if "tags" in row.keys() else None),
-                    "category": row["category"] if "category" in row.keys() else None,
-                }
-                files.append(f)
-                self.files_by_id[row["id"]] = f
+            if self._db_conn is None:
+                self._db_conn = sqlite3.connect(file_index.db_path)
+                self.destroyed.connect(self._db_conn.close)
+            # Label/tags/caption are guaranteed by the schema migration in database.py
+            cursor = self._db_conn.execute(_LOAD_FILES_SQL)
+            try:
+                while rows := cursor.fetchmany(1000):
+                    for file_id, file_path, file_name, file_size, label, caption, tags, category in rows:
+                        # CRITICAL: Only include files within the destination folder
+                        # This prevents files from other indexed locations being moved
+                        if dest_path_str:
+                            normalized_file_path = os.path.normpath(file_path).lower()
+                            if not normalized_file_path.startswith(dest_prefix) and normalized_file_path != dest_path_str:
+                                outside_folder_count += 1
+                                continue  # Skip files outside destination folder
+                        
+                        # Skip files matching exclusion patterns
+                        if should_exclude(file_path):
+                            excluded_count += 1
+                            continue
+                        
+                        f = {
+                            "id": file_id,
+                            "file_path": file_path,
+                            "file_name": file_name,
+                            "file_size": file_size or 0,
+                            "label": label,
+                            "caption": caption,
+                            "tags": _pt(tags),
+                            "category": category,
+                        }
+                        files.append(f)
+                        files_by_id[file_id] = f
+            finally:
+                cursor.close()
             
             if outside_folder_count > 0:
                 logger.info(f"Filtered out {outside_folder_count} files outside destination folder")
@@ -6474,209 +7182,35 @@ class OrganizePage(QWidget):
         
         return list(set(matched_exclusions))  # Remove duplicates
     
-    def _parse_tags(self, raw) -> List[str]:
-        """Parse tags from DB storage format."""
-        if not raw:
-            return []
-        if isinstance(raw, list):
-            return raw
-        try:
-            v = json.loads(raw)
-            if isinstance(v, list):
-                return [str(t) for t in v]
-        except:
-            pass
-        if isinstance(raw, str):
-            return [t.strip() for t in raw.split(",") if t.strip()]
-        return []
-    
-    def _verify_and_fix_paths(self, files: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """
-        Verify file paths and fix them if files have been moved.
-        
-        For each file:
-        1. Check if it exists at the recorded path
-        2. If not, search for it by name in the destination folder
-        3. Try partial matching for renamed files (Windows adds (1), (2) etc)
-        4. If found elsewhere, update the database path
-        5. If not found anywhere, remove from the list
-        
-        Returns the list of files with verified/updated paths.
-        """
-        if not files or not self.destination_path:
-            return files
-        
-        verified_files = []
-        updated_count = 0
-        updated_names = []
-        removed_count = 0
-        removed_names = []
-        
-        # Build a map of all files in the destination folder for quick lookup
-        existing_files = {}  # exact filename -> [paths]
-        all_files_list = []  # [(filename_lower, full_path), ...] for partial matching
-        try:
-            for root, dirs, filenames in os.walk(str(self.destination_path)):
-                for filename in filenames:
-                    full_path = os.path.join(root, filename)
-                    # Store by filename (lowercase for case-insensitive matching)
-                    key = filename.lower()
-                    if key not in existing_files:
-                        existing_files[key] = []
-                    existing_files[key].append(full_path)
-                    all_files_list.append((key, full_path))
-        except Exception as e:
-            logger.warning(f"Error scanning destination folder: {e}")
-        
-        logger.info(f"Scanned {len(all_files_list)} files in destination folder")
-        
-        for f in files:
-            file_path = f.get("file_path", "")
-            file_name = f.get("file_name", "")
-            file_id = f.get("id")
-            
-            # Check if file exists at recorded path
-            if os.path.exists(file_path):
-                verified_files.append(f)
-                continue
-            
-            # File not at recorded path - try to find it
-            logger.info(f"File not found at recorded path: {file_path}")
-            
-            # Search by exact filename in destination folder
-            key = file_name.lower()
-            candidates = existing_files.get(key, [])
-            
-            new_path = None
-            
-            if candidates:
-                # Found file(s) with exact same name
-                new_path = candidates[0]
-                candidates.pop(0)
-            else:
-                # Try partial matching - look for files that start with same base name
-                # This handles Windows renaming like "file.png" -> "file (1).png"
-                base_name = os.path.splitext(file_name)[0].lower()
-                extension = os.path.splitext(file_name)[1].lower()
-                
-                for existing_name, existing_path in all_files_list:
-                    # Check if existing file starts with our base name and has same extension
-                    if existing_name.startswith(base_name) and existing_name.endswith(extension):
-                        # Make sure it's not already matched to another file
-                        if existing_path not in [vf.get("file_path") for vf in verified_files]:
-                            new_path = existing_path
-                            logger.info(f"Partial match: {file_name} -> {os.path.basename(existing_path)}")
-                            break
-            
-            if new_path:
-                logger.info(f"Found moved file: {file_name} -> {new_path}")
-                
-                # Update database
-                if file_index.update_file_path(file_id, new_path):
-                    f["file_path"] = new_path
-                    verified_files.append(f)
-                    updated_count += 1
-                    updated_names.append(f"{file_name} → {os.path.basename(new_path)}")
-                else:
-                    logger.warning(f"Failed to update path in database for {file_name}")
-                    removed_count += 1
-                    removed_names.append(file_name)
-            else:
-                # File not found anywhere - skip it
-                logger.info(f"File no longer exists, skipping: {file_name}")
-                removed_count += 1
-                removed_names.append(file_name)
-        
-        # Show summary dialog if changes were made
-        if updated_count > 0 or removed_count > 0:
-            logger.info(f"Path verification: {updated_count} updated, {removed_count} removed, {len(verified_files)} verified")
-            
-            msg_parts = []
-            if updated_count > 0:
-                msg_parts.append(f"✓ Updated {updated_count} file path(s):")
-                for name in updated_names[:5]:
-                    msg_parts.append(f"   • {name}")
-                if len(updated_names) > 5:
-                    msg_parts.append(f"   ... and {len(updated_names) - 5} more")
-            
-            # Silent path verification - just update status bar, no popup
-            status_msg = f"Path check: {updated_count} fixed"
-            if removed_count > 0:
-                status_msg += f", {removed_count} missing"
-            status_msg += f". Sending {len(verified_files)} files to AI..."
-            self.status_label.setText(status_msg)
-        
-        return verified_files
-    
-    def _check_for_unindexed_files(self) -> List[str]:
-        """
-        Scan destination folder for files not in the database.
-        
-        Returns list of unindexed file paths.
-        """
-        if not self.destination_path or not self.destination_path.exists():
+    def _parse_tags(self, raw) -> List[str]:
+        """Parse tags from DB storage format."""
+        if not raw:
             return []
-        
-        unindexed_files = []
-        
+        if isinstance(raw, list):
+            return raw
+        if isinstance(raw, str):
+            # Only a JSON list can start with '[', so comma-separated rows skip the decoder
+            if raw.lstrip()[:1] == "[":
+                try:
+                    v = json.loads(raw)
+                    if isinstance(v, list):
+                        return [str(t) for t in v]
+                except ValueError:
+                    pass
+            return [t.strip() for t in raw.split(",") if t.strip()]
         try:
-            # Get all indexed file paths (normalized for comparison)
-            indexed_paths = set()
-            with sqlite3.connect(file_index.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT file_path FROM files")
-                for row in cursor.fetchall():
-                    indexed_paths.add(os.path.normpath(row[0]).lower())
-            
-            # Scan destination folder for files
-            for root, dirs, filenames in os.walk(str(self.destination_path)):
-                for filename in filenames:
-                    file_path = os.path.join(root, filename)
-                    normalized_path = os.path.normpath(file_path).lower()
-                    
-                    # Skip if already indexed or matches exclusion
-                    if normalized_path in indexed_paths:
-                        continue
-                    if settings.should_exclude(file_path):
-                        continue
-                    
-                    unindexed_files.append(file_path)
-            
-        except Exception as e:
-            logger.error(f"Error checking for unindexed files: {e}")
-        
-        return unindexed_files
+            v = json.loads(raw)
+        except (TypeError, ValueError):
+            return []
+        return [str(t) for t in v] if isinstance(v, list) else []
     
     def generate_plan(self):
         """Request organization plan from LLM."""
         instruction = self.instruction_input.text().strip()
         
-        if not self.destination_path:
+        if not self.destination_path or self._verify_worker is not None:
             return
         
-        # Check for unindexed files and offer to index them with full AI analysis
-        unindexed_files = self._check_for_unindexed_files()
-        if unindexed_files:
-            # Ask user if they want to index new files first
-            confirmed = ModernConfirmDialog.ask(
-                self,
-                title="New Files Detected",
-                message=f"Found {len(unindexed_files)} new file(s) that haven't been analyzed yet.",
-                details=[
-                    "AI analysis provides better organization",
-                    "Files will be tagged and categorized",
-                    "This only takes a moment"
-                ],
-                info_text="Indexing ensures the AI can make smart organization decisions.",
-                yes_text="Index Now",
-                no_text="Skip"
-            )
-            
-            if confirmed:
-                # Trigger full AI indexing, then continue with plan
-                self._index_folder_before_organize(self.destination_path)
-                return  # Will call generate_plan again after indexing
-        
         # Check if instruction mentions excluded file types
         if instruction:
             excluded_types_mentioned = self._check_instruction_for_exclusions(instruction)
@@ -6712,16 +7246,7 @@ class OrganizePage(QWidget):
             if not confirmed:
                 return
             
-            # Use auto-organize instruction - MUST organize ALL files
-            instruction = (
-                "[AUTO-ORGANIZE] Organize ALL of the provided files into a logical folder structure. "
-                "CRITICAL: EVERY single file must be placed in a folder - do NOT leave any file out. "
-                "Keep it simple - use only a few broad, clear folder names (e.g., screenshots, documents, images). "
-                "Avoid deep nesting (no subfolders inside subfolders). "
-                "Group similar files together based on their type, tags, and content. "
-                "If some files don't fit any clear category, put them in a 'misc' or 'other' folder. "
-                "EVERY file_id provided MUST appear in exactly one folder."
-            )
+            instruction = _AUTO_ORGANIZE_INSTRUCTION
         
         # Save the instruction for potential refinement
         self.original_instruction = instruction
@@ -6732,21 +7257,18 @@ class OrganizePage(QWidget):
             # No indexed files - check if destination folder has files to index
             if self.destination_path and self.destination_path.exists():
                 # Count files in destination folder
-                folder_files = []
+                folder_file_count = 0
                 try:
-                    for item in os.listdir(str(self.destination_path)):
-                        item_path = os.path.join(str(self.destination_path), item)
-                        if os.path.isfile(item_path):
-                            folder_files.append(item_path)
+                    folder_file_count = _count_files(self.destination_path)
                 except Exception as e:
                     logger.error(f"Error scanning destination folder: {e}")
                 
-                if folder_files:
+                if folder_file_count:
                     # Ask user if they want to index the folder first
                     reply = QMessageBox.question(
                         self,
                         "Index Files First?",
-                        f"Found {len(folder_files)} file(s) in the destination folder that haven't been indexed.\n\n"
+                        f"Found {folder_file_count} file(s) in the destination folder that haven't been indexed.\n\n"
                         "Would you like to index them now? This is required before organizing.",
                         QMessageBox.Yes | QMessageBox.No,
                         QMessageBox.Yes
@@ -6765,10 +7287,71 @@ class OrganizePage(QWidget):
             )
             return
         
-        # Verify file paths and fix any that have been moved
+        # Verify file paths and fix any that have been moved (off the UI thread)
         self.status_label.setText("Verifying file paths...")
-        original_count = len(files)
-        files = self._verify_and_fix_paths(files)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, len(files))
+        self.progress_bar.setValue(0)
+        self.generate_button.setEnabled(False)
+        self.apply_button.setEnabled(False)
+        
+        self._verify_worker = PathVerifyWorker(
+            files, self.destination_path,
+            last_fingerprint=settings.get_verified_destination_fingerprint(str(self.destination_path)),
+            cached_names=self._dest_top_level_names,
+        )
+        self._verify_worker.progress.connect(self._on_verify_progress)
+        self._verify_worker.finished.connect(self._on_paths_verified)
+        self._verify_worker.start()
+    
+    def _on_verify_progress(self, current: int, total: int):
+        """Handle path verification progress updates."""
+        self.progress_bar.setValue(current)
+        self.status_label.setText(f"Verifying file paths... {current}/{total}")
+    
+    def _on_paths_verified(self, files: list, updated_count: int, removed_count: int, unindexed_files: list):
+        """Continue plan generation once the moved-file check is done."""
+        original_count = len(self._verify_worker.files)
+        self._dest_top_level_names = self._verify_worker.top_level_names
+        # Remember a clean check so the next plan (even after a restart) can skip the walk.
+        # Not while new files are waiting: a skipped walk couldn't offer them again.
+        clean = updated_count == 0 and removed_count == 0 and not unindexed_files
+        settings.set_verified_destination_fingerprint(
+            str(self.destination_path), self._verify_worker.fingerprint if clean else None
+        )
+        self._verify_worker.wait()
+        self._verify_worker = None
+        instruction = self.original_instruction
+        
+        # Offer to index files the verification walk found without an index entry
+        if unindexed_files:
+            confirmed = ModernConfirmDialog.ask(
+                self,
+                title="New Files Detected",
+                message=f"Found {len(unindexed_files)} new file(s) that haven't been analyzed yet.",
+                details=[
+                    "AI analysis provides better organization",
+                    "Files will be tagged and categorized",
+                    "This only takes a moment"
+                ],
+                info_text="Indexing ensures the AI can make smart organization decisions.",
+                yes_text="Index Now",
+                no_text="Skip"
+            )
+            
+            if confirmed:
+                # Trigger full AI indexing, then continue with plan
+                self.progress_bar.setVisible(False)
+                self._index_folder_before_organize(self.destination_path)
+                return  # Will call generate_plan again after indexing
+        
+        if updated_count > 0 or removed_count > 0:
+            # Silent path verification - just update status bar, no popup
+            status_msg = f"Path check: {updated_count} fixed"
+            if removed_count > 0:
+                status_msg += f", {removed_count} missing"
+            status_msg += f". Sending {len(files)} files to AI..."
+            self.status_label.setText(status_msg)
         
         # Re-filter exclusions after path verification (paths may have changed)
         excluded_after_verify = 0
@@ -6787,6 +7370,8 @@ class OrganizePage(QWidget):
         self.files_by_id = {f["id"]: f for f in files}
         
         if not files:
+            self.progress_bar.setVisible(False)
+            self.generate_button.setEnabled(True)
             QMessageBox.warning(
                 self, "No Valid Files",
                 f"All {original_count} indexed files have been moved or deleted.\n\n"
@@ -6794,12 +7379,18 @@ class OrganizePage(QWidget):
             )
             return
         
+        # Same request answered before: show it now, no worker or signal hop
+        cached_plan = request_organization_plan(instruction, files, cached_only=True)
+        if cached_plan is not None:
+            self._on_plan_received(cached_plan)
+            return
+        
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)
         self.generate_button.setEnabled(False)
         self.apply_button.setEnabled(False)
         self.status_label.setText(f"Asking AI to organize {len(files)} files...")
-        self.plan_tree.clear()
+        self._populate_tree({})
         # Details panel removed
         
         self.plan_worker = PlanWorker(instruction, files)
@@ -6810,12 +7401,8 @@ class OrganizePage(QWidget):
     def _index_folder_before_organize(self, folder_path: Path):
         """Index a folder before organizing, then continue with organization."""
         # Count files to index
-        file_count = 0
         try:
-            for item in os.listdir(str(folder_path)):
-                item_path = os.path.join(str(folder_path), item)
-                if os.path.isfile(item_path):
-                    file_count += 1
+            file_count = _count_files(folder_path)
         except Exception:
             file_count = 0
         
@@ -6937,6 +7524,17 @@ class OrganizePage(QWidget):
         if main_window and hasattr(main_window, '_update_usage_labels'):
             main_window._update_usage_labels()
 
+    def _proposed_folder_exists(self, folder_name: str) -> bool:
+        """Check a plan folder against the destination listing from path verification."""
+        names = self._dest_top_level_names
+        parts = Path(folder_name).parts
+        if names is not None and parts and not Path(folder_name).is_absolute() and parts[0] not in ('.', '..'):
+            if os.path.normcase(parts[0]) not in names:
+                return False
+            if len(parts) == 1:
+                return True
+        return (self.destination_path / folder_name).exists()
+    
     def _on_plan_received(self, plan: Optional[Dict[str, Any]]):
         """Handle LLM plan response."""
         self.progress_bar.setVisible(False)
@@ -6950,37 +7548,48 @@ class OrganizePage(QWidget):
             )
             return
         
-        # Deduplicate file IDs (AI sometimes puts same file in multiple folders)
-        plan = deduplicate_plan(plan)
-        
         valid_ids = set(self.files_by_id.keys())
         
         # GRACEFUL RECOVERY: Filter out invalid file IDs from the plan
-        # This prevents "Unknown file_id" errors if AI hallucinates IDs
+        # This prevents "Unknown file_id" errors if AI hallucinates IDs.
+        # The same pass deduplicates (AI sometimes puts same file in multiple folders),
+        # keeping the first occurrence, and collects the IDs the plan uses.
+        used_ids = set()
         if "folders" in plan:
             cleaned_folders = {}
+            duplicates_removed = 0
             for folder_name, file_ids in plan["folders"].items():
+                if not isinstance(file_ids, list):
+                    continue
                 valid_file_ids = []
                 for fid in file_ids:
                     # Handle both int and string IDs
-                    try:
-                        fid_int = int(fid)
-                        if fid_int in valid_ids:
-                            valid_file_ids.append(fid_int)
-                    except (ValueError, TypeError):
+                    if type(fid) is not int:
+                        try:
+                            fid = int(fid)
+                        except (ValueError, TypeError):
+                            continue
+                    if fid not in valid_ids:
+                        continue
+                    if fid in used_ids:
+                        duplicates_removed += 1
                         continue
+                    used_ids.add(fid)
+                    valid_file_ids.append(fid)
                 
                 if valid_file_ids:
                     cleaned_folders[folder_name] = valid_file_ids
             
-            plan["folders"] = cleaned_folders
+            if duplicates_removed > 0:
+                logger.warning(f"Removed {duplicates_removed} duplicate file_id(s) from AI plan")
+            plan = {"folders": cleaned_folders}
 
         # Only ensure ALL files are included in AUTO-ORGANIZE mode
         # For specific instructions (e.g., "move screenshots to X"), we want to leave other files untouched
         is_auto_organize = self.original_instruction and self.original_instruction.startswith("[AUTO-ORGANIZE]")
         if is_auto_organize:
             files_list = list(self.files_by_id.values())
-            plan = ensure_all_files_included(plan, valid_ids, files_list)
+            plan = ensure_all_files_included(plan, valid_ids, files_list, included_ids=used_ids)
         
         is_valid, errors = validate_plan(plan, valid_ids)
         
@@ -6989,17 +7598,11 @@ class OrganizePage(QWidget):
             if len(errors) > 10:
                 error_text += f"\n... and {len(errors) - 10} more errors"
             
-            # Log what the AI actually returned for debugging
-            logger.warning(f"Invalid plan from AI: {plan}")
+            # Log the errors and what the AI actually returned for debugging
+            logger.warning(f"Invalid plan from AI:\n{error_text}\nPlan: {plan}")
             
             self.status_label.setText("Plan validation failed")
             
-            # Build detailed error display
-            details = f"Validation Errors:\n{'='*40}\n\n{error_text}\n\n"
-            details += f"{'='*40}\nAI Response (for debugging):\n"
-            details += json.dumps(plan, indent=2, default=str)[:1000]  # Limit length
-            # Details panel removed - summary shown in plan_summary_label
-            
             # More helpful error message
             first_error = errors[0] if errors else "Unknown error"
             if "folders" in first_error.lower():
@@ -7022,12 +7625,15 @@ class OrganizePage(QWidget):
         
         # Calculate plan statistics
         folder_count = len(plan.get("folders", {}))
-        file_count = sum(len(f_ids) for f_ids in plan.get("folders", {}).values())
-        total_size = sum(
-            self.files_by_id.get(fid, {}).get('file_size', 0) 
-            for folder_files in plan.get("folders", {}).values() 
-            for fid in folder_files
-        )
+        file_count = 0
+        total_size = 0
+        files_by_id = self.files_by_id
+        for folder_files in plan.get("folders", {}).values():
+            file_count += len(folder_files)
+            for fid in folder_files:
+                info = files_by_id.get(fid)
+                if info:
+                    total_size += info.get('file_size', 0)
         total_size_mb = total_size / (1024 * 1024)
         
         # Show plan summary
@@ -7037,8 +7643,7 @@ class OrganizePage(QWidget):
         existing_folders = []
         if self.destination_path and self.destination_path.exists():
             for folder_name in plan.get("folders", {}).keys():
-                proposed_path = self.destination_path / folder_name
-                if proposed_path.exists():
+                if self._proposed_folder_exists(folder_name):
                     existing_folders.append(folder_name)
         self._show_existing_folders_warning(existing_folders)
         
@@ -7047,20 +7652,6 @@ class OrganizePage(QWidget):
         
         self._display_plan(plan)
         
-        # Check for folders that already exist in destination
-        existing_folders = []
-        if self.destination_path and self.destination_path.exists():
-            for folder_name in plan.get("folders", {}).keys():
-                proposed_path = self.destination_path / folder_name
-                if proposed_path.exists():
-                    existing_folders.append(folder_name)
-        
-        if existing_folders:
-            folder_list = ", ".join(existing_folders[:3])
-            if len(existing_folders) > 3:
-                folder_list += f" and {len(existing_folders) - 3} more"
-            # self.details_text.append(f"\n" + "="*50 + f"\nNote: {len(existing_folders)} folder(s) already exist: {folder_list}\nFiles will be added to existing folders.")
-        
         folder_count = len(plan.get("folders", {}))
         files_in_plan = sum(len(fids) for fids in plan.get("folders", {}).values())
         valid_moves = len(self.current_moves)
@@ -7090,9 +7681,11 @@ class OrganizePage(QWidget):
         
         # Show refinement section and other elements if we have a valid plan
         if folder_count > 0 or files_in_plan > 0:
+            self._ensure_feedback_ui()
             self.feedback_group.setVisible(True)
             self.feedback_input.clear()
             # Show the results section and action buttons
+            self._ensure_results_ui()
             self.results_splitter.setVisible(True)
             self.apply_button.setVisible(True)
             self.clear_button.setVisible(True)
@@ -7105,61 +7698,120 @@ class OrganizePage(QWidget):
         self.status_label.setText(f"Error: {error}")
         logger.error(f"Plan generation error: {error}")
 
-    def _display_plan(self, plan: Dict[str, Any]):
-        """Show the organization plan in the tree widget."""
-        self.plan_tree.clear()
+    def _ensure_results_ui(self):
+        """Build the plan results area the first time a plan needs to be shown."""
+        if self.results_splitter is not None:
+            return
         
-        # Connect expand/collapse signals to update arrows
-        try:
-            self.plan_tree.itemExpanded.disconnect()
-            self.plan_tree.itemCollapsed.disconnect()
-        except:
-            pass
-        self.plan_tree.itemExpanded.connect(self._on_folder_expanded)
-        self.plan_tree.itemCollapsed.connect(self._on_folder_collapsed)
+        self.results_splitter = QSplitter(Qt.Horizontal)
+        self.results_splitter.setChildrenCollapsible(False)
         
-        folders = plan.get("folders", {})
+        # Plan Tree Card - Matching the clean input card style
+        plan_card = QFrame()
+        plan_card.setObjectName("planCard")
         
-        for folder_name, file_ids in sorted(folders.items()):
-            # Add expand arrow prefix - starts collapsed
-            folder_item = QTreeWidgetItem([f"▶  📁 {folder_name}  ({len(file_ids)} files)"])
-            folder_item.setExpanded(False)  # Start collapsed
-            folder_item.setData(0, Qt.UserRole, {"type": "folder", "name": folder_name})
-            
-            display_limit = 25
-            for i, fid in enumerate(file_ids[:display_limit]):
-                try:
-                    fid_int = int(fid)
-                    file_info = self.files_by_id.get(fid_int, {})
-                    fname = file_info.get("file_name", f"id:{fid}")
-                    file_item = QTreeWidgetItem([fname])  # No icon, just filename
-                    file_item.setData(0, Qt.UserRole, {"type": "file", "id": fid_int})
-                    folder_item.addChild(file_item)
-                except:
-                    pass
-            
-            if len(file_ids) > display_limit:
-                more_item = QTreeWidgetItem([f"+ {len(file_ids) - display_limit} more files..."])
-                more_item.setDisabled(True)
-                folder_item.addChild(more_item)
-            
-            self.plan_tree.addTopLevelItem(folder_item)
+        plan_layout = QVBoxLayout(plan_card)
+        plan_layout.setContentsMargins(20, 20, 20, 20)
+        plan_layout.setSpacing(12)
         
-        summary = get_plan_summary(plan, self.files_by_id)
+        # Simple title matching input card style
+        plan_title = QLabel("📁 Proposed Organization")
+        plan_title.setObjectName("planTitle")
+        plan_layout.addWidget(plan_title)
         
-        details = f"""Organization Plan Summary
-{'='*50}
-
-Destination: {self.destination_path}
-Total folders: {summary["total_folders"]}
-Total files to move: {summary["total_files"]}
-Total size: {summary["total_size_mb"]} MB
-
-Folders:
-{'-'*50}
-"""
-        for folder in summary["folders"]:
-            details += f"{folder['name']}: {folder['file_count']} files ({folder['size_mb']} MB)\n"
+        self.plan_tree = QTreeView()
+        self.plan_tree.setHeaderHidden(True)
+        self.plan_tree.setIndentation(20)
+        self.plan_tree.setAlternatingRowColors(False)
+        self.plan_tree.setUniformRowHeights(True)  # All rows are 38px; skip per-row height queries
+        self.plan_tree.setObjectName("planTree")
+        self.plan_tree.setRootIsDecorated(False)  # Remove native expand buttons
+        self.plan_tree.clicked.connect(self._on_tree_item_clicked)
+        self.plan_tree.expanded.connect(self._on_folder_expanded)
+        self.plan_tree.collapsed.connect(self._on_folder_collapsed)
+        self.plan_tree.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.plan_tree.customContextMenuRequested.connect(self._show_tree_context_menu)
+        plan_layout.addWidget(self.plan_tree)
+        
+        self.results_splitter.addWidget(plan_card)
+        
+        self.results_splitter.setVisible(False)  # Shown by _on_plan_received
+        
+        # Sits right below the existing-folders note in the Organize Now page
+        layout = self._organize_now_layout
+        layout.insertWidget(layout.indexOf(self.existing_folders_note) + 1, self.results_splitter, 1)
+    
+    def _ensure_feedback_ui(self):
+        """Build the "Refine Plan" section the first time a plan needs it."""
+        if self.feedback_group is not None:
+            return
+        
+        self.feedback_group = QGroupBox("Refine Plan")
+        self.feedback_group.setVisible(False)
+        feedback_layout = QHBoxLayout(self.feedback_group)
+        
+        self.feedback_input = QLineEdit()
+        self.feedback_input.setPlaceholderText(
+            "e.g., 'Move the JSON files to a separate folder' or 'Don't include the screenshots'"
+        )
+        self.feedback_input.setMinimumHeight(36)
+        self.feedback_input.returnPressed.connect(self.refine_plan)
+        feedback_layout.addWidget(self.feedback_input, 1)
+        
+        self.refine_button = QPushButton("🔄 Refine")
+        self.refine_button.setMinimumHeight(42)
+        self.refine_button.setMinimumWidth(110)
+        self.refine_button.setCursor(Qt.PointingHandCursor)
+        self.refine_button.setObjectName("refineButton")
+        self.refine_button.clicked.connect(self.refine_plan)
+        feedback_layout.addWidget(self.refine_button)
+        
+        # Same instruction asked again, bypassing the saved plan for it
+        self.regenerate_button = QPushButton("🎲 Regenerate")
+        self.regenerate_button.setMinimumHeight(42)
+        self.regenerate_button.setMinimumWidth(130)
+        self.regenerate_button.setCursor(Qt.PointingHandCursor)
+        self.regenerate_button.setObjectName("regenerateButton")
+        self.regenerate_button.setToolTip("Ask the AI for a new plan instead of the saved one")
+        self.regenerate_button.clicked.connect(self.regenerate_plan)
+        feedback_layout.addWidget(self.regenerate_button)
+        
+        # Goes below the results area (or the existing-folders note if that isn't built)
+        layout = self._organize_now_layout
+        anchor = self.results_splitter if self.results_splitter is not None else self.existing_folders_note
+        layout.insertWidget(layout.indexOf(anchor) + 1, self.feedback_group)
+    
+    def _populate_tree(self, folders: Dict[str, List[Any]]):
+        """Show folders in the plan tree.
+        
+        A refined plan over the same files is applied to the current model as a
+        diff, keeping expanded folders and selection. Anything else swaps in a
+        fresh lazy model with updates suspended, so the view lays out once.
+        """
+        tree = self.plan_tree
+        if tree is None:
+            if not folders:
+                return  # Nothing built yet, so nothing to clear
+            self._ensure_results_ui()
+            tree = self.plan_tree
+        old_model = tree.model()
+        refine = (folders and isinstance(old_model, PlanTreeModel) and old_model.rowCount()
+                  and old_model.files_by_id is self.files_by_id)
+        # One repaint for the whole swap or diff, not one per row change
+        tree.setUpdatesEnabled(False)
+        try:
+            if refine:
+                old_model.update_folders(folders)
+                return
+            tree.setModel(PlanTreeModel(folders, self.files_by_id, tree))
+        finally:
+            tree.setUpdatesEnabled(True)
+        if old_model is not None:
+            old_model.deleteLater()
+    
+    def _display_plan(self, plan: Dict[str, Any]):
+        """Show the organization plan in the tree view."""
+        self._populate_tree(plan.get("folders", {}))
         
         # Details panel removed - summary shown in plan_summary_label
     
@@ -7205,31 +7857,23 @@ Folders:
         else:
             return '📄'
     
-    def _on_folder_expanded(self, item: QTreeWidgetItem):
+    def _on_folder_expanded(self, index: QModelIndex):
         """Update folder arrow when expanded."""
-        data = item.data(0, Qt.UserRole)
-        if data and data.get("type") == "folder":
-            text = item.text(0)
-            if text.startswith("▶"):
-                item.setText(0, "▼" + text[1:])
+        self.plan_tree.model().set_expanded(index, True)
     
-    def _on_folder_collapsed(self, item: QTreeWidgetItem):
+    def _on_folder_collapsed(self, index: QModelIndex):
         """Update folder arrow when collapsed."""
-        data = item.data(0, Qt.UserRole)
-        if data and data.get("type") == "folder":
-            text = item.text(0)
-            if text.startswith("▼"):
-                item.setText(0, "▶" + text[1:])
+        self.plan_tree.model().set_expanded(index, False)
     
-    def _on_tree_item_clicked(self, item: QTreeWidgetItem, column: int):
+    def _on_tree_item_clicked(self, index: QModelIndex):
         """Handle tree item click - toggle expand/collapse for folders."""
-        data = item.data(0, Qt.UserRole)
+        data = index.data(Qt.UserRole)
         if not data:
             return
         
         # Toggle expand/collapse for folders
         if data.get("type") == "folder":
-            item.setExpanded(not item.isExpanded())
+            self.plan_tree.setExpanded(index, not self.plan_tree.isExpanded(index))
             return
         
         if data.get("type") == "file":
@@ -7254,34 +7898,16 @@ Caption: {file_info.get('caption', 'none')}
         from PySide6.QtWidgets import QMenu
         from PySide6.QtGui import QAction
         
-        item = self.plan_tree.itemAt(position)
-        if not item:
+        index = self.plan_tree.indexAt(position)
+        if not index.isValid():
             return
         
-        data = item.data(0, Qt.UserRole)
+        data = index.data(Qt.UserRole)
         if not data:
             return
         
         menu = QMenu(self)
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: #111119;
-                border: 1px solid #1C1C28;
-                border-radius: 8px;
-                padding: 6px 4px;
-            }
-            QMenu::item {
-                padding: 8px 20px;
-                border-radius: 6px;
-                font-family: "Segoe UI", sans-serif;
-                font-size: 13px;
-                color: #E8E8F0;
-            }
-            QMenu::item:selected {
-                background-color: rgba(124, 77, 255, 0.10);
-                color: #B39DFF;
-            }
-        """)
+        menu.setStyleSheet(_QSS_PLAN_TREE_MENU)
         
         if data.get("type") == "file":
             fid = data.get("id")
@@ -7309,11 +7935,11 @@ Caption: {file_info.get('caption', 'none')}
                 
                 if is_pinned:
                     unpin_action = QAction(f"📌 Unpin folder '{folder_name}'", self)
-                    unpin_action.triggered.connect(lambda: self._unpin_folder_from_tree(folder_path, item))
+                    unpin_action.triggered.connect(lambda: self._unpin_folder_from_tree(folder_path, index))
                     menu.addAction(unpin_action)
                 else:
                     pin_action = QAction(f"📌 Pin folder '{folder_name}' (never organize contents)", self)
-                    pin_action.triggered.connect(lambda: self._pin_folder_from_tree(folder_path, item))
+                    pin_action.triggered.connect(lambda: self._pin_folder_from_tree(folder_path, index))
                     menu.addAction(pin_action)
         
         if menu.actions():
@@ -7346,7 +7972,7 @@ Caption: {file_info.get('caption', 'none')}
         logger.info(f"Unpinned file: {file_path}")
         self.status_label.setText(f"Unpinned '{Path(file_path).name}'")
     
-    def _pin_folder_from_tree(self, folder_path: str, item: QTreeWidgetItem):
+    def _pin_folder_from_tree(self, folder_path: str, index: QModelIndex):
         """Pin a folder from the tree view."""
         if settings.add_pinned_path(folder_path):
             # Remove all files in this folder from current moves
@@ -7364,7 +7990,7 @@ Caption: {file_info.get('caption', 'none')}
             logger.info(f"Pinned folder: {folder_path}")
             self.status_label.setText(f"📌 Pinned folder '{folder_name}' - removed from plan")
     
-    def _unpin_folder_from_tree(self, folder_path: str, item: QTreeWidgetItem):
+    def _unpin_folder_from_tree(self, folder_path: str, index: QModelIndex):
         """Unpin a folder from the tree view."""
         settings.remove_pinned_path(folder_path)
         folder_name = Path(folder_path).name
@@ -7402,10 +8028,13 @@ Caption: {file_info.get('caption', 'none')}
             yes_text="Move Files",
             no_text="Cancel"
         )
-        
-        if not dialog.exec():
-            return
-        
+        # Non-blocking: the moves start from the accepted signal instead of a nested exec() loop
+        dialog.accepted.connect(self._start_apply)
+        dialog.finished.connect(dialog.deleteLater)
+        dialog.open()
+    
+    def _start_apply(self):
+        """Filter the confirmed moves and hand them to the apply worker."""
         # Final safety check: filter out any excluded files before moving
         filtered_moves = []
         excluded_count = 0
@@ -7436,37 +8065,61 @@ Caption: {file_info.get('caption', 'none')}
                 "file_name": m["file_name"],
                 "size": m["size"],
                 "category": m["destination_folder"],
+                "file_id": m["file_id"],
             })
         
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, len(move_plan))
+        # The plan must not change under the worker: undo records and index
+        # updates are built from its move_plan when it finishes
         self.apply_button.setEnabled(False)
         self.generate_button.setEnabled(False)
+        self.clear_button.setEnabled(False)
+        self.undo_button.setEnabled(False)
+        if self.feedback_group is not None:
+            self.refine_button.setEnabled(False)
+            self.regenerate_button.setEnabled(False)
         self.status_label.setText("Moving files...")
         
-        success, errors, log_file, renamed_count = apply_moves(move_plan)
+        self._apply_worker = ApplyMovesWorker(move_plan)
+        self._apply_worker.progress.connect(self.progress_bar.setValue)
+        self._apply_worker.finished.connect(self._on_apply_done)
+        self._apply_worker.start()
+    
+    def _on_apply_done(self, success: bool, errors: list, log_file: str, renamed_count: int):
+        """Update the index and report results once the file moves finish."""
+        move_plan = self._apply_worker.move_plan
+        self._apply_worker.wait()
+        self._apply_worker = None
         
         self.progress_bar.setVisible(False)
         self.generate_button.setEnabled(True)
+        self.clear_button.setEnabled(True)
+        if self.feedback_group is not None:
+            self.refine_button.setEnabled(True)
+            self.regenerate_button.setEnabled(True)
         
         if success:
-            # Save undo information BEFORE updating database paths
-            self.last_organization = []
-            for m in self.current_moves:
-                self.last_organization.append({
+            # Save undo information and collect the path updates in one pass
+            # (destination_path reflects any rename apply_moves made)
+            last_organization = []
+            path_updates = []
+            for m in move_plan:
+                file_id = m["file_id"]
+                destination = m["destination_path"]
+                last_organization.append({
                     "source": m["source_path"],
-                    "destination": m["destination_path"],
-                    "file_id": m["file_id"],
+                    "destination": destination,
+                    "file_id": file_id,
                 })
+                path_updates.append((file_id, destination))
+            self.last_organization = last_organization
             self.undo_button.setEnabled(True)
-            logger.info(f"Saved {len(self.last_organization)} moves for potential undo")
+            logger.info(f"Saved {len(last_organization)} moves for potential undo")
             
-            paths_updated = 0
-            for m in self.current_moves:
-                if file_index.update_file_path(m["file_id"], m["destination_path"]):
-                    paths_updated += 1
+            paths_updated = self._update_moved_paths(path_updates)
             
-            logger.info(f"Updated {paths_updated}/{len(self.current_moves)} file paths in database")
+            logger.info(f"Updated {paths_updated}/{len(move_plan)} file paths in database")
             
             # Scan entire destination folder for empty folders (not just source folders)
             empty_folders = self._scan_all_empty_folders()
@@ -7500,12 +8153,10 @@ Caption: {file_info.get('caption', 'none')}
             self.clear_plan()
             self._update_file_count()
         else:
-            paths_updated = 0
-            for m in self.current_moves:
-                dest_path = Path(m["destination_path"])
-                if dest_path.exists():
-                    if file_index.update_file_path(m["file_id"], m["destination_path"]):
-                        paths_updated += 1
+            paths_updated = self._update_moved_paths([
+                (m["file_id"], m["destination_path"])
+                for m in move_plan if os.path.exists(m["destination_path"])
+            ])
             
             logger.info(f"Partial success: Updated {paths_updated} file paths in database")
             
@@ -7523,16 +8174,26 @@ Caption: {file_info.get('caption', 'none')}
             )
             self.status_label.setText(f"Completed with {len(errors)} errors")
             self.apply_button.setEnabled(True)
+            self.undo_button.setEnabled(bool(self.last_organization))
 
+    def _update_moved_paths(self, path_updates: list) -> int:
+        """Record (file_id, new_path) pairs in one transaction. Returns the count updated."""
+        updated_ids = file_index.update_file_paths_bulk(path_updates)
+        if updated_ids is not None:
+            return sum(1 for file_id, _ in path_updates if file_id in updated_ids)
+        # Batch failed - fall back to per-file updates
+        return sum(1 for file_id, path in path_updates if file_index.update_file_path(file_id, path))
+    
     def clear_plan(self):
         """Clear the current plan and reset UI."""
         self.current_plan = None
         self.current_moves = []
         self.original_instruction = None
-        self.plan_tree.clear()
+        self._populate_tree({})
         self.apply_button.setEnabled(False)
-        self.feedback_group.setVisible(False)
-        self.feedback_input.clear()
+        if self.feedback_group is not None:
+            self.feedback_group.setVisible(False)
+            self.feedback_input.clear()
         
         # Hide plan UI elements
         self.apply_button.setVisible(False)
@@ -7547,6 +8208,8 @@ Caption: {file_info.get('caption', 'none')}
     
     def refine_plan(self):
         """Refine the current plan based on user feedback."""
+        if self._apply_worker is not None:
+            return  # Moves in progress; the plan is locked until they finish
         feedback = self.feedback_input.text().strip()
         if not feedback:
             return
@@ -7561,16 +8224,27 @@ Caption: {file_info.get('caption', 'none')}
         # Build refinement prompt
         from app.core.ai_organizer import request_plan_refinement
         
-        files = self._load_files_from_db()
+        # Same verified files the plan was generated from; no DB reload on the UI thread,
+        # and keeping files_by_id lets _populate_tree apply the refined plan as a diff
+        files = list(self.files_by_id.values())
         if not files:
             return
         
+        # Same feedback on the same plan answered before: apply it inline
+        cached_plan = request_plan_refinement(
+            self.original_instruction, self.current_plan, feedback, files, cached_only=True
+        )
+        if cached_plan is not None:
+            self._on_plan_received(cached_plan)
+            return
+        
         # Show progress
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)
         self.generate_button.setEnabled(False)
         self.apply_button.setEnabled(False)
         self.refine_button.setEnabled(False)
+        self.regenerate_button.setEnabled(False)
         self.status_label.setText(f"Refining plan based on feedback...")
         
         # Run refinement in background
@@ -7582,8 +8256,35 @@ Caption: {file_info.get('caption', 'none')}
         )
         self.plan_worker.finished.connect(self._on_plan_received)
         self.plan_worker.error.connect(self._on_plan_error)
-        self.plan_worker.finished.connect(lambda _: self.refine_button.setEnabled(True))
-        self.plan_worker.error.connect(lambda _: self.refine_button.setEnabled(True))
+        for signal in (self.plan_worker.finished, self.plan_worker.error):
+            signal.connect(lambda _: self.refine_button.setEnabled(True))
+            signal.connect(lambda _: self.regenerate_button.setEnabled(True))
+        self.plan_worker.start()
+    
+    def regenerate_plan(self):
+        """Ask for a new plan for the current instruction, ignoring the saved one."""
+        if self._apply_worker is not None or not self.current_plan or not self.original_instruction:
+            return
+        if self.plan_worker is not None and self.plan_worker.isRunning():
+            return  # A plan or refinement is already on its way
+        files = list(self.files_by_id.values())
+        if not files:
+            return
+        
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)
+        self.generate_button.setEnabled(False)
+        self.apply_button.setEnabled(False)
+        self.refine_button.setEnabled(False)
+        self.regenerate_button.setEnabled(False)
+        self.status_label.setText(f"Asking AI for a new plan for {len(files)} files...")
+        
+        self.plan_worker = PlanWorker(self.original_instruction, files, use_cache=False)
+        self.plan_worker.finished.connect(self._on_plan_received)
+        self.plan_worker.error.connect(self._on_plan_error)
+        for signal in (self.plan_worker.finished, self.plan_worker.error):
+            signal.connect(lambda _: self.refine_button.setEnabled(True))
+            signal.connect(lambda _: self.regenerate_button.setEnabled(True))
         self.plan_worker.start()
     
     def _show_history_dialog(self):
@@ -7608,14 +8309,16 @@ Caption: {file_info.get('caption', 'none')}
         can_undo = []
         cannot_undo = []
         
+        # Records hold plain path strings; os.path avoids building Path objects per move
+        exists = os.path.exists
         for move in self.last_organization:
-            dest_path = Path(move["destination"])
-            source_path = Path(move["source"])
+            destination = move["destination"]
+            source = move["source"]
             
-            if not dest_path.exists():
-                cannot_undo.append(f"File not found: {dest_path.name}")
-            elif source_path.exists():
-                cannot_undo.append(f"Original location occupied: {source_path.name}")
+            if not exists(destination):
+                cannot_undo.append(f"File not found: {os.path.basename(destination)}")
+            elif exists(source):
+                cannot_undo.append(f"Original location occupied: {os.path.basename(source)}")
             else:
                 can_undo.append(move)
         
@@ -7643,38 +8346,31 @@ Caption: {file_info.get('caption', 'none')}
         if reply != QMessageBox.Yes:
             return
         
-        import shutil
-        success_count = 0
-        errors = []
-        
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, len(can_undo))
+        self.progress_bar.setValue(0)
+        self.undo_button.setEnabled(False)
+        self.apply_button.setEnabled(False)
+        self.generate_button.setEnabled(False)
         self.status_label.setText("Undoing organization...")
         
-        for i, move in enumerate(can_undo):
-            self.progress_bar.setValue(i + 1)
-            try:
-                dest_path = Path(move["destination"])
-                source_path = Path(move["source"])
-                
-                source_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                shutil.move(str(dest_path), str(source_path))
-                
-                file_index.update_file_path(move["file_id"], str(source_path))
-                
-                success_count += 1
-                logger.info(f"Undo: {dest_path} -> {source_path}")
-            except Exception as e:
-                errors.append(f"{dest_path.name}: {e}")
-                logger.error(f"Undo failed for {move['destination']}: {e}")
+        self._undo_worker = UndoMovesWorker(can_undo)
+        self._undo_worker.progress.connect(self.progress_bar.setValue)
+        self._undo_worker.finished.connect(self._on_undo_done)
+        self._undo_worker.start()
+    
+    def _on_undo_done(self, success_count: int, errors: list):
+        """Clean up and report once the undo moves finish."""
+        self._undo_worker.wait()
+        self._undo_worker = None
         
         self.progress_bar.setVisible(False)
+        self.generate_button.setEnabled(True)
+        self.apply_button.setEnabled(bool(self.current_moves))
         
         self._cleanup_empty_folders()
         
         self.last_organization = None
-        self.undo_button.setEnabled(False)
         
         if errors:
             QMessageBox.warning(
@@ -7714,6 +8410,9 @@ Caption: {file_info.get('caption', 'none')}
         
         logger.info(f"Checking {len(source_folders)} source folders for emptiness")
         
+        # Resolve the destination once; parents are resolved at most once each below
+        dest_resolved = self.destination_path.resolve() if self.destination_path else None
+        
         # Sort by depth (deepest first) to handle nested empty folders
         sorted_folders = sorted(source_folders, key=lambda p: len(p.parts), reverse=True)
         
@@ -7724,46 +8423,52 @@ Caption: {file_info.get('caption', 'none')}
             min_depths[folder] = max(1, len(folder.parts) - 3)
         
         def check_folder_and_parents(folder: Path, min_depth: int):
-            """Recursively check folder and its parents if empty."""
-            if folder in already_checked:
-                return
-            already_checked.add(folder)
-            
-            # Safety: never include destination path
-            if self.destination_path and folder.resolve() == self.destination_path.resolve():
-                logger.debug(f"Skipping destination folder: {folder}")
-                return
-            
-            # Safety: don't go above min depth (prevents deleting too far up the tree)
-            if len(folder.parts) < min_depth:
-                logger.debug(f"Reached min depth, stopping at: {folder}")
-                return
-            
-            # Safety: don't delete drive roots or very short paths
-            if len(folder.parts) <= 2:
-                logger.debug(f"Too close to root, skipping: {folder}")
-                return
-            
-            # Safety: must exist and be a directory
-            if not folder.exists() or not folder.is_dir():
-                logger.debug(f"Folder doesn't exist or not a dir: {folder}")
-                return
-            
-            try:
-                # Check if completely empty (no files, no subdirs)
-                contents = list(folder.iterdir())
-                if not contents:
-                    empty_folders.append(str(folder))
-                    logger.info(f"Found empty source folder: {folder}")
-                    
-                    # Recursively check parent
-                    check_folder_and_parents(folder.parent, min_depth)
-                else:
-                    logger.debug(f"Folder not empty ({len(contents)} items): {folder}")
-            except OSError as e:
-                logger.debug(f"Could not check folder {folder}: {e}")
-            except Exception as e:
-                logger.warning(f"Error checking folder {folder}: {e}")
+            """Check folder, then walk up its parents while each one is empty."""
+            while folder not in already_checked:
+                already_checked.add(folder)
+                
+                # Safety: never include destination path
+                if dest_resolved is not None and (folder == dest_resolved or folder.resolve() == dest_resolved):
+                    logger.debug(f"Skipping destination folder: {folder}")
+                    return
+                
+                depth = len(folder.parts)
+                
+                # Safety: don't go above min depth (prevents deleting too far up the tree)
+                if depth < min_depth:
+                    logger.debug(f"Reached min depth, stopping at: {folder}")
+                    return
+                
+                # Safety: don't delete drive roots or very short paths
+                if depth <= 2:
+                    logger.debug(f"Too close to root, skipping: {folder}")
+                    return
+                
+                # Safety: must exist and be a directory (is_dir is False for missing paths)
+                if not folder.is_dir():
+                    logger.debug(f"Folder doesn't exist or not a dir: {folder}")
+                    return
+                
+                try:
+                    # Check if completely empty (no files, no subdirs); stop at the first entry
+                    with os.scandir(folder) as it:
+                        has_content = next(it, None) is not None
+                except OSError as e:
+                    logger.debug(f"Could not check folder {folder}: {e}")
+                    return
+                except Exception as e:
+                    logger.warning(f"Error checking folder {folder}: {e}")
+                    return
+                
+                if has_content:
+                    logger.debug(f"Folder not empty: {folder}")
+                    return
+                
+                empty_folders.append(str(folder))
+                logger.info(f"Found empty source folder: {folder}")
+                
+                # Continue with the parent
+                folder = folder.parent
         
         for folder in sorted_folders:
             min_depth = min_depths.get(folder, 1)
@@ -7789,29 +8494,15 @@ Caption: {file_info.get('caption', 'none')}
         logger.info(f"Scanning entire destination for empty folders: {self.destination_path}")
         
         try:
-            # Walk bottom-up (topdown=False) to find empty folders
-            for dirpath, dirnames, filenames in os.walk(str(self.destination_path), topdown=False):
-                folder = Path(dirpath)
-                
-                # Skip the destination path itself
-                if folder.resolve() == self.destination_path.resolve():
-                    continue
-                
+            # One scandir pass; each DirEntry already knows whether it is a directory
+            found = []
+            _collect_empty_dirs(str(self.destination_path), found)
+            for folder in found:
                 # Safety: don't check paths too close to root
-                if len(folder.parts) <= 2:
+                if len(Path(folder).parts) <= 2:
                     continue
-                
-                try:
-                    # Check if folder is completely empty
-                    contents = list(folder.iterdir())
-                    if not contents:
-                        empty_folders.append(str(folder))
-                        logger.info(f"Found empty folder: {folder}")
-                except OSError as e:
-                    logger.debug(f"Could not check folder {folder}: {e}")
-                except Exception as e:
-                    logger.warning(f"Error checking folder {folder}: {e}")
-        
+                empty_folders.append(folder)
+                logger.info(f"Found empty folder: {folder}")
         except Exception as e:
             logger.error(f"Error scanning destination folder: {e}")
         
@@ -7851,17 +8542,16 @@ Caption: {file_info.get('caption', 'none')}
         
         for folder_path in sorted_paths:
             try:
-                folder = Path(folder_path)
-                if folder.exists() and folder.is_dir():
-                    # Double-check it's still empty
-                    contents = list(folder.iterdir())
-                    if not contents:
-                        folder.rmdir()
-                        deleted_count += 1
-                        logger.info(f"Deleted empty folder: {folder}")
-                    else:
-                        logger.warning(f"Folder no longer empty, skipping: {folder}")
+                # rmdir itself refuses non-empty folders, so no separate exists/listing probe
+                os.rmdir(folder_path)
+                deleted_count += 1
+                logger.info(f"Deleted empty folder: {folder_path}")
+            except (FileNotFoundError, NotADirectoryError):
+                continue
             except OSError as e:
+                if e.errno in (errno.ENOTEMPTY, errno.EEXIST):
+                    logger.warning(f"Folder no longer empty, skipping: {folder_path}")
+                    continue
                 logger.warning(f"Could not delete folder {folder_path}: {e}")
             except Exception as e:
                 logger.error(f"Error deleting folder {folder_path}: {e}")
@@ -114,6 +114,9 @@ class ThemeManager(QObject):
         else:
             # Running from source
             self._ui_dir = Path(__file__).parent
+        
+        # Combined QSS per theme, read from disk once per process
+        self._stylesheet_cache = {}
     
     @property
     def current_theme(self) -> str:
@@ -140,15 +143,33 @@ class ThemeManager(QObject):
         if not app:
             return
         
-        # Load appropriate stylesheet
+        # Apply matching palette
         if theme == 'dark':
-            style_path = self._ui_dir / 'styles.qss'
             self._apply_dark_palette(app)
         else:
-            style_path = self._ui_dir / 'styles_light.qss'
             self._apply_light_palette(app)
         
-        # Load and apply stylesheet
+        app.setStyleSheet(self._load_stylesheet(theme))
+        
+        # Apply dark/light title bar on Windows
+        self._apply_windows_titlebar(theme)
+        
+        # Save setting
+        if settings.theme != theme:
+            settings.set_theme(theme)
+        
+        # Emit signal for any listeners
+        self.theme_changed.emit(theme)
+    
+    def _load_stylesheet(self, theme: str) -> str:
+        """Return the full application stylesheet for a theme, cached after the first read."""
+        cached = self._stylesheet_cache.get(theme)
+        if cached is not None:
+            return cached
+        
+        style_path = self._ui_dir / ('styles.qss' if theme == 'dark' else 'styles_light.qss')
+        
+        # Load stylesheet
         if style_path.exists():
             with open(style_path, 'r', encoding='utf-8') as f:
                 base_style = f.read()
@@ -179,18 +200,9 @@ class ThemeManager(QObject):
                 }
             """
         
-        # Combine and apply
-        app.setStyleSheet(base_style + tooltip_style)
-        
-        # Apply dark/light title bar on Windows
-        self._apply_windows_titlebar(theme)
-        
-        # Save setting
-        if settings.theme != theme:
-            settings.set_theme(theme)
-        
-        # Emit signal for any listeners
-        self.theme_changed.emit(theme)
+        stylesheet = base_style + tooltip_style
+        self._stylesheet_cache[theme] = stylesheet
+        return stylesheet
     
     def _apply_windows_titlebar(self, theme: str):
         """Set Windows title bar to dark or light using DwmSetWindowAttribute.
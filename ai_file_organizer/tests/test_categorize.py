@@ -151,6 +151,23 @@ class TestCategorization:
                 print(f"✅ Hidden file categorized: {metadata.get('category')}")
         finally:
             temp_path.unlink(missing_ok=True)
+    
+    def test_scan_directory_order_and_skips(self):
+        """Test that parallel scanning keeps walk order and skips hidden files."""
+        from app.core.scan import scan_directory
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for i in range(20):
+                (root / f"file_{i:02d}.txt").write_text("x" * i)
+            (root / ".hidden.txt").write_text("secret")
+            
+            files = scan_directory(root)
+            expected = [str(p) for p in root.rglob('*') if not p.name.startswith('.')]
+            
+            assert [f['source_path'] for f in files] == expected
+            assert len(scan_directory(root, max_files=5)) == 5
+            print(f"✅ Scanned {len(files)} files in walk order")
 
 
 if __name__ == "__main__":
@@ -210,6 +210,43 @@ class TestFileIndex:
         count = temp_db.get_file_count()
         assert count == 7
         print(f"✅ File count correct: {count}")
+    
+    def test_update_file_paths_bulk(self, temp_db):
+        """Test moving several files in one batch."""
+        for i in range(3):
+            temp_db.add_file(file_data={
+                'source_path': f'C:/test/old_{i}.txt',
+                'name': f'old_{i}.txt',
+                'extension': '.txt',
+                'size': 100,
+            })
+        ids = [temp_db.get_file_by_path(f'C:/test/old_{i}.txt')['id'] for i in range(3)]
+        
+        updated = temp_db.update_file_paths_bulk([
+            (ids[0], 'C:/moved/old_0.txt'),
+            (ids[1], 'C:/moved/old_1.txt'),
+            (999999, 'C:/moved/missing.txt'),
+        ])
+        
+        assert updated == {ids[0], ids[1]}
+        assert temp_db.get_file_by_path('C:/moved/old_0.txt')['id'] == ids[0]
+        assert temp_db.get_file_by_path('C:/test/old_1.txt') is None
+        assert temp_db.get_file_by_path('C:/test/old_2.txt') is not None
+        assert temp_db.update_file_paths_bulk([]) == set()
+        print("✅ Bulk path update applied in one batch")
+    
+    def test_plan_cache(self, temp_db):
+        """Test caching organization plans by prompt key."""
+        plan = {"folders": {"Docs": [1, 2]}}
+        
+        assert temp_db.get_cached_plan("abc") is None
+        temp_db.store_cached_plan("abc", plan)
+        assert temp_db.get_cached_plan("abc") == plan
+        assert temp_db.get_cached_plan("abc", max_age_days=-1) is None  # Expired
+        
+        temp_db.clear_plan_cache()
+        assert temp_db.get_cached_plan("abc") is None
+        print("✅ Plan cache stores, expires and clears")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,94 @@
+"""
+Tests for Organize page helpers - temporary directories only, nothing is moved
+"""
+import os
+import pytest
+
+
+class TestPathVerifyWorker:
+    """Test the destination walk behind Generate Plan."""
+    
+    def _verify(self, files, dest, last_fingerprint=None, cached_names=None):
+        """Run the worker synchronously and return it with its finished() arguments."""
+        from app.ui.organize_page import PathVerifyWorker
+        
+        worker = PathVerifyWorker(files, dest, last_fingerprint=last_fingerprint, cached_names=cached_names)
+        results = []
+        worker.finished.connect(lambda *args: results.append(args))
+        worker.run()
+        return worker, results[0]
+    
+    def test_new_file_in_subfolder_invalidates_skip(self, tmp_path):
+        """Test that a file added below the top level forces the full walk."""
+        photos = tmp_path / "Photos"
+        photos.mkdir()
+        old = photos / "old.jpg"
+        old.write_bytes(b"old")
+        files = [{"id": 1, "file_name": "old.jpg", "file_path": str(old)}]
+        
+        worker, (_, _, _, unindexed) = self._verify(files, tmp_path)
+        assert unindexed == []
+        assert worker.fingerprint
+        
+        cached = {"photos"}
+        skipped, _ = self._verify(files, tmp_path, worker.fingerprint, cached)
+        assert skipped.top_level_names is cached
+        
+        top_mtime = os.stat(tmp_path).st_mtime_ns
+        photos_mtime = os.stat(photos).st_mtime_ns
+        new = photos / "new.jpg"
+        new.write_bytes(b"new")
+        # Coarse filesystem clocks may not tick between the two writes
+        os.utime(photos, ns=(photos_mtime + 10**9, photos_mtime + 10**9))
+        assert os.stat(tmp_path).st_mtime_ns == top_mtime
+        
+        rescanned, (_, _, _, unindexed) = self._verify(files, tmp_path, worker.fingerprint, cached)
+        assert rescanned.top_level_names is not cached
+        assert unindexed == [str(new)]
+        print("✅ New file in a subfolder invalidated the skip and was reported")
+    
+    def test_index_change_invalidates_skip(self, tmp_path):
+        """Test that a file dropped from the index is reported even if no folder changed."""
+        kept = tmp_path / "kept.txt"
+        dropped = tmp_path / "dropped.txt"
+        kept.write_text("kept")
+        dropped.write_text("dropped")
+        files = [
+            {"id": 1, "file_name": "kept.txt", "file_path": str(kept)},
+            {"id": 2, "file_name": "dropped.txt", "file_path": str(dropped)},
+        ]
+        
+        worker, (_, _, _, unindexed) = self._verify(files, tmp_path)
+        assert unindexed == []
+        
+        _, (_, _, _, unindexed) = self._verify(files[:1], tmp_path, worker.fingerprint, set())
+        assert unindexed == [str(dropped)]
+        print("✅ Index change invalidated the skip and the file was reported")
+
+
+class TestPlanTreeModel:
+    """Test the lazy "Proposed Organization" tree model."""
+    
+    def test_pinned_file_row_removed(self):
+        """Test that pinning a file (edits the plan's id list in place) drops its row."""
+        from app.ui.organize_page import PlanTreeModel
+        
+        plan = {"folders": {"Docs": [1, 2], "Photos": [3]}}
+        files_by_id = {1: {"file_name": "a.pdf"}, 2: {"file_name": "b.pdf"}, 3: {"file_name": "c.jpg"}}
+        model = PlanTreeModel(plan["folders"], files_by_id)
+        docs = model.index(0, 0)
+        assert model.rowCount(docs) == 2
+        
+        # What _pin_from_tree does to the plan before redisplaying it
+        plan["folders"]["Docs"].remove(2)
+        model.update_folders(plan["folders"])
+        
+        docs = model.index(0, 0)
+        assert model.rowCount(docs) == 1
+        assert model.data(model.index(0, 0, docs)) == "a.pdf"
+        assert "(1 files)" in model.data(docs)
+        print("✅ Pinned file's row removed from the tree")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
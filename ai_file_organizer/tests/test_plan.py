@@ -101,6 +101,53 @@ class TestPlanCreation:
         # Should include missing file
         assert len(result) >= len(all_files)
         print(f"✅ All files included: {len(result)} items")
+    
+    def test_ensure_all_files_included_with_known_ids(self):
+        """Test that precollected included IDs are trusted instead of rescanning."""
+        from app.core.ai_organizer import ensure_all_files_included
+        
+        plan = {"folders": {"docs": [1, 2]}}
+        
+        result = ensure_all_files_included(plan, {1, 2, 3}, included_ids={1, 2})
+        assert result["folders"]["misc"] == [3]
+        print("✅ Missing file added using precollected IDs")
+    
+    def test_cached_only_plan_lookup(self, tmp_path, monkeypatch):
+        """Test that cached_only answers from the plan cache and never calls the provider."""
+        from app.core import ai_organizer, database
+        from app.core.database import FileIndex
+        from app.core.settings import settings
+        
+        monkeypatch.setattr(database, "file_index", FileIndex(tmp_path / "plans.db"))
+        monkeypatch.setattr(settings, "ai_provider", "openai")
+        calls = []
+        plan = {"folders": {"docs": [1]}}
+        monkeypatch.setattr(ai_organizer, "_request_openai", lambda msg: calls.append(msg) or plan)
+        files = [{"id": 1, "file_name": "a.pdf"}]
+        
+        assert ai_organizer.request_organization_plan("docs", files, cached_only=True) is None
+        assert ai_organizer.request_organization_plan("docs", files) == plan
+        assert ai_organizer.request_organization_plan("docs", files, cached_only=True) == plan
+        assert len(calls) == 1
+        print("✅ Cached-only lookup served the stored plan without a request")
+    
+    def test_use_cache_false_requests_fresh_plan(self, tmp_path, monkeypatch):
+        """Test that use_cache=False skips the cached plan and stores the new one."""
+        from app.core import ai_organizer, database
+        from app.core.database import FileIndex
+        from app.core.settings import settings
+        
+        monkeypatch.setattr(database, "file_index", FileIndex(tmp_path / "plans.db"))
+        monkeypatch.setattr(settings, "ai_provider", "openai")
+        plans = iter([{"folders": {"docs": [1]}}, {"folders": {"papers": [1]}}])
+        monkeypatch.setattr(ai_organizer, "_request_openai", lambda msg: next(plans))
+        files = [{"id": 1, "file_name": "a.pdf"}]
+        
+        assert ai_organizer.request_organization_plan("docs", files) == {"folders": {"docs": [1]}}
+        fresh = ai_organizer.request_organization_plan("docs", files, use_cache=False)
+        assert fresh == {"folders": {"papers": [1]}}
+        assert ai_organizer.request_organization_plan("docs", files, cached_only=True) == fresh
+        print("✅ use_cache=False bypassed the cache and replaced the stored plan")
 
 
 class TestPlanValidation:
@@ -97,6 +97,36 @@ class TestSettings:
         assert isinstance(s.seen_tips, list)
         print("✅ Onboarding settings initialized")
     
+    def test_verified_destination_fingerprint(self, monkeypatch):
+        """Test recording and forgetting a destination's clean-check fingerprint."""
+        from app.core.settings import Settings
+        s = Settings()
+        saves = []
+        monkeypatch.setattr(s, '_save_config', lambda: saves.append(1))
+        s.verified_destinations = {}
+        
+        s.set_verified_destination_fingerprint("C:/test/dest", "abc123")
+        s.set_verified_destination_fingerprint("C:/test/dest", "abc123")  # unchanged - no save
+        assert s.get_verified_destination_fingerprint("C:/test/dest") == "abc123"
+        assert len(saves) == 1
+        
+        s.set_verified_destination_fingerprint("C:/test/dest", None)
+        assert s.get_verified_destination_fingerprint("C:/test/dest") is None
+        print("✅ Verified destination fingerprint recorded and cleared")
+    
+    def test_legacy_verified_mtimes_dropped(self, tmp_path, monkeypatch):
+        """Test that top-level-only mtimes from older configs aren't trusted."""
+        import json
+        from app.core.settings import Settings
+        s = Settings()
+        cfg = tmp_path / "settings.json"
+        cfg.write_text(json.dumps({"verified_destinations": {"C:/old": 123, "C:/new": "abc123"}}))
+        monkeypatch.setattr(s, '_config_file', lambda: cfg)
+        
+        s._load_config()
+        assert s.verified_destinations == {"C:/new": "abc123"}
+        print("✅ Legacy verified destination mtimes dropped on load")
+    
     def test_theme_values(self):
         """Test theme setting accepts valid values."""
         from app.core.settings import Settings
@@ -165,6 +165,18 @@ class TestStylesheets:
         if not found:
             print("⚠️ Light stylesheet not found in expected locations")
 
+    def test_stylesheet_cached_per_theme(self):
+        """Test that each theme's stylesheet is read once and reused."""
+        from app.ui.theme_manager import theme_manager
+
+        dark = theme_manager._load_stylesheet('dark')
+        light = theme_manager._load_stylesheet('light')
+
+        assert 'QToolTip' in dark and 'QToolTip' in light
+        assert dark != light
+        assert theme_manager._load_stylesheet('dark') is dark
+        print("✅ Stylesheets cached per theme")
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])